@@ -18,6 +18,13 @@ from .workspace_manager import WorkspaceManager, Workspace
 from .cn_global import GlobalCommandRouter
 from .daemon_manager import DaemonManager, DaemonMaster, WorkspaceWorker
 from .migration_manager import MigrationManager
+from .context_snapshot import ContextSnapshot, load_snapshot
+from .serialization import yaml_load, yaml_dump
+from .file_walker import IgnoreRules, walk_files
+from .template_cache import TemplateCache
+from .result_cache import ResultCache
+from .context_maps import ContextMaps, load_map
+from .content_store import ContentStore, DocumentContents, load_content_store
 
 __version__ = "2.0.0"
 
@@ -28,5 +35,18 @@ __all__ = [
     'DaemonManager',
     'DaemonMaster',
     'WorkspaceWorker',
-    'MigrationManager'
+    'MigrationManager',
+    'ContextSnapshot',
+    'load_snapshot',
+    'yaml_load',
+    'yaml_dump',
+    'IgnoreRules',
+    'walk_files',
+    'TemplateCache',
+    'ResultCache',
+    'ContextMaps',
+    'load_map',
+    'ContentStore',
+    'DocumentContents',
+    'load_content_store'
 ] 
\ No newline at end of file
@@ -29,12 +29,14 @@ from typing import List, Optional
 try:
     from .workspace_manager import WorkspaceManager, Workspace
     from .daemon_manager import DaemonManager
+    from .template_cache import TemplateCache
 except ImportError:
     # Fallback para execução direta
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from core.workspace_manager import WorkspaceManager, Workspace
     from core.daemon_manager import DaemonManager
+    from core.template_cache import TemplateCache
 
 
 class GlobalCommandRouter:
@@ -44,6 +46,7 @@ class GlobalCommandRouter:
         self.workspace_manager = WorkspaceManager()
         self.daemon_manager = DaemonManager()
         self.global_installation_path = self._detect_global_installation()
+        self.template_cache = TemplateCache(self._get_system_templates_path())
     
     def _detect_global_installation(self) -> Path:
         """Detecta onde está instalado o Context Navigator globalmente"""
@@ -521,8 +524,11 @@ class GlobalCommandRouter:
         template_path = self._get_template_path(workspace, doc_type)
 
         if template_path:
-            # Carregar template personalizado
-            template_content = template_path.read_text(encoding='utf-8')
+            # Carregar template (os da instalação vêm do cache global compartilhado com o scanner)
+            template_content = self.template_cache.read_text(template_path)
+            if template_content is None:
+                template_content = template_path.read_text(encoding='utf-8')
+            self.template_cache.save()
 
             # Substituir variáveis básicas
             template_content = template_content.replace("{name}", name)
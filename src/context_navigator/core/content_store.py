@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+
+# ===== CONTEXT NAVIGATOR CODE BRIDGE =====
+# @cn:component content-store
+# @cn:doc content-store.md
+# @cn:context-level c3_component
+# @cn:context-type core
+# @cn:parent-module global-core
+# @cn:purpose "Pacote de conteúdo dos documentos gravado pelo scanner e lido via mmap pelos analisadores"
+# @cn:memory-aid "Um read por arquivo por pipeline - o scanner empacota os corpos, os analisadores fatiam o mmap"
+# @cn:depends-on mmap, struct, serialization
+# @cn:provides content-store-writing, content-store-loading
+# @cn:component-type functional
+# @cn:responsibility data-loading
+# ============================================
+
+"""
+Context Navigator - Content Store
+COMPORTAMENTO: O scanner grava .cn_model/content.pack com o texto completo de
+cada documento lido, endereçado pelo sha1 do texto (blobs repetidos são
+gravados uma vez) e indexado pelo caminho do documento. Cada entrada guarda
+também o trecho do corpo (texto sem front matter) como o scanner o extraiu.
+Os analisadores abrem o pacote via mmap; uma entrada cujo tamanho/mtime não
+coincide mais com o arquivo é lida do disco.
+
+Layout (little-endian):
+    magic       8 bytes  b'CNPACK01'
+    blobs       texto utf-8 de cada hash distinto, em sequência
+    index       JSON utf-8 {"version", "documents": {caminho: [hash, offset, tamanho,
+                size, mtime_ns, início do corpo, tamanho do corpo]}}
+    trailer     u64 offset do index, u64 tamanho do index, magic
+
+O index fica no fim para que o scanner grave os blobs à medida que lê os
+documentos (modo streaming), sem manter corpos em memória.
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+import tempfile
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .serialization import YAMLError, yaml_load
+
+logger = logging.getLogger('content_store')
+
+CONTENT_STORE_FILENAME = 'content.pack'
+CONTENT_STORE_MAGIC = b'CNPACK01'
+CONTENT_STORE_VERSION = 2
+
+_TRAILER = struct.Struct('<QQ8s')
+
+
+class ContentStoreError(Exception):
+    """Pacote ausente, corrompido ou de versão incompatível"""
+
+
+def document_body(text: str) -> str:
+    """
+    Corpo do documento: texto sem o front matter, pela mesma regra do scanner
+
+    Args:
+        text: Texto completo do documento
+
+    Returns:
+        Corpo (o texto inteiro se não houver front matter válido)
+    """
+    if not text.startswith('---'):
+        return text
+    parts = text.split('---', 2)
+    if len(parts) < 3:
+        return text
+    try:
+        yaml_load(parts[1])
+    except YAMLError:
+        return text
+    return parts[2].strip()
+
+
+def _body_range(text: str, body: str) -> Tuple[int, int]:
+    """(início, tamanho) em bytes utf-8 do corpo dentro do texto"""
+    # O corpo é sufixo do texto a menos de espaços finais: a última ocorrência é a dele
+    start = text.rfind(body)
+    if start < 0:
+        return 0, len(text.encode('utf-8'))
+    return len(text[:start].encode('utf-8')), len(body.encode('utf-8'))
+
+
+class ContentStore:
+    """Leitor do pacote de conteúdo via mmap; texto decodificado sob demanda"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            try:
+                self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                # Arquivo vazio não pode ser mapeado
+                raise ContentStoreError(f"Pacote inválido: {self.path}") from e
+
+        try:
+            self._documents = self._read_index()
+        except (ValueError, struct.error) as e:
+            self._buf.close()
+            raise ContentStoreError(f"Pacote inválido: {self.path}") from e
+        self._blobs: Optional[Dict[str, List]] = None
+
+    def _read_index(self) -> Dict[str, List]:
+        buf = self._buf
+        if len(buf) < len(CONTENT_STORE_MAGIC) + _TRAILER.size or buf[:len(CONTENT_STORE_MAGIC)] != CONTENT_STORE_MAGIC:
+            raise ValueError("formato desconhecido")
+        index_offset, index_length, magic = _TRAILER.unpack_from(buf, len(buf) - _TRAILER.size)
+        if magic != CONTENT_STORE_MAGIC or index_offset + index_length > len(buf) - _TRAILER.size:
+            raise ValueError("trailer inválido")
+        index = json.loads(buf[index_offset:index_offset + index_length].decode('utf-8'))
+        if index.get('version') != CONTENT_STORE_VERSION:
+            raise ValueError("versão incompatível")
+        return index['documents']
+
+    def __contains__(self, doc_path: object) -> bool:
+        return doc_path in self._documents
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._documents)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def text(self, doc_path: str) -> str:
+        """
+        Texto do documento como o scanner o leu
+
+        Raises:
+            KeyError: Documento fora do pacote
+        """
+        entry = self._documents[doc_path]
+        return self._buf[entry[1]:entry[1] + entry[2]].decode('utf-8')
+
+    def body(self, doc_path: str) -> str:
+        """
+        Corpo do documento (sem front matter)
+
+        Raises:
+            KeyError: Documento fora do pacote
+        """
+        entry = self._documents[doc_path]
+        start = entry[1] + entry[5]
+        return self._buf[start:start + entry[6]].decode('utf-8')
+
+    def content_hash(self, doc_path: str) -> Optional[str]:
+        """sha1 do texto do documento (None se fora do pacote)"""
+        entry = self._documents.get(doc_path)
+        return entry[0] if entry is not None else None
+
+    def is_fresh(self, doc_path: str, file_path: Union[str, Path]) -> bool:
+        """Tamanho e mtime do arquivo coincidem com os do escaneamento"""
+        entry = self._documents.get(doc_path)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return entry[3] == stat.st_size and entry[4] == stat.st_mtime_ns
+
+    def blob(self, content_hash: str) -> Optional[Tuple[bytes, int, int]]:
+        """Bytes utf-8 do blob com o hash informado e o trecho do corpo (None se ausente)"""
+        if self._blobs is None:
+            self._blobs = {entry[0]: entry for entry in self._documents.values()}
+        entry = self._blobs.get(content_hash)
+        if entry is None:
+            return None
+        return self._buf[entry[1]:entry[1] + entry[2]], entry[5], entry[6]
+
+    def close(self) -> None:
+        """Libera o mmap"""
+        self._buf.close()
+
+
+def load_content_store(output_dir: Union[str, Path]) -> Optional[ContentStore]:
+    """
+    Abre o pacote de conteúdo de .cn_model/ se existir
+
+    Args:
+        output_dir: Diretório .cn_model do workspace
+
+    Returns:
+        ContentStore ou None (o chamador deve ler do disco)
+    """
+    try:
+        return ContentStore(Path(output_dir) / CONTENT_STORE_FILENAME)
+    except (OSError, ContentStoreError):
+        return None
+
+
+class ContentStoreWriter:
+    """Grava o pacote em um temporário, blob a blob, e o publica com rename atômico"""
+
+    def __init__(self, output_dir: Union[str, Path]):
+        """
+        Args:
+            output_dir: Diretório .cn_model do workspace
+        """
+        self.path = Path(output_dir) / CONTENT_STORE_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=f".{self.path.name}.",
+                                              suffix='.tmp')
+        self._file = os.fdopen(fd, 'wb')
+        self._file.write(CONTENT_STORE_MAGIC)
+        self._offset = len(CONTENT_STORE_MAGIC)
+        self._blobs: Dict[str, Tuple[int, int, int, int]] = {}
+        self._documents: Dict[str, List] = {}
+        self._previous: Optional[ContentStore] = None
+        self._previous_loaded = False
+
+    def _write_blob(self, content_hash: str, payload: bytes, body_start: int, body_length: int) -> None:
+        if content_hash not in self._blobs:
+            self._file.write(payload)
+            self._blobs[content_hash] = (self._offset, len(payload), body_start, body_length)
+            self._offset += len(payload)
+
+    def _index(self, doc_path: str, content_hash: str, size: int, mtime_ns: int) -> None:
+        offset, length, body_start, body_length = self._blobs[content_hash]
+        self._documents[doc_path] = [content_hash, offset, length, size, mtime_ns, body_start, body_length]
+
+    def add(self, doc_path: str, text: str, size: int, mtime_ns: int,
+            content_hash: Optional[str] = None, body: Optional[str] = None) -> None:
+        """
+        Grava o texto de um documento
+
+        Args:
+            doc_path: Caminho do documento (chave do document_summary)
+            text: Texto completo lido pelo scanner
+            size: Tamanho do arquivo no escaneamento
+            mtime_ns: mtime do arquivo no escaneamento
+            content_hash: sha1 do texto (calculado se ausente)
+            body: Corpo extraído pelo scanner (calculado se ausente)
+        """
+        payload = text.encode('utf-8')
+        if content_hash is None:
+            content_hash = hashlib.sha1(payload).hexdigest()
+        if content_hash not in self._blobs:
+            body_start, body_length = _body_range(text, document_body(text) if body is None else body)
+            self._write_blob(content_hash, payload, body_start, body_length)
+        self._index(doc_path, content_hash, size, mtime_ns)
+
+    def reuse(self, doc_path: str, content_hash: str, size: int, mtime_ns: int) -> bool:
+        """
+        Copia o blob do pacote anterior (documento inalterado, não relido)
+
+        Returns:
+            True se o hash estava no pacote atual ou no anterior
+        """
+        if content_hash not in self._blobs:
+            if not self._previous_loaded:
+                self._previous_loaded = True
+                self._previous = load_content_store(self.path.parent)
+            blob = self._previous.blob(content_hash) if self._previous is not None else None
+            if blob is None:
+                return False
+            self._write_blob(content_hash, *blob)
+        self._index(doc_path, content_hash, size, mtime_ns)
+        return True
+
+    def commit(self) -> Path:
+        """
+        Grava o index e substitui o pacote anterior
+
+        Returns:
+            Caminho do pacote
+        """
+        index = json.dumps({'version': CONTENT_STORE_VERSION, 'documents': self._documents},
+                           ensure_ascii=False).encode('utf-8')
+        self._file.write(index)
+        self._file.write(_TRAILER.pack(self._offset, len(index), CONTENT_STORE_MAGIC))
+        self._file.close()
+        if self._previous is not None:
+            self._previous.close()
+
+        # mkstemp cria com 0600: manter permissões do pacote atual ou do umask
+        try:
+            mode = self.path.stat().st_mode & 0o777
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        try:
+            os.chmod(self._tmp_path, mode)
+            os.replace(self._tmp_path, str(self.path))
+        except BaseException:
+            self.abort()
+            raise
+        return self.path
+
+    def abort(self) -> None:
+        """Descarta o temporário (o pacote anterior continua válido)"""
+        if not self._file.closed:
+            self._file.close()
+        if self._previous is not None:
+            self._previous.close()
+        try:
+            os.unlink(self._tmp_path)
+        except OSError:
+            pass
+
+
+class DocumentContents:
+    """Texto dos documentos para os analisadores: pacote do scanner, com o disco como reserva"""
+
+    def __init__(self, output_dir: Union[str, Path], base_path: Union[str, Path]):
+        """
+        Args:
+            output_dir: Diretório .cn_model do workspace
+            base_path: Raiz do workspace (os caminhos do índice são relativos a ela)
+        """
+        self.output_dir = Path(output_dir)
+        self.base_path = Path(base_path)
+        self.pack_reads = 0
+        self.disk_reads = 0
+        self._store: Optional[ContentStore] = None
+        self._store_loaded = False
+        self._fresh: Dict[str, bool] = {}
+        self._last_disk_read: Optional[Tuple[str, Optional[str], Optional[str]]] = None
+        self._last_body: Optional[Tuple[str, str]] = None
+
+    @property
+    def store(self) -> Optional[ContentStore]:
+        """Pacote do scanner (aberto no primeiro acesso; None se ausente)"""
+        if not self._store_loaded:
+            self._store_loaded = True
+            self._store = load_content_store(self.output_dir)
+        return self._store
+
+    def _in_store(self, doc_path: str) -> bool:
+        fresh = self._fresh.get(doc_path)
+        if fresh is None:
+            store = self.store
+            fresh = self._fresh[doc_path] = (store is not None
+                                             and store.is_fresh(doc_path, self.base_path / doc_path))
+        return fresh
+
+    def _read_disk(self, doc_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """(texto, hash) lidos do disco; o último documento lido fica memoizado"""
+        last = self._last_disk_read
+        if last is not None and last[0] == doc_path:
+            return last[1], last[2]
+        try:
+            with open(self.base_path / doc_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            text = None
+        self.disk_reads += 1
+        content_hash = hashlib.sha1(text.encode('utf-8')).hexdigest() if text is not None else None
+        self._last_disk_read = (doc_path, text, content_hash)
+        return text, content_hash
+
+    def text(self, doc_path: str) -> Optional[str]:
+        """
+        Texto completo do documento
+
+        Args:
+            doc_path: Caminho do documento (chave do document_summary)
+
+        Returns:
+            Texto ou None se o arquivo não existe
+
+        Raises:
+            OSError, UnicodeDecodeError: Arquivo ilegível
+        """
+        if self._in_store(doc_path):
+            self.pack_reads += 1
+            return self.store.text(doc_path)
+        return self._read_disk(doc_path)[0]
+
+    def body(self, doc_path: str) -> Optional[str]:
+        """
+        Corpo do documento (sem front matter)
+
+        Args:
+            doc_path: Caminho do documento (chave do document_summary)
+
+        Returns:
+            Corpo ou None se o arquivo não existe
+
+        Raises:
+            OSError, UnicodeDecodeError: Arquivo ilegível
+        """
+        if self._in_store(doc_path):
+            self.pack_reads += 1
+            return self.store.body(doc_path)
+        last = self._last_body
+        if last is not None and last[0] == doc_path:
+            return last[1]
+        text = self._read_disk(doc_path)[0]
+        if text is None:
+            return None
+        body = document_body(text)
+        self._last_body = (doc_path, body)
+        return body
+
+    def content_hash(self, doc_path: str) -> Optional[str]:
+        """
+        sha1 do texto do documento (do pacote, sem ler o corpo, quando atualizado)
+
+        Returns:
+            Hash ou None se o arquivo não existe
+
+        Raises:
+            OSError, UnicodeDecodeError: Arquivo ilegível
+        """
+        if self._in_store(doc_path):
+            return self.store.content_hash(doc_path)
+        return self._read_disk(doc_path)[1]
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+# ===== CONTEXT NAVIGATOR CODE BRIDGE =====
+# @cn:component context-maps
+# @cn:doc context-maps.md
+# @cn:context-level c3_component
+# @cn:context-type core
+# @cn:parent-module global-core
+# @cn:purpose "Acesso preguiçoso aos mapas de .cn_model/ - cada mapa é lido no primeiro acesso e memoizado por processo"
+# @cn:memory-aid "Analisadores só pagam pelos mapas que consultam; mapa regravado (mtime) é relido"
+# @cn:depends-on context-snapshot, serialization
+# @cn:provides context-map-loading
+# @cn:component-type functional
+# @cn:responsibility data-loading
+# ============================================
+
+"""
+Context Navigator - Context Maps
+COMPORTAMENTO: ContextMaps expõe os mapas do scanner como um Mapping somente
+leitura. Um mapa é carregado do snapshot binário (se não for mais antigo que o
+.yml) ou do próprio arquivo na primeira vez que é consultado. O resultado fica
+num cache do processo, compartilhado por todos os analisadores e validado pelo
+mtime/tamanho do mapa e do snapshot a cada acesso.
+"""
+
+import json
+import logging
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .context_snapshot import SNAPSHOT_FILENAME, load_snapshot
+from .serialization import yaml_load
+
+logger = logging.getLogger('context_maps')
+
+# Mapa ausente ou ilegível
+_MISSING = object()
+
+# caminho do mapa -> (assinatura dos arquivos, valor)
+_map_cache: Dict[str, Tuple[Any, Any]] = {}
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    """mtime e tamanho do arquivo (None se ausente)"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_map(output_dir: Union[str, Path], map_file: str,
+             log: Optional[logging.Logger] = None) -> Any:
+    """
+    Carrega um mapa de .cn_model/ com memoização por processo
+
+    Args:
+        output_dir: Diretório .cn_model do workspace
+        map_file: Arquivo do mapa (ex: 'index.yml', 'validation.json')
+        log: Logger para erros de leitura (padrão: o deste módulo)
+
+    Returns:
+        Dados do mapa
+
+    Raises:
+        KeyError: Mapa ausente ou ilegível
+    """
+    output_dir = Path(output_dir)
+    map_path = output_dir / map_file
+    signature = (_signature(map_path), _signature(output_dir / SNAPSHOT_FILENAME))
+    key = str(map_path)
+
+    cached = _map_cache.get(key)
+    if cached is None or cached[0] != signature:
+        value = _MISSING
+        name = Path(map_file).with_suffix('').as_posix()
+
+        # Snapshot binário do scanner evita o parse YAML/JSON
+        if signature[1] is not None:
+            snapshot = load_snapshot(output_dir, [map_file])
+            if snapshot is not None and name in snapshot:
+                value = snapshot[name]
+
+        if value is _MISSING and signature[0] is not None:
+            try:
+                with open(map_path, 'r', encoding='utf-8') as f:
+                    value = json.load(f) if map_file.endswith('.json') else yaml_load(f)
+                (log or logger).debug(f"Mapa carregado: {map_file}")
+            except Exception as e:
+                (log or logger).warning(f"Erro ao carregar {map_file}: {e}")
+
+        cached = _map_cache[key] = (signature, value)
+
+    if cached[1] is _MISSING:
+        raise KeyError(map_file)
+    return cached[1]
+
+
+def clear_map_cache() -> None:
+    """Esquece todos os mapas memoizados neste processo"""
+    _map_cache.clear()
+
+
+class ContextMaps(Mapping):
+    """Mapas do scanner por nome ('index', 'connections', ...), carregados no primeiro acesso"""
+
+    def __init__(self, output_dir: Union[str, Path], map_files: List[str],
+                 empty_as_dict: bool = False, log: Optional[logging.Logger] = None):
+        """
+        Args:
+            output_dir: Diretório .cn_model do workspace
+            map_files: Arquivos disponíveis (o nome é o arquivo sem extensão)
+            empty_as_dict: Mapa vazio (None/falso) é entregue como {}
+            log: Logger para erros de leitura
+        """
+        self.output_dir = Path(output_dir)
+        self.map_files = {Path(map_file).with_suffix('').as_posix(): map_file for map_file in map_files}
+        self.empty_as_dict = empty_as_dict
+        self.log = log
+
+    def __getitem__(self, name: str) -> Any:
+        map_file = self.map_files[name]
+        value = load_map(self.output_dir, map_file, self.log)
+        if self.empty_as_dict and not value:
+            return {}
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        # Apenas mapas existentes (carrega os que ainda não foram lidos)
+        for name in self.map_files:
+            if name in self:
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, name: object) -> bool:
+        try:
+            self[name]
+        except KeyError:
+            return False
+        return True
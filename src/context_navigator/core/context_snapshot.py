@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+
+# ===== CONTEXT NAVIGATOR CODE BRIDGE =====
+# @cn:component context-snapshot
+# @cn:doc context-snapshot.md
+# @cn:context-level c3_component
+# @cn:context-type core
+# @cn:parent-module global-core
+# @cn:purpose "Snapshot binário dos mapas de contexto com leitura via mmap e decodificação preguiçosa"
+# @cn:memory-aid "Mesmos dados dos .yml do scanner, sem pagar o parse YAML a cada analisador"
+# @cn:depends-on mmap, struct
+# @cn:provides context-snapshot-writing, context-snapshot-loading
+# @cn:component-type functional
+# @cn:responsibility serialization
+# ============================================
+
+"""
+Context Navigator - Context Snapshot
+COMPORTAMENTO: O scanner grava .cn_model/context-maps.snapshot junto com os
+mapas YAML; os analisadores abrem o snapshot via mmap e só decodificam o que
+acessam. Os .yml continuam sendo o artefato legível.
+
+Layout (little-endian):
+    magic            8 bytes  b'CNSNAP01'
+    n_strings        u32
+    string_offsets   u32 * (n_strings + 1)   relativos ao início das strings
+    string_data      utf-8 (strings internadas, cada uma gravada uma vez)
+    n_sections       u32
+    sections         (u32 nome, u32 offset, u32 tamanho) * n_sections
+    body             valores codificados (offsets relativos ao início do body)
+
+Valores: tag de 1 byte seguida do payload. Dicionários grandes usam a tag
+indexada (TAG_INDEXED), que grava uma tabela chave -> offset e permite
+decodificar cada valor apenas quando ele é acessado.
+"""
+
+import mmap
+import struct
+from collections.abc import Mapping
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+SNAPSHOT_FILENAME = 'context-maps.snapshot'
+SNAPSHOT_MAGIC = b'CNSNAP01'
+
+# Dicionários com pelo menos esta quantidade de chaves são indexados
+LAZY_THRESHOLD = 32
+
+TAG_NONE = b'N'
+TAG_TRUE = b'T'
+TAG_FALSE = b'F'
+TAG_INT = b'I'
+TAG_BIGINT = b'B'
+TAG_FLOAT = b'D'
+TAG_STR = b'S'
+TAG_DATE = b'd'
+TAG_DATETIME = b't'
+TAG_LIST = b'L'
+TAG_MAP = b'M'
+TAG_INDEXED = b'X'
+
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+_SECTION = struct.Struct('<III')
+
+
+class SnapshotError(Exception):
+    """Snapshot ausente, corrompido ou de versão incompatível"""
+
+
+class _SnapshotEncoder:
+    """Codifica valores no body, internando strings"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.string_ids: Dict[str, int] = {}
+        self.body = bytearray()
+
+    def intern(self, value: str) -> int:
+        string_id = self.string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.string_ids[value] = string_id
+            self.strings.append(value)
+        return string_id
+
+    def encode(self, value: Any) -> None:
+        body = self.body
+        if value is None:
+            body += TAG_NONE
+        elif value is True:
+            body += TAG_TRUE
+        elif value is False:
+            body += TAG_FALSE
+        elif isinstance(value, int):
+            if -(1 << 63) <= value < (1 << 63):
+                body += TAG_INT
+                body += _I64.pack(value)
+            else:
+                body += TAG_BIGINT
+                body += _U32.pack(self.intern(str(value)))
+        elif isinstance(value, float):
+            body += TAG_FLOAT
+            body += _F64.pack(value)
+        elif isinstance(value, str):
+            body += TAG_STR
+            body += _U32.pack(self.intern(value))
+        elif isinstance(value, datetime):
+            body += TAG_DATETIME
+            body += _U32.pack(self.intern(value.isoformat()))
+        elif isinstance(value, date):
+            body += TAG_DATE
+            body += _U32.pack(self.intern(value.isoformat()))
+        elif isinstance(value, (list, tuple)):
+            body += TAG_LIST
+            body += _U32.pack(len(value))
+            for item in value:
+                self.encode(item)
+        elif isinstance(value, Mapping):
+            if len(value) >= LAZY_THRESHOLD:
+                self._encode_indexed(value)
+            else:
+                body += TAG_MAP
+                body += _U32.pack(len(value))
+                for key, item in value.items():
+                    body += _U32.pack(self.intern(str(key)))
+                    self.encode(item)
+        else:
+            # Tipos desconhecidos viram texto, como no dump YAML/JSON legível
+            self.encode(str(value))
+
+    def _encode_indexed(self, value: Mapping) -> None:
+        """Grava tabela (chave, offset) seguida dos valores; o fim vem no cabeçalho"""
+        body = self.body
+        body += TAG_INDEXED
+        body += _U32.pack(len(value))
+        end_slot = len(body)
+        body += _U32.pack(0)
+        table_start = len(body)
+        body += bytes(8 * len(value))
+
+        for position, (key, item) in enumerate(value.items()):
+            _U32.pack_into(body, table_start + 8 * position, self.intern(str(key)))
+            _U32.pack_into(body, table_start + 8 * position + 4, len(body))
+            self.encode(item)
+
+        _U32.pack_into(body, end_slot, len(body))
+
+
+def encode_snapshot(maps: Dict[str, Any]) -> bytes:
+    """
+    Serializa os mapas de contexto no formato de snapshot
+
+    Args:
+        maps: Dados por nome de mapa (index, architecture, connections, ...)
+
+    Returns:
+        Bytes do snapshot (determinísticos para a mesma entrada)
+    """
+    encoder = _SnapshotEncoder()
+    sections = []
+    for name, data in maps.items():
+        start = len(encoder.body)
+        encoder.encode(data)
+        sections.append((encoder.intern(name), start, len(encoder.body) - start))
+
+    encoded_strings = [s.encode('utf-8') for s in encoder.strings]
+
+    out = bytearray(SNAPSHOT_MAGIC)
+    out += _U32.pack(len(encoded_strings))
+    offset = 0
+    for raw in encoded_strings:
+        out += _U32.pack(offset)
+        offset += len(raw)
+    out += _U32.pack(offset)
+    for raw in encoded_strings:
+        out += raw
+
+    out += _U32.pack(len(sections))
+    for section in sections:
+        out += _SECTION.pack(*section)
+    out += encoder.body
+    return bytes(out)
+
+
+class LazyMapping(Mapping):
+    """Dicionário indexado do snapshot; cada valor é decodificado no primeiro acesso"""
+
+    def __init__(self, snapshot: 'ContextSnapshot', count: int, table_pos: int):
+        self._snapshot = snapshot
+        self._count = count
+        self._table_pos = table_pos
+        self._offsets: Optional[Dict[str, int]] = None
+        self._values: Dict[str, Any] = {}
+
+    def _index(self) -> Dict[str, int]:
+        if self._offsets is None:
+            buf = self._snapshot._buf
+            string = self._snapshot._string
+            offsets = {}
+            pos = self._table_pos
+            for _ in range(self._count):
+                key_id, value_offset = struct.unpack_from('<II', buf, pos)
+                offsets[string(key_id)] = value_offset
+                pos += 8
+            self._offsets = offsets
+        return self._offsets
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        value_offset = self._index()[key]
+        value, _ = self._snapshot._decode(self._snapshot._body_start + value_offset)
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index()
+
+    def materialize(self) -> Dict[str, Any]:
+        """Decodifica tudo em um dict comum (ex.: para json.dumps)"""
+        return {
+            key: value.materialize() if isinstance(value, LazyMapping) else value
+            for key, value in self.items()
+        }
+
+
+class ContextSnapshot(Mapping):
+    """Leitor do snapshot via mmap; mapas decodificados sob demanda"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            try:
+                self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                # Arquivo vazio não pode ser mapeado
+                raise SnapshotError(f"Snapshot inválido: {self.path}") from e
+
+        if self._buf[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self._buf.close()
+            raise SnapshotError(f"Snapshot com formato desconhecido: {self.path}")
+
+        pos = len(SNAPSHOT_MAGIC)
+        (n_strings,) = _U32.unpack_from(self._buf, pos)
+        self._string_table = pos + 4
+        self._string_data = self._string_table + 4 * (n_strings + 1)
+        (string_bytes,) = _U32.unpack_from(self._buf, self._string_table + 4 * n_strings)
+        self._strings: List[Optional[str]] = [None] * n_strings
+
+        pos = self._string_data + string_bytes
+        (n_sections,) = _U32.unpack_from(self._buf, pos)
+        pos += 4
+        raw_sections = []
+        for _ in range(n_sections):
+            raw_sections.append(_SECTION.unpack_from(self._buf, pos))
+            pos += _SECTION.size
+        self._body_start = pos
+        self._sections = {self._string(name_id): offset for name_id, offset, _ in raw_sections}
+        self._maps: Dict[str, Any] = {}
+
+    def _string(self, string_id: int) -> str:
+        value = self._strings[string_id]
+        if value is None:
+            start, end = struct.unpack_from('<II', self._buf, self._string_table + 4 * string_id)
+            value = self._buf[self._string_data + start:self._string_data + end].decode('utf-8')
+            self._strings[string_id] = value
+        return value
+
+    def _decode(self, pos: int):
+        """Decodifica o valor em pos; retorna (valor, posição seguinte)"""
+        buf = self._buf
+        tag = buf[pos:pos + 1]
+        pos += 1
+        if tag == TAG_STR:
+            return self._string(_U32.unpack_from(buf, pos)[0]), pos + 4
+        if tag == TAG_MAP:
+            (count,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            result = {}
+            for _ in range(count):
+                key = self._string(_U32.unpack_from(buf, pos)[0])
+                result[key], pos = self._decode(pos + 4)
+            return result, pos
+        if tag == TAG_LIST:
+            (count,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            items = []
+            for _ in range(count):
+                item, pos = self._decode(pos)
+                items.append(item)
+            return items, pos
+        if tag == TAG_INDEXED:
+            count, end = struct.unpack_from('<II', buf, pos)
+            return LazyMapping(self, count, pos + 8), self._body_start + end
+        if tag == TAG_NONE:
+            return None, pos
+        if tag == TAG_TRUE:
+            return True, pos
+        if tag == TAG_FALSE:
+            return False, pos
+        if tag == TAG_INT:
+            return _I64.unpack_from(buf, pos)[0], pos + 8
+        if tag == TAG_FLOAT:
+            return _F64.unpack_from(buf, pos)[0], pos + 8
+        if tag == TAG_BIGINT:
+            return int(self._string(_U32.unpack_from(buf, pos)[0])), pos + 4
+        if tag == TAG_DATE:
+            return date.fromisoformat(self._string(_U32.unpack_from(buf, pos)[0])), pos + 4
+        if tag == TAG_DATETIME:
+            return datetime.fromisoformat(self._string(_U32.unpack_from(buf, pos)[0])), pos + 4
+        raise SnapshotError(f"Tag desconhecida {tag!r} em {self.path}")
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._maps:
+            value, _ = self._decode(self._body_start + self._sections[name])
+            self._maps[name] = value
+        return self._maps[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def close(self) -> None:
+        """Libera o mmap (valores já decodificados continuam válidos)"""
+        self._buf.close()
+
+
+def load_snapshot(output_dir: Path, sources: Optional[List[str]] = None) -> Optional[ContextSnapshot]:
+    """
+    Abre o snapshot de .cn_model/ se existir e não for mais antigo que os mapas
+
+    Args:
+        output_dir: Diretório .cn_model do workspace
+        sources: Mapas legíveis (ex.: 'index.yml') que o snapshot espelha
+
+    Returns:
+        ContextSnapshot ou None (o chamador deve cair para o YAML)
+    """
+    snapshot_path = Path(output_dir) / SNAPSHOT_FILENAME
+    try:
+        snapshot_mtime = snapshot_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    # Mapa editado depois do scan: o YAML é a fonte de verdade
+    for source in sources or []:
+        try:
+            if (Path(output_dir) / source).stat().st_mtime_ns > snapshot_mtime:
+                return None
+        except OSError:
+            continue
+
+    try:
+        return ContextSnapshot(snapshot_path)
+    except (OSError, SnapshotError, struct.error):
+        return None
@@ -31,6 +31,7 @@ from typing import Dict, Optional, List, Callable
 from dataclasses import dataclass
 
 from .workspace_manager import WorkspaceManager, Workspace
+from .file_walker import IgnoreRules, walk_files
 
 
 @dataclass
@@ -322,31 +323,26 @@ class FileWatcher:
     def _check_changes(self):
         """Verifica mudanças nos arquivos"""
         try:
-            # Padrões otimizados para Context Navigator
-            relevant_patterns = ['**/*.py', '**/*.js', '**/*.ts', '**/*.md', '**/*.yml']
-            ignore_patterns = ['.cn_model', '.git', 'node_modules', '__pycache__', '.venv']
+            # Extensões relevantes para Context Navigator
+            relevant_suffixes = ('.py', '.js', '.ts', '.md', '.yml')
+            # .git, node_modules, .venv etc. vêm dos padrões embutidos do walker
+            ignore_rules = IgnoreRules.load(self.path, extra=['.cn_model/'])
             
-            for pattern in relevant_patterns:
-                for file_path in self.path.glob(pattern):
-                    if file_path.is_file():
-                        # Filtrar diretórios ignorados
-                        if any(ignore in str(file_path) for ignore in ignore_patterns):
-                            continue
-                        
-                        try:
-                            current_mtime = file_path.stat().st_mtime
-                            file_key = str(file_path)
-                            
-                            if file_key in self.file_times:
-                                if current_mtime > self.file_times[file_key]:
-                                    self.file_times[file_key] = current_mtime
-                                    if self.on_change and self._has_cn_markers(file_path):
-                                        self.on_change(file_path)
-                            else:
-                                self.file_times[file_key] = current_mtime
-                        except (OSError, PermissionError):
-                            # Ignorar arquivos inacessíveis
-                            continue
+            for entry in walk_files(self.path, ignore_rules, suffixes=relevant_suffixes):
+                try:
+                    current_mtime = entry.stat().st_mtime
+                    file_key = entry.path
+                    
+                    if file_key in self.file_times:
+                        if current_mtime > self.file_times[file_key]:
+                            self.file_times[file_key] = current_mtime
+                            if self.on_change and self._has_cn_markers(Path(file_key)):
+                                self.on_change(Path(file_key))
+                    else:
+                        self.file_times[file_key] = current_mtime
+                except (OSError, PermissionError):
+                    # Ignorar arquivos inacessíveis
+                    continue
         except (OSError, PermissionError):
             # Ignorar erros de diretório
             pass
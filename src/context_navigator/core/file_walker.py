@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+# ===== CONTEXT NAVIGATOR CODE BRIDGE =====
+# @cn:component file-walker
+# @cn:doc file-walker.md
+# @cn:context-level c3_component
+# @cn:context-type core
+# @cn:parent-module global-core
+# @cn:purpose "Percurso de diretórios com os.scandir respeitando .cnignore e podando pastas ignoradas"
+# @cn:memory-aid "Um único walker para scanner, parser e file watcher - node_modules/.git nunca são visitados"
+# @cn:depends-on os
+# @cn:provides directory-walking, ignore-rules
+# @cn:component-type functional
+# @cn:responsibility file-discovery
+# ============================================
+
+"""
+Context Navigator - File Walker
+COMPORTAMENTO: Percorre a árvore com os.scandir, aplica as regras do .cnignore
+(subconjunto do formato .gitignore) mais os padrões embutidos e poda
+diretórios ignorados antes de descer. Entrega os DirEntry, cujo stat() é
+reaproveitado pelos chamadores.
+
+Formato do .cnignore (uma regra por linha):
+    # comentário
+    build/          apenas diretórios
+    *.log           nome em qualquer nível
+    /docs/tmp       ancorado na raiz do workspace
+    **/generated    qualquer nível
+    !keep.log       reinclui o que uma regra anterior ignorou
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+CNIGNORE_FILENAME = '.cnignore'
+
+# Diretórios que nunca contêm fontes ou documentação do projeto
+DEFAULT_IGNORES = [
+    '.git/',
+    '.hg/',
+    '.svn/',
+    'node_modules/',
+    '.venv/',
+    'venv/',
+    '__pycache__/',
+    '.mypy_cache/',
+    '.pytest_cache/',
+    '.tox/',
+    # Saída de build apenas na raiz do workspace (docs/build/ continua indexado)
+    '/build/',
+    '/dist/',
+    '*.egg-info/',
+]
+
+
+def _translate(pattern: str) -> str:
+    """Converte um glob do .cnignore em regex (* não atravessa '/')"""
+    i, n = 0, len(pattern)
+    parts = []
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern[i:i + 3] == '**/':
+                parts.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern[i:i + 2] == '**':
+                parts.append('.*')
+                i += 2
+                continue
+            parts.append('[^/]*')
+        elif c == '?':
+            parts.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append('[' + body.replace('\\', '\\\\') + ']')
+                i = end
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return ''.join(parts)
+
+
+class IgnoreRules:
+    """Regras de exclusão compiladas (última regra que casa vence)"""
+
+    def __init__(self, patterns: Iterable[str] = (), root: Optional[Union[str, Path]] = None):
+        """
+        Compila as regras
+
+        Args:
+            patterns: Linhas no formato do .cnignore
+            root: Raiz à qual as regras ancoradas se referem
+        """
+        self.root = Path(root) if root is not None else None
+        # (regex, negar, apenas diretórios)
+        self.rules: List[Tuple['re.Pattern', bool, bool]] = []
+        for line in patterns:
+            self.add(line)
+
+    @classmethod
+    def load(cls, root: Union[str, Path], extra: Iterable[str] = (),
+             defaults: bool = True) -> 'IgnoreRules':
+        """
+        Carrega padrões embutidos, extras e o .cnignore da raiz
+
+        Args:
+            root: Raiz do workspace (onde fica o .cnignore)
+            extra: Regras adicionais do chamador (ex: '.cn_model/')
+            defaults: Inclui DEFAULT_IGNORES
+
+        Returns:
+            Regras compiladas
+        """
+        patterns = list(DEFAULT_IGNORES) if defaults else []
+        patterns.extend(extra)
+        try:
+            with open(Path(root) / CNIGNORE_FILENAME, 'r', encoding='utf-8') as f:
+                patterns.extend(f.read().splitlines())
+        except OSError:
+            pass
+        return cls(patterns, root)
+
+    def add(self, line: str) -> None:
+        """Adiciona uma regra no formato do .cnignore"""
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            return
+
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return
+
+        # Com '/' (fora do final) a regra é relativa à raiz; senão casa o nome em qualquer nível
+        if '/' in line:
+            regex = _translate(line.lstrip('/'))
+        else:
+            regex = '(?:.*/)?' + _translate(line)
+        self.rules.append((re.compile(regex + r'\Z'), negate, dir_only))
+
+    def match(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Verifica se um caminho relativo à raiz está ignorado
+
+        Args:
+            rel_path: Caminho relativo com '/' como separador
+            is_dir: Se o caminho é um diretório
+
+        Returns:
+            True se ignorado
+        """
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                return not negate
+        return False
+
+
+def walk_files(directory: Union[str, Path], rules: Optional[IgnoreRules] = None,
+               suffixes: Optional[Iterable[str]] = None) -> Iterator[os.DirEntry]:
+    """
+    Percorre a árvore podando diretórios ignorados antes de descer
+
+    Links simbólicos para diretórios não são seguidos (como os.walk).
+
+    Args:
+        directory: Pasta inicial
+        rules: Regras de exclusão (None = IgnoreRules.load(directory))
+        suffixes: Extensões aceitas, com ponto (None = todas)
+
+    Yields:
+        DirEntry de cada arquivo; entry.stat() é cacheado pelo próprio DirEntry
+    """
+    directory = str(directory)
+    if rules is None:
+        rules = IgnoreRules.load(directory)
+    suffixes = tuple(suffixes) if suffixes is not None else None
+
+    # Prefixo do caminho relativo à raiz das regras
+    prefix = ''
+    if rules.root is not None:
+        try:
+            prefix = Path(directory).resolve().relative_to(rules.root.resolve()).as_posix()
+        except ValueError:
+            prefix = ''
+        if prefix == '.':
+            prefix = ''
+
+    stack = [(directory, prefix)]
+    while stack:
+        current, rel_dir = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            # Pasta inacessível ou removida durante o percurso
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if not rules.match(rel_path, True):
+                    subdirs.append((entry.path, rel_path))
+                continue
+            if suffixes is not None and not entry.name.endswith(suffixes):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if rules.match(rel_path):
+                continue
+            yield entry
+
+        # Ordem de descida igual à do scandir (pilha invertida)
+        stack.extend(reversed(subdirs))
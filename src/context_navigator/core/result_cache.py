@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+# ===== CONTEXT NAVIGATOR CODE BRIDGE =====
+# @cn:component result-cache
+# @cn:doc result-cache.md
+# @cn:context-level c3_component
+# @cn:context-type core
+# @cn:parent-module global-core
+# @cn:purpose "Cache persistente de resultados de análise em .cn_model/cache/, indexado por chave de hash com despejo LRU por tamanho"
+# @cn:memory-aid "Uma entrada JSON por chave - acerto renova o mtime, gravação despeja as mais antigas acima do limite"
+# @cn:depends-on serialization
+# @cn:provides result-caching
+# @cn:component-type functional
+# @cn:responsibility caching
+# ============================================
+
+"""
+Context Navigator - Result Cache
+COMPORTAMENTO: Cada resultado fica em <pasta>/<chave>.json. Um acerto renova o
+mtime do arquivo (ordem LRU); ao gravar, se a pasta passar de max_bytes, as
+entradas com mtime mais antigo são removidas. O tamanho da pasta é medido uma
+vez e depois mantido pelas gravações do processo; a pasta só é percorrida de
+novo quando essa estimativa passa do limite. Falhas de disco nunca
+interrompem a análise - o resultado apenas não é reaproveitado.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .serialization import atomic_write, MetadataJSONEncoder, metadata_object_hook
+
+logger = logging.getLogger('result_cache')
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Despejo desce até esta fração de max_bytes (a pasta não é percorrida a cada gravação)
+EVICT_TARGET_RATIO = 0.9
+
+
+def hash_key(*parts: Any) -> str:
+    """
+    Chave estável a partir de valores serializáveis em JSON
+
+    Args:
+        *parts: Valores que determinam o resultado (conteúdo, metadados, versões)
+
+    Returns:
+        SHA-1 hexadecimal
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, cls=MetadataJSONEncoder, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Resultados JSON indexados por chave, com limite de tamanho em disco (LRU)"""
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Pasta do cache (ex: .cn_model/cache/engine)
+            max_bytes: Tamanho máximo da pasta antes do despejo
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Tamanho estimado da pasta (None até a primeira medição)
+        self._size: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Resultado guardado para a chave
+
+        Args:
+            key: Chave (ver hash_key)
+
+        Returns:
+            Resultado ou None se ausente/ilegível
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f, object_hook=metadata_object_hook)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # Renova a posição LRU
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Any) -> bool:
+        """
+        Grava o resultado e despeja entradas antigas se necessário
+
+        Args:
+            key: Chave (ver hash_key)
+            result: Valor serializável em JSON
+
+        Returns:
+            True se gravou
+        """
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps(result, ensure_ascii=False, cls=MetadataJSONEncoder).encode('utf-8')
+            try:
+                replaced = path.stat().st_size
+            except OSError:
+                replaced = 0
+            atomic_write(path, payload)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Resultado não gravado no cache: {e}")
+            return False
+
+        if self._size is None:
+            # Primeira gravação: mede a pasta (já com esta entrada)
+            self.evict()
+        else:
+            self._size += len(payload) - replaced
+            if self._size > self.max_bytes:
+                self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Remove as entradas menos usadas se a pasta passou de max_bytes,
+        até EVICT_TARGET_RATIO do limite
+
+        Returns:
+            Quantidade de entradas removidas
+        """
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return 0
+
+        removed = 0
+        if total > self.max_bytes:
+            target = self.max_bytes * EVICT_TARGET_RATIO
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+        self._size = total
+        return removed
+
+    def clear(self) -> None:
+        """Remove todas as entradas"""
+        self._size = None
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.json'):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass
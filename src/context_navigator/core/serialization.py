@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+# ===== CONTEXT NAVIGATOR CODE BRIDGE =====
+# @cn:component serialization
+# @cn:doc serialization.md
+# @cn:context-level c3_component
+# @cn:context-type core
+# @cn:parent-module global-core
+# @cn:purpose "Leitura e escrita YAML com o backend mais rápido disponível (libyaml quando instalado) e gravação atômica"
+# @cn:memory-aid "Todo yaml.safe_load/yaml.dump de configs, registry e mapas passa por aqui"
+# @cn:depends-on yaml
+# @cn:provides yaml-loading, yaml-dumping
+# @cn:component-type functional
+# @cn:responsibility serialization
+# ============================================
+
+"""
+Context Navigator - Serialization
+COMPORTAMENTO: Usa CSafeLoader/CSafeDumper (libyaml) quando disponíveis e cai
+para SafeLoader/SafeDumper em Python puro, com a mesma saída.
+
+Benchmark dos backends:
+    python core/serialization.py --documents 10000
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    YAML_BACKEND = 'libyaml'
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    YAML_BACKEND = 'python'
+
+# Erro comum aos dois backends
+YAMLError = yaml.YAMLError
+
+
+def yaml_load(stream: Union[str, bytes, TextIO]) -> Any:
+    """
+    Equivalente a yaml.safe_load usando o backend mais rápido
+
+    Args:
+        stream: Texto YAML ou arquivo aberto
+
+    Returns:
+        Dados carregados
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def yaml_dump(data: Any, stream: Optional[TextIO] = None, **kwargs) -> Optional[str]:
+    """
+    Equivalente a yaml.dump (formato de bloco, unicode) usando o backend mais rápido
+
+    Args:
+        data: Dados para serializar (apenas tipos seguros)
+        stream: Arquivo de saída (None retorna a string)
+        **kwargs: Opções repassadas ao yaml.dump
+
+    Returns:
+        String YAML quando stream é None
+    """
+    kwargs.setdefault('default_flow_style', False)
+    kwargs.setdefault('allow_unicode', True)
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def atomic_write(file_path: Path, payload: bytes) -> None:
+    """
+    Grava arquivo via temporário + rename (leitores nunca veem escrita parcial)
+
+    Args:
+        file_path: Arquivo de destino
+        payload: Conteúdo serializado
+    """
+    file_path = Path(file_path)
+
+    # mkstemp cria com 0600: manter permissões do arquivo atual ou do umask
+    try:
+        mode = file_path.stat().st_mode & 0o777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, tmp_path = tempfile.mkstemp(dir=str(file_path.parent), prefix=f".{file_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, str(file_path))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class MetadataJSONEncoder(json.JSONEncoder):
+    """Serializa datas do YAML preservando o tipo na releitura (manifest, caches)"""
+
+    def default(self, obj):
+        if isinstance(obj, datetime):
+            return {'__datetime__': obj.isoformat()}
+        if isinstance(obj, date):
+            return {'__date__': obj.isoformat()}
+        return super().default(obj)
+
+
+def metadata_object_hook(obj: Dict[str, Any]) -> Any:
+    """Restaura datas serializadas por MetadataJSONEncoder"""
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+def _generate_index(documents: int) -> dict:
+    """Gera um index.yml sintético no formato do scanner"""
+    summary = {}
+    for i in range(documents):
+        summary[f".cn_model/docs/decisions/adr-{i:05d}.md"] = {
+            'type': 'decision',
+            'title': f"ADR {i}: Escolha de componente {i % 97}",
+            'context_level': f"c{1 + i % 3}_component",
+            'context_type': ['core', 'api', 'data', 'ui', 'infra', 'shared'][i % 6],
+            'module': f"module-{i % 50}",
+            'status': 'active',
+            'last_updated': '2025-01-13',
+            'has_errors': i % 7 == 0
+        }
+    return {
+        'project': {'name': 'benchmark'},
+        'scan_info': {'total_documents': documents, 'validation_errors': 0, 'conflicts': 0},
+        'document_summary': summary,
+        'type_distribution': {'decision': documents}
+    }
+
+
+def benchmark(documents: int = 10000, rounds: int = 3) -> int:
+    """
+    Compara parse/dump em Python puro e libyaml num index.yml sintético
+
+    Args:
+        documents: Quantidade de documentos no índice gerado
+        rounds: Repetições (usa o melhor tempo)
+
+    Returns:
+        Código de saída
+    """
+    data = _generate_index(documents)
+    text = yaml.dump(data, Dumper=yaml.SafeDumper, default_flow_style=False, allow_unicode=True)
+    print(f"📄 index.yml sintético: {documents} documentos, {len(text) / 1024:.0f} KiB")
+
+    backends = [('python', yaml.SafeLoader, yaml.SafeDumper)]
+    if hasattr(yaml, 'CSafeLoader'):
+        backends.append(('libyaml', yaml.CSafeLoader, yaml.CSafeDumper))
+    else:
+        print("⚠️  libyaml não disponível - apenas o backend Python será medido")
+
+    results = {}
+    for name, loader, dumper in backends:
+        parse_times = []
+        dump_times = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            loaded = yaml.load(text, Loader=loader)
+            parse_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            dumped = yaml.dump(loaded, Dumper=dumper, default_flow_style=False, allow_unicode=True)
+            dump_times.append(time.perf_counter() - start)
+
+        if dumped != text:
+            print(f"❌ Saída do backend {name} difere da referência")
+            return 1
+        results[name] = (min(parse_times), min(dump_times))
+        print(f"   {name:8} parse: {results[name][0] * 1000:8.1f} ms   dump: {results[name][1] * 1000:8.1f} ms")
+
+    if 'libyaml' in results:
+        python_parse, python_dump = results['python']
+        c_parse, c_dump = results['libyaml']
+        print(f"🚀 Speedup libyaml - parse: {python_parse / c_parse:.1f}x   dump: {python_dump / c_dump:.1f}x")
+
+    print(f"✅ Backend ativo: {YAML_BACKEND}")
+    return 0
+
+
+def main():
+    """Benchmark dos backends YAML"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Context Navigator - benchmark de serialização YAML')
+    parser.add_argument('--documents', '-n', type=int, default=10000,
+                        help='Documentos no index.yml gerado (padrão: 10000)')
+    parser.add_argument('--rounds', '-r', type=int, default=3,
+                        help='Repetições por backend (padrão: 3)')
+    args = parser.parse_args()
+
+    return benchmark(args.documents, args.rounds)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
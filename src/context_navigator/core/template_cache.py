@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+# ===== CONTEXT NAVIGATOR CODE BRIDGE =====
+# @cn:component template-cache
+# @cn:doc template-cache.md
+# @cn:context-level c3_component
+# @cn:context-type core
+# @cn:parent-module global-core
+# @cn:purpose "Cache de templates parseados na instalação global, compartilhado por todos os workspaces"
+# @cn:memory-aid "Template parseado uma vez por hash - scanner e 'cn new' leem do cache"
+# @cn:depends-on serialization
+# @cn:provides template-caching
+# @cn:component-type functional
+# @cn:responsibility caching
+# ============================================
+
+"""
+Context Navigator - Template Cache
+COMPORTAMENTO: Guarda o texto e o resultado do parse de cada template em
+<instalação>/cache/templates.json, indexado pelo hash do arquivo. Caminho,
+tamanho e mtime levam ao hash sem reler o arquivo; um template alterado gera
+novo hash e é parseado de novo. Apenas templates da própria instalação são
+guardados: arquivos de fora (ex: templates customizados de um workspace) são
+lidos diretamente. Se a instalação não for gravável o cache vale apenas para o
+processo atual.
+"""
+
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from .serialization import atomic_write, MetadataJSONEncoder, metadata_object_hook
+
+logger = logging.getLogger('template_cache')
+
+TEMPLATE_CACHE_FILENAME = 'templates.json'
+TEMPLATE_CACHE_VERSION = 1
+
+
+class TemplateCache:
+    """Templates (texto + parse) indexados pelo hash do arquivo"""
+
+    def __init__(self, templates_path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            templates_path: Pasta de templates da instalação
+            cache_dir: Pasta do cache (padrão: <instalação>/cache)
+        """
+        self.templates_path = Path(templates_path)
+        self._templates_root = self.templates_path.resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else self.templates_path.parent / 'cache'
+        self.cache_file = self.cache_dir / TEMPLATE_CACHE_FILENAME
+        self.hits = 0
+        self.misses = 0
+        self._paths: Dict[str, Dict[str, Any]] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _load(self) -> None:
+        """Carrega o cache do disco (uma vez por processo)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f, object_hook=metadata_object_hook)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != TEMPLATE_CACHE_VERSION:
+            return
+        self._paths = data.get('paths', {})
+        self._entries = data.get('entries', {})
+
+    def _is_installed(self, resolved: Path) -> bool:
+        """Caminho (resolvido) pertence à pasta de templates da instalação"""
+        return resolved == self._templates_root or self._templates_root in resolved.parents
+
+    def _entry(self, template_path: Path) -> Optional[Dict[str, Any]]:
+        """Entrada do template, lendo e hasheando o arquivo apenas se mudou"""
+        resolved = template_path.resolve()
+        if not self._is_installed(resolved):
+            # Fora da instalação: lido a cada uso, nunca persistido no cache global
+            try:
+                raw = template_path.read_bytes()
+            except OSError:
+                return None
+            return {'text': raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n'), 'parsed': {}}
+
+        self._load()
+        key = str(resolved)
+        try:
+            stat = template_path.stat()
+        except OSError:
+            return None
+
+        known = self._paths.get(key)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+            entry = self._entries.get(known['hash'])
+            if entry is not None:
+                return entry
+
+        try:
+            raw = template_path.read_bytes()
+        except OSError:
+            return None
+        file_hash = hashlib.sha1(raw).hexdigest()
+
+        self._paths[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': file_hash}
+        self._dirty = True
+        entry = self._entries.get(file_hash)
+        if entry is None:
+            # Mesma leitura de texto que open(..., 'r') (newlines universais)
+            text = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            entry = self._entries[file_hash] = {'text': text, 'parsed': {}}
+        return entry
+
+    def read_text(self, template_path: Union[str, Path]) -> Optional[str]:
+        """
+        Texto do template
+
+        Args:
+            template_path: Arquivo do template
+
+        Returns:
+            Conteúdo ou None se ilegível
+        """
+        try:
+            entry = self._entry(Path(template_path))
+        except UnicodeDecodeError:
+            return None
+        return entry['text'] if entry is not None else None
+
+    def parsed(self, template_path: Union[str, Path], parser: Callable[[str], Dict[str, Any]],
+               parser_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Resultado do parse do template, calculado uma vez por hash e parser
+
+        Args:
+            template_path: Arquivo do template
+            parser: Função texto -> dicionário serializável em JSON
+            parser_id: Identificador/versão do parser (muda o parse invalida o cache)
+
+        Returns:
+            Resultado do parser ou None se ilegível
+        """
+        try:
+            entry = self._entry(Path(template_path))
+        except UnicodeDecodeError:
+            return None
+        if entry is None:
+            return None
+
+        result = entry['parsed'].get(parser_id)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = entry['parsed'][parser_id] = parser(entry['text'])
+        self._dirty = True
+        return result
+
+    def _prune_paths(self) -> None:
+        """Esquece caminhos removidos, movidos ou de fora da instalação"""
+        for key in list(self._paths):
+            path = Path(key)
+            if not self._is_installed(path) or not path.is_file():
+                del self._paths[key]
+                self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Grava o cache se houve mudanças (descarta caminhos inexistentes e entradas sem caminho)
+
+        Returns:
+            True se gravou
+        """
+        if self._loaded:
+            self._prune_paths()
+        if not self._dirty:
+            return False
+
+        live_hashes = {known['hash'] for known in self._paths.values()}
+        self._entries = {h: entry for h, entry in self._entries.items() if h in live_hashes}
+        data = {
+            'version': TEMPLATE_CACHE_VERSION,
+            'paths': self._paths,
+            'entries': self._entries
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps(data, ensure_ascii=False, cls=MetadataJSONEncoder)
+            atomic_write(self.cache_file, payload.encode('utf-8'))
+        except (OSError, TypeError, ValueError) as e:
+            # Instalação somente leitura: cache fica só em memória
+            logger.debug(f"Cache de templates não gravado: {e}")
+            return False
+        self._dirty = False
+        return True
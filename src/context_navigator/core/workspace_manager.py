@@ -21,12 +21,18 @@ COMPORTAMENTO: Detecta workspaces (.cn_model/) como git detecta (.git/)
 
 import os
 import sys
-import yaml
 import time
 from pathlib import Path
 from typing import Optional, Dict, List
 from dataclasses import dataclass
 
+try:
+    from .serialization import yaml_load, yaml_dump
+except ImportError:
+    # Fallback para execução direta
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from core.serialization import yaml_load, yaml_dump
+
 
 @dataclass
 class Workspace:
@@ -91,13 +97,13 @@ class WorkspaceRegistry:
         self.registry_file.parent.mkdir(parents=True, exist_ok=True)
         
         with open(self.registry_file, 'w', encoding='utf-8') as f:
-            yaml.dump(registry_data, f, default_flow_style=False, allow_unicode=True)
+            yaml_dump(registry_data, f)
     
     def _load_registry(self) -> Dict:
         """Carrega registry do arquivo"""
         try:
             with open(self.registry_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+                return yaml_load(f) or {}
         except Exception as e:
             print(f"⚠️ Erro ao carregar registry: {e}")
             return {'workspaces': {}}
@@ -106,7 +112,7 @@ class WorkspaceRegistry:
         """Salva registry no arquivo"""
         try:
             with open(self.registry_file, 'w', encoding='utf-8') as f:
-                yaml.dump(registry_data, f, default_flow_style=False, allow_unicode=True)
+                yaml_dump(registry_data, f)
         except Exception as e:
             print(f"❌ Erro ao salvar registry: {e}")
     
@@ -245,7 +251,7 @@ class WorkspaceManager:
         
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml_load(f)
             
             workspace_info = config.get('workspace', {})
             return Workspace(
@@ -285,7 +291,7 @@ class WorkspaceManager:
         # 5. Salvar .cn_workspace
         workspace_file = cn_model_dir / self.workspace_config_file
         with open(workspace_file, 'w', encoding='utf-8') as f:
-            yaml.dump(workspace_config, f, default_flow_style=False, allow_unicode=True)
+            yaml_dump(workspace_config, f)
         
         # 6. Sugerir atualização do .gitignore
         self._suggest_gitignore_update(path)
@@ -7,24 +7,39 @@ complexas entre documentos da metodologia Context Navigator.
 
 import os
 import sys
-import yaml
 import json
 import re
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 from collections import defaultdict, Counter
+from collections.abc import Mapping
 import difflib
 import hashlib
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    from ...core.context_maps import ContextMaps
+    from ...core.content_store import DocumentContents
+    from ...core.result_cache import hash_key
+    from ...core.serialization import atomic_write, MetadataJSONEncoder, metadata_object_hook
+    from ...core.workspace_manager import Workspace
+except ImportError:
+    # Fallback para execução a partir da instalação (PYTHONPATH = raiz)
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.context_maps import ContextMaps
+    from core.content_store import DocumentContents
+    from core.result_cache import hash_key
+    from core.serialization import atomic_write, MetadataJSONEncoder, metadata_object_hook
+    from core.workspace_manager import Workspace
+
 logger = logging.getLogger('conflict_detector')
 
 class ConflictType(Enum):
@@ -86,22 +101,254 @@ class ConflictReport:
     conflicts: List[Conflict]
     analysis_summary: Dict[str, Any]
     resolution_plan: List[str]
+    detector_timings: Dict[str, float] = field(default_factory=dict)
+
+def _conflict_to_dict(conflict: 'Conflict') -> Dict[str, Any]:
+    """Conflito em formato serializável (cache incremental)"""
+    return {
+        'id': conflict.id,
+        'type': conflict.type.value,
+        'severity': conflict.severity.value,
+        'title': conflict.title,
+        'description': conflict.description,
+        'evidence': [
+            [e.source_file, e.line_number, e.content, e.context] for e in conflict.evidence
+        ],
+        'affected_files': conflict.affected_files,
+        'resolution': [
+            conflict.resolution.description, conflict.resolution.action_required,
+            conflict.resolution.priority, conflict.resolution.automated, conflict.resolution.steps
+        ],
+        'detected_at': conflict.detected_at,
+        'confidence': conflict.confidence
+    }
+
+
+def _conflict_from_dict(data: Dict[str, Any]) -> 'Conflict':
+    """Reconstrói um conflito gravado por _conflict_to_dict"""
+    return Conflict(
+        id=data['id'],
+        type=ConflictType(data['type']),
+        severity=ConflictSeverity(data['severity']),
+        title=data['title'],
+        description=data['description'],
+        evidence=[ConflictEvidence(*e) for e in data['evidence']],
+        affected_files=data['affected_files'],
+        resolution=ConflictResolution(*data['resolution']),
+        detected_at=data['detected_at'],
+        confidence=data['confidence']
+    )
+
+
+# Incrementar ao mudar extração ou regras das famílias cacheadas
+CONFLICT_CACHE_VERSION = 3
+
+
+class ConflictFamilyCache:
+    """
+    Cache incremental de uma família de detecção (.cn_model/cache/conflicts/<família>.json)
+    
+    Guarda a extração de cada documento (indexada pela impressão digital do
+    documento) e o índice de conflitos (indexado pelo hash da entrada de cada
+    grupo avaliado). Documentos inalterados não são reextraídos e grupos cuja
+    entrada não mudou não são reavaliados. Cada família tem seu arquivo, o que
+    permite gravar a partir dos processos do modo paralelo.
+    """
+    
+    def __init__(self, cache_dir: Path, family: str):
+        self.cache_file = Path(cache_dir) / f"{family}.json"
+        self.documents: Dict[str, List[Any]] = {}
+        self.conflicts: Dict[str, List[Dict[str, Any]]] = {}
+        self._used_documents: Set[str] = set()
+        self._used_conflicts: Set[str] = set()
+        self._dirty = False
+        self.reused_documents = 0
+        self.reused_groups = 0
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f, object_hook=metadata_object_hook)
+            if data.get('version') == CONFLICT_CACHE_VERSION:
+                self.documents = data.get('documents', {})
+                self.conflicts = data.get('conflicts', {})
+        except (OSError, ValueError):
+            pass
+            
+    def record(self, doc_path: str, fingerprint: str, extract) -> Any:
+        """Extração do documento, recalculada só se a impressão digital mudou"""
+        self._used_documents.add(doc_path)
+        cached = self.documents.get(doc_path)
+        if cached is not None and cached[0] == fingerprint:
+            self.reused_documents += 1
+            return cached[1]
+        value = extract()
+        self.documents[doc_path] = [fingerprint, value]
+        self._dirty = True
+        return value
+        
+    def evaluate(self, signature: str, evaluate) -> List['Conflict']:
+        """Conflitos de um grupo, reavaliados só se a entrada do grupo mudou"""
+        self._used_conflicts.add(signature)
+        cached = self.conflicts.get(signature)
+        if cached is not None:
+            self.reused_groups += 1
+            return [_conflict_from_dict(data) for data in cached]
+        conflicts = evaluate()
+        self.conflicts[signature] = [_conflict_to_dict(conflict) for conflict in conflicts]
+        self._dirty = True
+        return conflicts
+        
+    def save(self) -> None:
+        """Grava o cache descartando documentos e grupos que não existem mais"""
+        if len(self._used_documents) != len(self.documents) or len(self._used_conflicts) != len(self.conflicts):
+            self.documents = {k: v for k, v in self.documents.items() if k in self._used_documents}
+            self.conflicts = {k: v for k, v in self.conflicts.items() if k in self._used_conflicts}
+            self._dirty = True
+        if not self._dirty:
+            return
+            
+        data = {'version': CONFLICT_CACHE_VERSION, 'documents': self.documents, 'conflicts': self.conflicts}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps(data, ensure_ascii=False, cls=MetadataJSONEncoder)
+            atomic_write(self.cache_file, payload.encode('utf-8'))
+            self._dirty = False
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Cache de conflitos não gravado: {e}")
+
+
+# Famílias de detecção: (chave, rótulo, método)
+DETECTOR_FAMILIES = [
+    ('nomenclature', 'Nomenclatura', '_detect_nomenclature_conflicts'),
+    ('dependency', 'Dependências', '_detect_dependency_conflicts'),
+    ('context', 'Contexto', '_detect_context_conflicts'),
+    ('versioning', 'Versionamento', '_detect_versioning_conflicts'),
+    ('temporal', 'Temporal', '_detect_temporal_conflicts'),
+    ('data', 'Dados', '_detect_data_conflicts')
+]
+
+# Detector dos processos do pool (herdado via fork ou criado no initializer)
+_worker_detector = None
+
+
+def _init_detector_worker(workspace: Workspace, incremental: bool) -> None:
+    """Cria o detector do processo (no workspace do pai) quando ele não foi herdado"""
+    global _worker_detector
+    if _worker_detector is None:
+        _worker_detector = ConflictDetector(incremental=incremental, workspace=workspace)
+
+
+def _timed_detector_family(detector: 'ConflictDetector',
+                           method_name: str) -> Tuple[List['Conflict'], float, Optional[str]]:
+    """
+    Executa uma família de detecção medindo o tempo
+    
+    Returns:
+        (conflitos, segundos, mensagem de erro)
+    """
+    start = time.perf_counter()
+    try:
+        conflicts = getattr(detector, method_name)()
+        error = None
+    except Exception as e:
+        conflicts = []
+        error = str(e)
+    return conflicts, time.perf_counter() - start, error
+
+
+def _run_detector_family(method_name: str) -> Tuple[List['Conflict'], float, Optional[str]]:
+    """Executa uma família de detecção com o detector do processo do pool"""
+    return _timed_detector_family(_worker_detector, method_name)
+
+# Caracteres em que re.IGNORECASE e str.lower() divergem (İ muda o tamanho; ı e ſ casam com i/s)
+_CASEFOLD_EXCEPTIONS = '\u0130\u0131\u017f'
+
+
+def _lower_literals(pattern: str) -> str:
+    """Minúsculas nos literais da regex, preservando escapes (\\S, \\W, \\D...)"""
+    parts = []
+    escaped = False
+    for char in pattern:
+        parts.append(char if escaped else char.lower())
+        escaped = not escaped and char == '\\'
+    return ''.join(parts)
+
+
+class _PatternFamily:
+    """
+    Padrões de extração por categoria, compilados uma vez
+    
+    Com re.IGNORECASE o sre não usa a busca rápida pelo prefixo literal de cada
+    padrão; casar a versão em minúsculas do padrão contra o texto em minúsculas
+    (e recortar o texto original pelas posições) dá o mesmo resultado que
+    re.findall(padrão, texto, re.IGNORECASE), várias vezes mais rápido. Textos
+    com os caracteres de _CASEFOLD_EXCEPTIONS usam o caminho com IGNORECASE.
+    """
+    
+    def __init__(self, patterns: Dict[str, List[str]]):
+        """
+        Args:
+            patterns: Categoria -> lista de regex
+        """
+        self.patterns = patterns
+        self.compiled = []
+        for category, pattern_list in patterns.items():
+            for pattern in pattern_list:
+                ignorecase = re.compile(pattern, re.IGNORECASE)
+                # Com grupos o findall devolve os grupos: só o caminho original serve
+                lowered = re.compile(_lower_literals(pattern)) if not ignorecase.groups else None
+                self.compiled.append((category, ignorecase, lowered))
+                
+    def extract(self, content: str) -> Dict[str, List[str]]:
+        """
+        Extrai as ocorrências de todos os padrões
+        
+        Args:
+            content: Conteúdo a ser analisado
+            
+        Returns:
+            Categoria -> ocorrências, na ordem dos padrões e depois do texto
+        """
+        entities = {category: [] for category in self.patterns}
+        content_lower = None
+        if not any(char in content for char in _CASEFOLD_EXCEPTIONS):
+            content_lower = content.lower()
+            
+        for category, ignorecase, lowered in self.compiled:
+            if content_lower is not None and lowered is not None:
+                entities[category].extend(content[m.start():m.end()] for m in lowered.finditer(content_lower))
+            else:
+                entities[category].extend(ignorecase.findall(content))
+        return entities
+
 
 class ConflictDetector:
     """Detector especializado em conflitos metodológicos"""
     
-    def __init__(self, base_path: str = "."):
+    def __init__(self, base_path: str = ".", jobs: int = 1, incremental: bool = False,
+                 workspace: Optional[Workspace] = None):
         """
         Inicializa o detector
         
         Args:
             base_path: Caminho base do projeto
+            jobs: Processos para as famílias de detecção (0 = número de CPUs)
+            incremental: Reaproveita extrações e conflitos de documentos inalterados
+            workspace: Workspace explícito (dispensa a detecção e o acesso ao registry)
         """
         self.base_path = Path(base_path)
         self.conflicts = []
-        
-        # NOVO: Usar WorkspaceManager para detectar workspace
-        self._init_with_workspace_manager()
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.incremental = incremental
+        self.detector_timings = {}
+        self._fingerprints = {}
+        
+        if workspace is not None:
+            # Processos do pool: workspace resolvido pelo processo principal
+            self._init_workspace(workspace)
+        else:
+            # NOVO: Usar WorkspaceManager para detectar workspace
+            self._init_with_workspace_manager()
         
         # Carregar dados necessários
         self._load_context_maps()
@@ -129,20 +376,27 @@ class ConflictDetector:
             logger.error("💡 Execute 'cn init' para configurar este diretório")
             sys.exit(1)
         
-        # Configurar paths baseado no workspace
-        self.workspace = current_workspace
-        self.base_path = current_workspace.root_path
-        self.output_dir = current_workspace.root_path / ".cn_model"
+        self._init_workspace(current_workspace)
+        
+    def _init_workspace(self, workspace: Workspace) -> None:
+        """Configura paths e configuração a partir de um workspace"""
+        self.workspace = workspace
+        self.base_path = workspace.root_path
+        self.output_dir = workspace.root_path / ".cn_model"
         
         # Configuração vem do workspace
-        self.config = current_workspace.configuration
+        self.config = workspace.configuration
         self.documents = {}
         self.context_maps = {}
+        self.cache_dir = self.output_dir / "cache" / "conflicts"
+        
+        # Corpos dos documentos vêm do pacote de conteúdo do scanner
+        self.contents = DocumentContents(self.output_dir, self.base_path)
         
-        logger.info(f"🌐 Workspace: {current_workspace.name} ({current_workspace.root_path})")
+        logger.info(f"🌐 Workspace: {workspace.name} ({workspace.root_path})")
         
     def _load_context_maps(self) -> None:
-        """Carrega mapas de contexto existentes"""
+        """Prepara os mapas de contexto (cada mapa é lido no primeiro acesso)"""
         # Usar nova arquitetura: mapas ficam em .cn_model/
         context_maps_path = self.output_dir
         
@@ -150,19 +404,8 @@ class ConflictDetector:
             logger.warning("Mapas de contexto não encontrados")
             return
             
-        # Carregar mapas principais
         map_files = ['index.yml', 'architecture.yml', 'connections.yml', 'conflicts.yml']
-        
-        for map_file in map_files:
-            file_path = context_maps_path / map_file
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        map_name = map_file.replace('.yml', '')
-                        self.context_maps[map_name] = yaml.safe_load(f)
-                    logger.debug(f"Mapa carregado: {map_file}")
-                except Exception as e:
-                    logger.warning(f"Erro ao carregar {map_file}: {e}")
+        self.context_maps = ContextMaps(context_maps_path, map_files, log=logger)
                     
     def _init_detection_patterns(self) -> None:
         """Inicializa padrões para detecção de conflitos"""
@@ -233,6 +476,12 @@ class ConflictDetector:
             ]
         }
         
+        # Cada família compilada uma vez
+        self.pattern_families = {
+            id(patterns): _PatternFamily(patterns)
+            for patterns in (self.nomenclature_patterns, self.dependency_patterns, self.versioning_patterns)
+        }
+        
     def _extract_entities(self, content: str, patterns: Dict[str, List[str]]) -> Dict[str, List[str]]:
         """
         Extrai entidades específicas do conteúdo usando padrões
@@ -244,17 +493,91 @@ class ConflictDetector:
         Returns:
             Dicionário com entidades extraídas por categoria
         """
-        entities = {}
+        family = self.pattern_families.get(id(patterns))
+        if family is None or family.patterns is not patterns:
+            family = self.pattern_families[id(patterns)] = _PatternFamily(patterns)
+        return family.extract(content)
+        
+    def _family_cache(self, family: str) -> Optional[ConflictFamilyCache]:
+        """Cache incremental da família (None fora do modo incremental)"""
+        if not self.incremental:
+            return None
+        return ConflictFamilyCache(self.cache_dir, family)
+        
+    def _document_content(self, doc_path: str) -> str:
+        """Corpo do documento, sem front matter (vazio se ilegível)"""
+        try:
+            return self.contents.body(doc_path) or ''
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Erro ao ler documento {doc_path}: {e}")
+            return ''
+            
+    def _document_content_hash(self, doc_path: str) -> Optional[str]:
+        """Hash do texto do documento (None se ilegível)"""
+        try:
+            return self.contents.content_hash(doc_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        
+    def _document_fingerprint(self, doc_path: str, doc_info: Any) -> str:
+        """Hash das informações do documento no índice e do seu texto (memoizado por objeto)"""
+        cached = self._fingerprints.get(doc_path)
+        if cached is not None and cached[0] is doc_info:
+            return cached[1]
+        plain = dict(doc_info) if isinstance(doc_info, Mapping) else doc_info
+        fingerprint = hash_key(doc_path, plain, self._document_content_hash(doc_path))
+        self._fingerprints[doc_path] = (doc_info, fingerprint)
+        return fingerprint
+        
+    def _document_record(self, cache: Optional[ConflictFamilyCache], doc_path: str,
+                         doc_info: Any, extract) -> Any:
+        """Extração de um documento, reaproveitada do cache se ele não mudou"""
+        if cache is None:
+            return extract()
+        return cache.record(doc_path, self._document_fingerprint(doc_path, doc_info), extract)
+        
+    @staticmethod
+    def _evaluate_group(cache: Optional[ConflictFamilyCache], group: Tuple[Any, ...],
+                        evaluate) -> List[Conflict]:
+        """
+        Conflitos de um grupo, reaproveitados do cache se a entrada do grupo não mudou
         
-        for category, pattern_list in patterns.items():
-            entities[category] = []
+        Grupos de um único documento usam a impressão digital do documento como entrada.
+        """
+        if cache is None:
+            return evaluate()
+        return cache.evaluate(hash_key(*group), evaluate)
+        
+    @staticmethod
+    def _max_similarity(originals: List[str], threshold: float) -> Optional[float]:
+        """
+        Maior similaridade (SequenceMatcher.ratio) acima do limiar entre pares de grafias
+        
+        Os limites superiores baratos do difflib (real_quick_ratio: tamanhos,
+        quick_ratio: caracteres em comum) descartam o par antes do ratio(), que só
+        roda quando o par pode superar o limiar e o melhor valor já encontrado.
+        
+        Args:
+            originals: Grafias distintas de uma mesma entidade
+            threshold: Similaridade mínima (exclusiva)
             
-            for pattern in pattern_list:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    entities[category].extend(matches)
-                    
-        return entities
+        Returns:
+            Maior similaridade ou None se nenhum par supera o limiar
+        """
+        best = None
+        matcher = difflib.SequenceMatcher(None)
+        for j, orig2 in enumerate(originals):
+            # seq2 fixo: o SequenceMatcher reaproveita o índice de caracteres
+            matcher.set_seq2(orig2)
+            for orig1 in originals[:j]:
+                matcher.set_seq1(orig1)
+                floor = threshold if best is None else best
+                if matcher.real_quick_ratio() <= floor or matcher.quick_ratio() <= floor:
+                    continue
+                similarity = matcher.ratio()
+                if similarity > floor:
+                    best = similarity
+        return best
         
     def _detect_nomenclature_conflicts(self) -> List[Conflict]:
         """
@@ -270,14 +593,17 @@ class ConflictDetector:
             
         document_summary = self.context_maps['index'].get('document_summary', {})
         
+        cache = self._family_cache('nomenclature')
+        
         # Coletar todas as entidades mencionadas
         all_entities = defaultdict(list)
         
         for doc_path, doc_info in document_summary.items():
-            doc_content = doc_info.get('content', '')
-            
             # Extrair entidades usando padrões
-            entities = self._extract_entities(doc_content, self.nomenclature_patterns)
+            entities = self._document_record(
+                cache, doc_path, doc_info,
+                lambda: self._extract_entities(self._document_content(doc_path), self.nomenclature_patterns)
+            )
             
             for category, entity_list in entities.items():
                 for entity in entity_list:
@@ -300,66 +626,80 @@ class ConflictDetector:
             # Detectar variações do mesmo conceito
             for base_entity, variations in entity_variations.items():
                 if len(variations) > 1:
-                    # Verificar se são realmente variações (similaridade)
-                    originals = [v['original'] for v in variations]
-                    unique_originals = set(originals)
+                    conflicts.extend(self._evaluate_group(
+                        cache, ('nomenclature', category, base_entity, variations),
+                        lambda: self._nomenclature_group_conflicts(category, base_entity, variations)
+                    ))
                     
-                    if len(unique_originals) > 1:
-                        # Calcular similaridade
-                        similarity_threshold = 0.8
-                        similar_groups = []
-                        
-                        for i, orig1 in enumerate(unique_originals):
-                            for j, orig2 in enumerate(unique_originals):
-                                if i < j:
-                                    similarity = difflib.SequenceMatcher(None, orig1, orig2).ratio()
-                                    if similarity > similarity_threshold:
-                                        similar_groups.append((orig1, orig2, similarity))
-                                        
-                        if similar_groups:
-                            # Criar conflito de nomenclatura
-                            conflict_id = hashlib.md5(f"nomenclature_{category}_{base_entity}".encode()).hexdigest()[:8]
-                            
-                            evidence = []
-                            affected_files = []
-                            
-                            for variation in variations:
-                                evidence.append(ConflictEvidence(
-                                    source_file=variation['file'],
-                                    line_number=None,
-                                    content=variation['original'],
-                                    context=f"Categoria: {category}, Contexto: {variation['context']}"
-                                ))
-                                if variation['file'] not in affected_files:
-                                    affected_files.append(variation['file'])
-                                    
-                            resolution = ConflictResolution(
-                                description=f"Padronizar nomenclatura para {category}",
-                                action_required="Escolher uma nomenclatura padrão e aplicar consistentemente",
-                                priority=2,
-                                automated=False,
-                                steps=[
-                                    f"Revisar todas as variações: {', '.join(unique_originals)}",
-                                    "Escolher nomenclatura padrão",
-                                    "Atualizar todos os documentos afetados",
-                                    "Validar consistência"
-                                ]
-                            )
-                            
-                            conflicts.append(Conflict(
-                                id=conflict_id,
-                                type=ConflictType.NOMENCLATURE,
-                                severity=ConflictSeverity.MEDIUM,
-                                title=f"Nomenclatura inconsistente: {category}",
-                                description=f"Entidade '{base_entity}' referenciada de {len(unique_originals)} formas diferentes",
-                                evidence=evidence,
-                                affected_files=affected_files,
-                                resolution=resolution,
-                                confidence=max(s[2] for s in similar_groups)
-                            ))
-                            
+        if cache is not None:
+            cache.save()
         return conflicts
         
+    def _nomenclature_group_conflicts(self, category: str, base_entity: str,
+                                      variations: List[Dict[str, Any]]) -> List[Conflict]:
+        """
+        Avalia as grafias de uma entidade numa categoria
+        
+        Args:
+            category: Categoria de nomenclatura
+            base_entity: Entidade normalizada (minúsculas)
+            variations: Ocorrências (grafia original, arquivo, contexto)
+            
+        Returns:
+            Conflito de nomenclatura (lista vazia se as grafias não divergem)
+        """
+        # Verificar se são realmente variações (similaridade)
+        originals = [v['original'] for v in variations]
+        unique_originals = set(originals)
+        
+        if len(unique_originals) > 1:
+            # Calcular similaridade
+            similarity_threshold = 0.8
+            similarity = self._max_similarity(list(unique_originals), similarity_threshold)
+            
+            if similarity is not None:
+                # Criar conflito de nomenclatura
+                conflict_id = hashlib.md5(f"nomenclature_{category}_{base_entity}".encode()).hexdigest()[:8]
+                
+                evidence = []
+                affected_files = []
+                
+                for variation in variations:
+                    evidence.append(ConflictEvidence(
+                        source_file=variation['file'],
+                        line_number=None,
+                        content=variation['original'],
+                        context=f"Categoria: {category}, Contexto: {variation['context']}"
+                    ))
+                    if variation['file'] not in affected_files:
+                        affected_files.append(variation['file'])
+                        
+                resolution = ConflictResolution(
+                    description=f"Padronizar nomenclatura para {category}",
+                    action_required="Escolher uma nomenclatura padrão e aplicar consistentemente",
+                    priority=2,
+                    automated=False,
+                    steps=[
+                        f"Revisar todas as variações: {', '.join(unique_originals)}",
+                        "Escolher nomenclatura padrão",
+                        "Atualizar todos os documentos afetados",
+                        "Validar consistência"
+                    ]
+                )
+                
+                return [Conflict(
+                    id=conflict_id,
+                    type=ConflictType.NOMENCLATURE,
+                    severity=ConflictSeverity.MEDIUM,
+                    title=f"Nomenclatura inconsistente: {category}",
+                    description=f"Entidade '{base_entity}' referenciada de {len(unique_originals)} formas diferentes",
+                    evidence=evidence,
+                    affected_files=affected_files,
+                    resolution=resolution,
+                    confidence=similarity
+                )]
+        return []
+        
     def _detect_dependency_conflicts(self) -> List[Conflict]:
         """
         Detecta conflitos de dependência entre documentos
@@ -607,80 +947,96 @@ class ConflictDetector:
             
         document_summary = self.context_maps['index'].get('document_summary', {})
         
+        cache = self._family_cache('versioning')
+        
         # Coletar informações de versão
         version_info = {}
         
         for doc_path, doc_info in document_summary.items():
-            content = doc_info.get('content', '')
-            
             # Extrair versões mencionadas
-            versions = self._extract_entities(content, self.versioning_patterns)
+            versions = self._document_record(
+                cache, doc_path, doc_info,
+                lambda: self._extract_entities(self._document_content(doc_path), self.versioning_patterns)
+            )
             
             if versions.get('version_numbers'):
-                version_info[doc_path] = {
-                    'versions': versions['version_numbers'],
-                    'compatibility': versions.get('compatibility', []),
-                    'doc_info': doc_info
-                }
+                version_info[doc_path] = versions['version_numbers']
                 
         # Detectar versões incompatíveis
-        for doc_path, info in version_info.items():
-            versions = info['versions']
+        for doc_path, versions in version_info.items():
+            conflicts.extend(self._evaluate_group(
+                cache, ('versioning', self._document_fingerprint(doc_path, document_summary[doc_path])),
+                lambda: self._version_conflicts(doc_path, versions)
+            ))
             
-            # Verificar se há versões conflitantes no mesmo documento
-            unique_versions = set(versions)
-            if len(unique_versions) > 1:
-                # Verificar se são versões incompatíveis
-                version_numbers = []
-                for version in unique_versions:
-                    match = re.search(r'(\d+)\.(\d+)(?:\.(\d+))?', version)
-                    if match:
-                        major = int(match.group(1))
-                        minor = int(match.group(2))
-                        patch = int(match.group(3)) if match.group(3) else 0
-                        version_numbers.append((major, minor, patch, version))
-                        
-                if len(version_numbers) > 1:
-                    version_numbers.sort()
-                    
-                    # Verificar se há quebra de compatibilidade (major version)
-                    major_versions = set(v[0] for v in version_numbers)
-                    if len(major_versions) > 1:
-                        conflict_id = hashlib.md5(f"version_conflict_{doc_path}".encode()).hexdigest()[:8]
-                        
-                        evidence = [ConflictEvidence(
-                            source_file=doc_path,
-                            line_number=None,
-                            content=f"Versões encontradas: {', '.join(unique_versions)}",
-                            context="Versões incompatíveis no mesmo documento"
-                        )]
-                        
-                        resolution = ConflictResolution(
-                            description="Resolver conflito de versões",
-                            action_required="Escolher versão target e atualizar referências",
-                            priority=2,
-                            automated=False,
-                            steps=[
-                                "Identificar versão target do sistema",
-                                "Atualizar todas as referências para versão consistente",
-                                "Documentar estratégia de migração se necessário",
-                                "Validar compatibilidade"
-                            ]
-                        )
-                        
-                        conflicts.append(Conflict(
-                            id=conflict_id,
-                            type=ConflictType.VERSIONING,
-                            severity=ConflictSeverity.HIGH,
-                            title="Versões incompatíveis",
-                            description=f"Documento referencia versões major incompatíveis: {', '.join(unique_versions)}",
-                            evidence=evidence,
-                            affected_files=[doc_path],
-                            resolution=resolution
-                        ))
-                        
+        if cache is not None:
+            cache.save()
         return conflicts
         
+    def _version_conflicts(self, doc_path: str, versions: List[str]) -> List[Conflict]:
+        """
+        Avalia as versões mencionadas num documento
+        
+        Args:
+            doc_path: Documento
+            versions: Versões extraídas do conteúdo
+            
+        Returns:
+            Conflito de versões major incompatíveis (ou lista vazia)
+        """
+        # Verificar se há versões conflitantes no mesmo documento
+        unique_versions = set(versions)
+        if len(unique_versions) > 1:
+            # Verificar se são versões incompatíveis
+            version_numbers = []
+            for version in unique_versions:
+                match = re.search(r'(\d+)\.(\d+)(?:\.(\d+))?', version)
+                if match:
+                    major = int(match.group(1))
+                    minor = int(match.group(2))
+                    patch = int(match.group(3)) if match.group(3) else 0
+                    version_numbers.append((major, minor, patch, version))
+                    
+            if len(version_numbers) > 1:
+                version_numbers.sort()
+                
+                # Verificar se há quebra de compatibilidade (major version)
+                major_versions = set(v[0] for v in version_numbers)
+                if len(major_versions) > 1:
+                    conflict_id = hashlib.md5(f"version_conflict_{doc_path}".encode()).hexdigest()[:8]
+                    
+                    evidence = [ConflictEvidence(
+                        source_file=doc_path,
+                        line_number=None,
+                        content=f"Versões encontradas: {', '.join(unique_versions)}",
+                        context="Versões incompatíveis no mesmo documento"
+                    )]
+                    
+                    resolution = ConflictResolution(
+                        description="Resolver conflito de versões",
+                        action_required="Escolher versão target e atualizar referências",
+                        priority=2,
+                        automated=False,
+                        steps=[
+                            "Identificar versão target do sistema",
+                            "Atualizar todas as referências para versão consistente",
+                            "Documentar estratégia de migração se necessário",
+                            "Validar compatibilidade"
+                        ]
+                    )
+                    
+                    return [Conflict(
+                        id=conflict_id,
+                        type=ConflictType.VERSIONING,
+                        severity=ConflictSeverity.HIGH,
+                        title="Versões incompatíveis",
+                        description=f"Documento referencia versões major incompatíveis: {', '.join(unique_versions)}",
+                        evidence=evidence,
+                        affected_files=[doc_path],
+                        resolution=resolution
+                    )]
+        return []
+        
     def _detect_temporal_conflicts(self) -> List[Conflict]:
         """
         Detecta conflitos temporais (cronológicos)
@@ -695,68 +1051,100 @@ class ConflictDetector:
             
         document_summary = self.context_maps['index'].get('document_summary', {})
         
+        cache = self._family_cache('temporal')
+        
         # Coletar informações temporais
         temporal_info = {}
         
         for doc_path, doc_info in document_summary.items():
-            created_date = doc_info.get('created_date')
-            last_updated = doc_info.get('last_updated')
-            
-            if created_date or last_updated:
-                try:
-                    created = datetime.fromisoformat(created_date) if created_date else None
-                    updated = datetime.fromisoformat(last_updated) if last_updated else None
-                    
-                    temporal_info[doc_path] = {
-                        'created': created,
-                        'updated': updated,
-                        'doc_info': doc_info
-                    }
-                except ValueError:
-                    # Data inválida, ignorar
-                    continue
-                    
-        # Detectar inconsistências temporais
-        for doc_path, info in temporal_info.items():
-            created = info['created']
-            updated = info['updated']
-            
-            # Verificar se data de atualização é anterior à criação
-            if created and updated and updated < created:
-                conflict_id = hashlib.md5(f"temporal_{doc_path}".encode()).hexdigest()[:8]
+            dates = self._document_record(cache, doc_path, doc_info, lambda: self._extract_dates(doc_info))
+            if dates is not None:
+                temporal_info[doc_path] = dates
                 
-                evidence = [ConflictEvidence(
-                    source_file=doc_path,
-                    line_number=None,
-                    content=f"Criado: {created.date()}, Atualizado: {updated.date()}",
-                    context="Data de atualização anterior à criação"
-                )]
-                
-                resolution = ConflictResolution(
-                    description="Corrigir datas inconsistentes",
-                    action_required="Atualizar metadados com datas corretas",
-                    priority=3,
-                    automated=True,
-                    steps=[
-                        "Verificar datas reais no sistema de arquivos",
-                        "Corrigir metadados com datas consistentes",
-                        "Executar validação de metadados"
-                    ]
+        # Detectar inconsistências temporais
+        for doc_path, (created, updated) in temporal_info.items():
+            conflicts.extend(self._evaluate_group(
+                cache, ('temporal', self._document_fingerprint(doc_path, document_summary[doc_path])),
+                lambda: self._temporal_conflicts(
+                    doc_path,
+                    datetime.fromisoformat(created) if created else None,
+                    datetime.fromisoformat(updated) if updated else None
                 )
-                
-                conflicts.append(Conflict(
-                    id=conflict_id,
-                    type=ConflictType.TEMPORAL,
-                    severity=ConflictSeverity.LOW,
-                    title="Inconsistência temporal",
-                    description=f"Data de atualização ({updated.date()}) anterior à criação ({created.date()})",
-                    evidence=evidence,
-                    affected_files=[doc_path],
-                    resolution=resolution
-                ))
-                
+            ))
+            
+        if cache is not None:
+            cache.save()
         return conflicts
         
+    @staticmethod
+    def _extract_dates(doc_info: Dict[str, Any]) -> Optional[List[Optional[str]]]:
+        """
+        Datas de criação e atualização do documento
+        
+        Returns:
+            [criado, atualizado] em ISO (None se ausente) ou None sem datas válidas
+        """
+        created_date = doc_info.get('created_date')
+        last_updated = doc_info.get('last_updated')
+        
+        if created_date or last_updated:
+            try:
+                created = datetime.fromisoformat(created_date) if created_date else None
+                updated = datetime.fromisoformat(last_updated) if last_updated else None
+            except ValueError:
+                # Data inválida, ignorar
+                return None
+            return [created.isoformat() if created else None, updated.isoformat() if updated else None]
+        return None
+        
+    def _temporal_conflicts(self, doc_path: str, created: Optional[datetime],
+                            updated: Optional[datetime]) -> List[Conflict]:
+        """
+        Avalia a cronologia de um documento
+        
+        Args:
+            doc_path: Documento
+            created: Data de criação
+            updated: Data de atualização
+            
+        Returns:
+            Conflito se a atualização é anterior à criação (ou lista vazia)
+        """
+        # Verificar se data de atualização é anterior à criação
+        if created and updated and updated < created:
+            conflict_id = hashlib.md5(f"temporal_{doc_path}".encode()).hexdigest()[:8]
+            
+            evidence = [ConflictEvidence(
+                source_file=doc_path,
+                line_number=None,
+                content=f"Criado: {created.date()}, Atualizado: {updated.date()}",
+                context="Data de atualização anterior à criação"
+            )]
+            
+            resolution = ConflictResolution(
+                description="Corrigir datas inconsistentes",
+                action_required="Atualizar metadados com datas corretas",
+                priority=3,
+                automated=True,
+                steps=[
+                    "Verificar datas reais no sistema de arquivos",
+                    "Corrigir metadados com datas consistentes",
+                    "Executar validação de metadados"
+                ]
+            )
+            
+            return [Conflict(
+                id=conflict_id,
+                type=ConflictType.TEMPORAL,
+                severity=ConflictSeverity.LOW,
+                title="Inconsistência temporal",
+                description=f"Data de atualização ({updated.date()}) anterior à criação ({created.date()})",
+                evidence=evidence,
+                affected_files=[doc_path],
+                resolution=resolution
+            )]
+        return []
+        
     def _detect_data_conflicts(self) -> List[Conflict]:
         """
         Detecta conflitos de dados (informações contraditórias)
@@ -771,15 +1159,15 @@ class ConflictDetector:
             
         document_summary = self.context_maps['index'].get('document_summary', {})
         
+        cache = self._family_cache('data')
+        
         # Coletar informações factuais
         factual_data = defaultdict(list)
         
         for doc_path, doc_info in document_summary.items():
-            content = doc_info.get('content', '')
-            
             # Extrair dados factuais (métricas, configurações, etc.)
-            metrics = re.findall(r'(\w+)[:=]\s*(\d+(?:\.\d+)?)\s*(%|ms|MB|GB|req/s)?', content)
-            configs = re.findall(r'(\w+)[:=]\s*(["\']?)([^"\'\\n]+)\2', content)
+            metrics, configs = self._document_record(cache, doc_path, doc_info,
+                                                     lambda: self._extract_facts(self._document_content(doc_path)))
             
             for metric, value, unit in metrics:
                 factual_data[metric.lower()].append({
@@ -800,61 +1188,92 @@ class ConflictDetector:
         # Detectar valores contraditórios
         for key, values in factual_data.items():
             if len(values) > 1:
-                # Verificar se há valores diferentes para a mesma chave
-                unique_values = set()
-                for v in values:
-                    if v['type'] == 'metric':
-                        unique_values.add((v['value'], v['unit']))
-                    else:
-                        unique_values.add(v['value'])
-                        
-                if len(unique_values) > 1:
-                    conflict_id = hashlib.md5(f"data_conflict_{key}".encode()).hexdigest()[:8]
-                    
-                    evidence = []
-                    affected_files = []
-                    
-                    for v in values:
-                        if v['type'] == 'metric':
-                            content = f"{key}: {v['value']}{v['unit'] or ''}"
-                        else:
-                            content = f"{key}: {v['value']}"
-                            
-                        evidence.append(ConflictEvidence(
-                            source_file=v['file'],
-                            line_number=None,
-                            content=content,
-                            context=f"Tipo: {v['type']}"
-                        ))
-                        
-                        if v['file'] not in affected_files:
-                            affected_files.append(v['file'])
-                            
-                    resolution = ConflictResolution(
-                        description=f"Resolver valor contraditório para {key}",
-                        action_required="Verificar e padronizar valor correto",
-                        priority=2,
-                        automated=False,
-                        steps=[
-                            "Verificar fonte autorizada para o valor",
-                            "Atualizar documentos com valor correto",
-                            "Adicionar referência à fonte quando relevante",
-                            "Validar consistência"
-                        ]
-                    )
+                conflicts.extend(self._evaluate_group(
+                    cache, ('data', key, values),
+                    lambda: self._data_key_conflicts(key, values)
+                ))
+                
+        if cache is not None:
+            cache.save()
+        return conflicts
+        
+    @staticmethod
+    def _extract_facts(content: str) -> List[List[Tuple[str, ...]]]:
+        """
+        Métricas e configurações mencionadas no conteúdo
+        
+        Returns:
+            [métricas (nome, valor, unidade), configurações (nome, aspas, valor)]
+        """
+        metrics = re.findall(r'(\w+)[:=]\s*(\d+(?:\.\d+)?)\s*(%|ms|MB|GB|req/s)?', content)
+        configs = re.findall(r'(\w+)[:=]\s*(["\']?)([^"\'\\n]+)\2', content)
+        return [metrics, configs]
+        
+    def _data_key_conflicts(self, key: str, values: List[Dict[str, Any]]) -> List[Conflict]:
+        """
+        Avalia os valores encontrados para uma chave factual
+        
+        Args:
+            key: Nome da métrica/configuração (minúsculas)
+            values: Ocorrências com valor, unidade, arquivo e tipo
+            
+        Returns:
+            Conflito se há valores diferentes (ou lista vazia)
+        """
+        # Verificar se há valores diferentes para a mesma chave
+        unique_values = set()
+        for v in values:
+            if v['type'] == 'metric':
+                unique_values.add((v['value'], v['unit']))
+            else:
+                unique_values.add(v['value'])
+                
+        if len(unique_values) > 1:
+            conflict_id = hashlib.md5(f"data_conflict_{key}".encode()).hexdigest()[:8]
+            
+            evidence = []
+            affected_files = []
+            
+            for v in values:
+                if v['type'] == 'metric':
+                    content = f"{key}: {v['value']}{v['unit'] or ''}"
+                else:
+                    content = f"{key}: {v['value']}"
                     
-                    conflicts.append(Conflict(
-                        id=conflict_id,
-                        type=ConflictType.DATA,
-                        severity=ConflictSeverity.MEDIUM,
-                        title=f"Dados contraditórios: {key}",
-                        description=f"Valores diferentes para '{key}': {', '.join(str(v) for v in unique_values)}",
-                        evidence=evidence,
-                        affected_files=affected_files,
-                        resolution=resolution
-                    ))
+                evidence.append(ConflictEvidence(
+                    source_file=v['file'],
+                    line_number=None,
+                    content=content,
+                    context=f"Tipo: {v['type']}"
+                ))
+                
+                if v['file'] not in affected_files:
+                    affected_files.append(v['file'])
                     
-        return conflicts
+            resolution = ConflictResolution(
+                description=f"Resolver valor contraditório para {key}",
+                action_required="Verificar e padronizar valor correto",
+                priority=2,
+                automated=False,
+                steps=[
+                    "Verificar fonte autorizada para o valor",
+                    "Atualizar documentos com valor correto",
+                    "Adicionar referência à fonte quando relevante",
+                    "Validar consistência"
+                ]
+            )
+            
+            return [Conflict(
+                id=conflict_id,
+                type=ConflictType.DATA,
+                severity=ConflictSeverity.MEDIUM,
+                title=f"Dados contraditórios: {key}",
+                description=f"Valores diferentes para '{key}': {', '.join(str(v) for v in unique_values)}",
+                evidence=evidence,
+                affected_files=affected_files,
+                resolution=resolution
+            )]
+        return []
         
     def detect_all_conflicts(self) -> List[Conflict]:
         """
@@ -864,27 +1283,21 @@ class ConflictDetector:
             Lista completa de conflitos encontrados
         """
         all_conflicts = []
+        self.detector_timings = {}
+        total_start = time.perf_counter()
         
         logger.info("Iniciando detecção de conflitos...")
         
-        # Executar todas as detecções
-        detection_methods = [
-            ("Nomenclatura", self._detect_nomenclature_conflicts),
-            ("Dependências", self._detect_dependency_conflicts),
-            ("Contexto", self._detect_context_conflicts),
-            ("Versionamento", self._detect_versioning_conflicts),
-            ("Temporal", self._detect_temporal_conflicts),
-            ("Dados", self._detect_data_conflicts)
-        ]
-        
-        for method_name, method in detection_methods:
-            try:
-                logger.info(f"Detectando conflitos de {method_name}...")
-                conflicts = method()
-                all_conflicts.extend(conflicts)
-                logger.info(f"Encontrados {len(conflicts)} conflitos de {method_name}")
-            except Exception as e:
-                logger.error(f"Erro ao detectar conflitos de {method_name}: {e}")
+        # Executar todas as detecções (resultados sempre na ordem das famílias)
+        for key, label, conflicts, elapsed, error in self._run_detector_families():
+            self.detector_timings[key] = round(elapsed, 4)
+            if error is not None:
+                logger.error(f"Erro ao detectar conflitos de {label}: {error}")
+                continue
+            all_conflicts.extend(conflicts)
+            logger.info(f"Encontrados {len(conflicts)} conflitos de {label} ({elapsed * 1000:.0f} ms)")
+            
+        self.detector_timings['total'] = round(time.perf_counter() - total_start, 4)
                 
         # Ordenar por severidade e prioridade
         severity_order = {
@@ -902,6 +1315,55 @@ class ConflictDetector:
         
         return all_conflicts
         
+    def _run_detector_families(self) -> Iterator[Tuple[str, str, List[Conflict], float, Optional[str]]]:
+        """
+        Executa as famílias de detecção, em sequência ou num pool de processos
+        
+        As famílias só leem mapas e conteúdo. Com fork os processos herdam este
+        detector com os mapas já carregados; sem fork cada processo cria o seu
+        no mesmo workspace (os mapas vêm do snapshot). Se o pool quebrar, as
+        famílias restantes rodam neste processo.
+        
+        Yields:
+            (chave, rótulo, conflitos, segundos, erro) na ordem de DETECTOR_FAMILIES
+        """
+        global _worker_detector
+        jobs = min(self.jobs, len(DETECTOR_FAMILIES))
+        
+        if jobs <= 1:
+            for key, label, method_name in DETECTOR_FAMILIES:
+                logger.info(f"Detectando conflitos de {label}...")
+                yield (key, label) + _timed_detector_family(self, method_name)
+            return
+            
+        logger.info(f"⚙️  Detecção paralela: {jobs} processos")
+        if 'fork' in multiprocessing.get_all_start_methods():
+            # Carregar os mapas antes do fork: os processos compartilham as páginas
+            list(self.context_maps)
+            context = multiprocessing.get_context('fork')
+            _worker_detector = self
+        else:
+            context = None
+            
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=context,
+                                     initializer=_init_detector_worker,
+                                     initargs=(self.workspace, self.incremental)) as executor:
+                futures = [executor.submit(_run_detector_family, method_name)
+                           for _, _, method_name in DETECTOR_FAMILIES]
+                for (key, label, _), future in zip(DETECTOR_FAMILIES, futures):
+                    conflicts, elapsed, error = future.result()
+                    yield key, label, conflicts, elapsed, error
+                    done += 1
+        except BrokenProcessPool as e:
+            logger.warning(f"Pool de detecção interrompido ({e}), executando as famílias restantes em sequência")
+            for key, label, method_name in DETECTOR_FAMILIES[done:]:
+                logger.info(f"Detectando conflitos de {label}...")
+                yield (key, label) + _timed_detector_family(self, method_name)
+        finally:
+            _worker_detector = None
+            
     def generate_report(self) -> ConflictReport:
         """
         Gera relatório completo de conflitos
@@ -950,7 +1412,8 @@ class ConflictDetector:
             conflicts_by_severity=conflicts_by_severity,
             conflicts=conflicts,
             analysis_summary=analysis_summary,
-            resolution_plan=resolution_plan
+            resolution_plan=resolution_plan,
+            detector_timings=dict(self.detector_timings)
         )
         
     def print_report(self, report: ConflictReport) -> None:
@@ -986,6 +1449,12 @@ class ConflictDetector:
             for step in report.resolution_plan:
                 print(f"   {step}")
                 
+        # Tempo de cada família de detecção
+        if report.detector_timings:
+            print(f"\n⏱️  TEMPO POR DETECTOR:")
+            for key, seconds in report.detector_timings.items():
+                print(f"   • {key}: {seconds * 1000:.0f} ms")
+                
         # Mostrar conflitos mais críticos
         critical_conflicts = [c for c in report.conflicts if c.severity in [ConflictSeverity.CRITICAL, ConflictSeverity.HIGH]]
         
@@ -1004,6 +1473,12 @@ class ConflictDetector:
 
 def main():
     """Função principal"""
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     import argparse
     
     parser = argparse.ArgumentParser(description='Context Navigator Conflict Detector')
@@ -1017,6 +1492,10 @@ def main():
                        help='Saída em formato JSON')
     parser.add_argument('--resolve', '-r', 
                        help='Tentar resolver conflito por ID')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                       help='Processos para as famílias de detecção (0 = número de CPUs)')
+    parser.add_argument('--incremental', '-i', action='store_true',
+                       help='Reavaliar apenas documentos alterados (cache em .cn_model/cache/conflicts/)')
     
     args = parser.parse_args()
     
@@ -1037,7 +1516,7 @@ def main():
         print("💡 Execute 'cn init' para configurar este diretório")
         return 1
     
-    detector = ConflictDetector()
+    detector = ConflictDetector(jobs=args.jobs, incremental=args.incremental)
     
     if args.resolve:
         print(f"Resolução automática não implementada para ID: {args.resolve}")
@@ -1078,6 +1557,7 @@ def main():
             'conflicts_by_severity': {k.value: v for k, v in report.conflicts_by_severity.items()},
             'analysis_summary': report.analysis_summary,
             'resolution_plan': report.resolution_plan,
+            'detector_timings': report.detector_timings,
             'conflicts': [
                 {
                     'id': c.id,
@@ -5,7 +5,6 @@ Sistema de sugestões inteligente baseado em contexto
 """
 
 import json
-import yaml
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -15,11 +14,16 @@ from collections import defaultdict
 import re
 import argparse
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    from ...core.context_maps import ContextMaps
+    from ...core.content_store import DocumentContents
+except ImportError:
+    # Fallback para execução a partir da instalação (PYTHONPATH = raiz)
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.context_maps import ContextMaps
+    from core.content_store import DocumentContents
+
 logger = logging.getLogger('context_advisor')
 
 @dataclass
@@ -106,18 +110,9 @@ class ContextAdvisor:
         logger.info(f"🌐 Workspace: {current_workspace.name} ({current_workspace.root_path})")
         
     def _load_context_maps(self) -> None:
-        """Carrega mapas de contexto gerados pelo scanner"""
+        """Prepara os mapas gerados pelo scanner (cada mapa é lido no primeiro acesso)"""
         map_files = ['index.yml', 'architecture.yml', 'connections.yml', 'conflicts.yml']
-        
-        for map_file in map_files:
-            map_path = self.output_dir / map_file
-            if map_path.exists():
-                try:
-                    with open(map_path, 'r', encoding='utf-8') as f:
-                        key = map_file.replace('.yml', '')
-                        self.context_maps[key] = yaml.safe_load(f) or {}
-                except Exception as e:
-                    logger.error(f"Erro ao carregar {map_file}: {e}")
+        self.context_maps = ContextMaps(self.output_dir, map_files, empty_as_dict=True, log=logger)
                     
     def _load_document_cache(self) -> None:
         """Carrega cache de documentos processados"""
@@ -126,16 +121,16 @@ class ContextAdvisor:
             
         document_summary = self.context_maps['index'].get('document_summary', {})
         
+        # Corpos vêm do pacote de conteúdo do scanner (disco apenas se desatualizado)
+        contents = DocumentContents(self.output_dir, self.base_path)
+        
         for doc_path, doc_info in document_summary.items():
             if not doc_info or not isinstance(doc_info, dict):
                 continue
                 
             try:
-                full_path = self.base_path / doc_path
-                if full_path.exists():
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
+                content = contents.text(doc_path)
+                if content is not None:
                     self.document_cache[doc_path] = {
                         'info': doc_info,
                         'content': content,
@@ -583,6 +578,12 @@ class ContextAdvisor:
 
 def main():
     """Função principal"""
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     parser = argparse.ArgumentParser(description='Context Navigator Advisor')
     parser.add_argument('--path', '-p', default='.', help='Caminho base do projeto')
     parser.add_argument('--suggestions', '-s', action='store_true', help='Mostrar sugestões contextuais')
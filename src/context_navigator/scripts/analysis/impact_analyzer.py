@@ -5,7 +5,6 @@ Sistema de análise de impacto automática para mudanças em documentos
 """
 
 import json
-import yaml
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -15,11 +14,16 @@ from collections import defaultdict, deque
 import argparse
 import hashlib
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    from ...core.context_maps import ContextMaps
+    from ...core.content_store import DocumentContents
+except ImportError:
+    # Fallback para execução a partir da instalação (PYTHONPATH = raiz)
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.context_maps import ContextMaps
+    from core.content_store import DocumentContents
+
 logger = logging.getLogger('impact_analyzer')
 
 @dataclass
@@ -107,18 +111,9 @@ class ImpactAnalyzer:
         logger.info(f"🌐 Workspace: {current_workspace.name} ({current_workspace.root_path})")
         
     def _load_context_maps(self) -> None:
-        """Carrega mapas de contexto"""
+        """Prepara os mapas de contexto (cada mapa é lido no primeiro acesso)"""
         map_files = ['index.yml', 'connections.yml', 'architecture.yml']
-        
-        for map_file in map_files:
-            map_path = self.output_dir / map_file
-            if map_path.exists():
-                try:
-                    with open(map_path, 'r', encoding='utf-8') as f:
-                        key = map_file.replace('.yml', '')
-                        self.context_maps[key] = yaml.safe_load(f) or {}
-                except Exception as e:
-                    logger.error(f"Erro ao carregar {map_file}: {e}")
+        self.context_maps = ContextMaps(self.output_dir, map_files, empty_as_dict=True, log=logger)
                     
     def _build_document_graph(self) -> None:
         """Constrói grafo de documentos baseado em conexões"""
@@ -194,14 +189,15 @@ class ImpactAnalyzer:
             return changes
             
         document_summary = self.context_maps['index'].get('document_summary', {})
+        contents = DocumentContents(self.output_dir, self.base_path)
         
         for doc_path, doc_info in document_summary.items():
             if not doc_info or not isinstance(doc_info, dict):
                 continue
                 
             try:
-                full_path = self.base_path / doc_path
-                if not full_path.exists():
+                content = contents.text(doc_path)
+                if content is None:
                     # Documento foi deletado
                     if doc_path in self.change_signatures:
                         changes.append(ChangeSignature(
@@ -213,9 +209,6 @@ class ImpactAnalyzer:
                         ))
                     continue
                     
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
                 content_hash = self._calculate_content_hash(content)
                 metadata_hash = self._calculate_metadata_hash(doc_info)
                 
@@ -581,6 +574,12 @@ class ImpactAnalyzer:
 
 def main():
     """Função principal"""
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     parser = argparse.ArgumentParser(description='Context Navigator Impact Analyzer')
     parser.add_argument('--path', '-p', default='.', help='Caminho base do projeto')
     parser.add_argument('--document', '-d', help='Analisar impacto de documento específico')
@@ -5,7 +5,6 @@ Sistema de detecção de padrões e anomalias em documentação
 """
 
 import json
-import yaml
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,11 +15,18 @@ import re
 import argparse
 import statistics
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    from ...core.context_maps import ContextMaps
+    from ...core.content_store import DocumentContents
+    from ...core.serialization import yaml_load
+except ImportError:
+    # Fallback para execução a partir da instalação (PYTHONPATH = raiz)
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.context_maps import ContextMaps
+    from core.content_store import DocumentContents
+    from core.serialization import yaml_load
+
 logger = logging.getLogger('pattern_detector')
 
 @dataclass
@@ -139,7 +145,7 @@ class PatternDetector:
             
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f) or {}
+                self.config = yaml_load(f) or {}
             logger.info(f"Configuração carregada com sucesso de {config_file}")
         except Exception as e:
             logger.error(f"Erro ao carregar configuração: {e}")
@@ -152,21 +158,9 @@ class PatternDetector:
         self.patterns_cache_path = self.context_maps_path / "patterns_cache.json"
             
     def _load_context_maps(self) -> None:
-        """Carrega mapas de contexto"""
+        """Prepara os mapas de contexto (cada mapa é lido no primeiro acesso)"""
         map_files = ['index.yml', 'connections.yml', 'architecture.yml', 'validation.json']
-        
-        for map_file in map_files:
-            map_path = self.context_maps_path / map_file
-            if map_path.exists():
-                try:
-                    with open(map_path, 'r', encoding='utf-8') as f:
-                        key = map_file.replace('.yml', '').replace('.json', '')
-                        if map_file.endswith('.json'):
-                            self.context_maps[key] = json.load(f)
-                        else:
-                            self.context_maps[key] = yaml.safe_load(f) or {}
-                except Exception as e:
-                    logger.error(f"Erro ao carregar {map_file}: {e}")
+        self.context_maps = ContextMaps(self.context_maps_path, map_files, empty_as_dict=True, log=logger)
                     
     def _load_document_cache(self) -> None:
         """Carrega cache de documentos"""
@@ -175,16 +169,16 @@ class PatternDetector:
             
         document_summary = self.context_maps['index'].get('document_summary', {})
         
+        # Texto gravado pelo scanner em content.pack; arquivos alterados depois do scan vêm do disco
+        contents = DocumentContents(self.context_maps_path, self.base_path)
+        
         for doc_path, doc_info in document_summary.items():
             if not doc_info or not isinstance(doc_info, dict):
                 continue
                 
             try:
-                full_path = self.base_path / doc_path
-                if full_path.exists():
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
+                content = contents.text(doc_path)
+                if content is not None:
                     # Extrair métricas básicas
                     lines = content.split('\n')
                     words = content.split()
@@ -752,6 +746,12 @@ class PatternDetector:
 
 def main():
     """Função principal"""
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     parser = argparse.ArgumentParser(description='Context Navigator Pattern Detector')
     parser.add_argument('--path', '-p', default='.', help='Caminho base do projeto')
     parser.add_argument('--patterns', action='store_true', help='Detectar padrões')
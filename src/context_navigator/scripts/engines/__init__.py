@@ -3,12 +3,13 @@ Context Navigator - Processing Engines
 Engines essenciais de processamento (scanner, context engine)
 """
 
-from .context_scanner import ContextScanner
+from .context_scanner import ContextScanner, ScanResult, ScanError, WorkspaceNotFoundError, scan_workspace
 from .context_engine import ContextEngine
 
 # Clean import - WorkspaceManager available when needed via context
 
-__all__ = ['ContextScanner', 'ContextEngine']
+__all__ = ['ContextScanner', 'ContextEngine', 'ScanResult', 'ScanError',
+           'WorkspaceNotFoundError', 'scan_workspace']
 
 # Documentação dos engines
 ENGINES = {
@@ -27,22 +27,51 @@ contextos e sugere melhorias baseado na análise de documentos.
 
 import os
 import sys
-import yaml
 import json
 import re
+import hashlib
+import heapq
+import contextlib
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    from ...core.context_maps import ContextMaps
+    from ...core.serialization import yaml_load
+    from ...core.result_cache import ResultCache, hash_key
+    from ...core.file_walker import IgnoreRules, walk_files
+    from ...core.workspace_manager import Workspace
+except ImportError:
+    # Fallback para execução a partir da instalação (PYTHONPATH = raiz)
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.context_maps import ContextMaps
+    from core.serialization import yaml_load
+    from core.result_cache import ResultCache, hash_key
+    from core.file_walker import IgnoreRules, walk_files
+    from core.workspace_manager import Workspace
+
 logger = logging.getLogger('context_engine')
 
+# Mapas lidos pela engine (em .cn_model/)
+CONTEXT_MAP_FILES = ['index.yml', 'component-map.yml', 'context-map/index.yml']
+
+# Incrementar ao mudar regras de análise que não estão nas tabelas de padrões
+ENGINE_RULES_VERSION = 1
+
+# doc_type atual -> (tipo do alvo, pontos, tipo de conexão, justificativa)
+CONNECTION_TYPE_RULES = {
+    'decision': ('architecture', 3, 'impacts', 'decisão impacta arquitetura'),
+    'process': ('reference', 2, 'references', 'processo referencia documentação'),
+    'analysis': ('decision', 3, 'impacts', 'análise pode gerar decisões')
+}
+
 # @cn:class business-entity
 # @cn:responsibility data-structure
 # @cn:purpose "Estrutura de dados para resultado de análise de conteúdo"
@@ -95,6 +124,110 @@ class ImprovementSuggestion:
     priority: str
     action: str
 
+class _KeywordAutomaton:
+    """
+    Autômato Aho-Corasick (DFA completo) para contar vários padrões numa única passada
+    
+    As contagens seguem str.count: ocorrências não sobrepostas de cada padrão.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = sorted(set(p for p in patterns if p))
+        
+        # Trie
+        goto = [{}]
+        outputs = [[]]
+        for pattern in self.patterns:
+            node = 0
+            for char in pattern:
+                if char not in goto[node]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[node][char] = len(goto) - 1
+                node = goto[node][char]
+            outputs[node].append((pattern, len(pattern)))
+            
+        # Links de falha em largura, já resolvidos em transições completas
+        self.transitions = [dict(edges) for edges in goto]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            outputs[node] = outputs[node] + outputs[fail[node]]
+            for char, target in self.transitions[fail[node]].items():
+                if char not in goto[node] and node != 0:
+                    self.transitions[node][char] = target
+            for char, child in goto[node].items():
+                fail[child] = self.transitions[fail[node]].get(char, 0) if node else 0
+                queue.append(child)
+        self.outputs = [tuple(out) for out in outputs]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Conta todos os padrões em uma passada pelo texto
+        
+        Args:
+            text: Texto (já normalizado pelo chamador)
+            
+        Returns:
+            Ocorrências não sobrepostas por padrão
+        """
+        counts = dict.fromkeys(self.patterns, 0)
+        last_end = dict.fromkeys(self.patterns, 0)
+        transitions = self.transitions
+        outputs = self.outputs
+        node = 0
+        position = 0
+        for char in text:
+            position += 1
+            node = transitions[node].get(char, 0)
+            if outputs[node]:
+                for pattern, length in outputs[node]:
+                    if position - length >= last_end[pattern]:
+                        counts[pattern] += 1
+                        last_end[pattern] = position
+        return counts
+
+
+def extract_metadata(content: str) -> Dict[str, Any]:
+    """
+    Metadados do front matter YAML (simplificado)
+    
+    Args:
+        content: Texto completo do documento
+        
+    Returns:
+        Metadados ou {} se ausentes/inválidos
+    """
+    metadata = {}
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            try:
+                metadata = yaml_load(parts[1]) or {}
+            except:
+                pass
+    return metadata
+
+
+# Engine de cada processo do modo lote (mapas e padrões carregados uma vez)
+_batch_engine = None
+
+
+def _init_batch_worker(workspace: Workspace, use_cache: bool) -> None:
+    """Cria a engine do processo do pool no workspace já resolvido pelo processo principal"""
+    global _batch_engine
+    logging.disable(logging.INFO)
+    # stdout é o fluxo JSON do lote: mensagens de inicialização vão para stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        _batch_engine = ContextEngine(use_cache=use_cache, workspace=workspace)
+
+
+def _analyze_batch_file(file_path: str) -> Dict[str, Any]:
+    """Analisa um arquivo com a engine do processo (executada no pool)"""
+    return _batch_engine.analyze_file(file_path)
+
+
 # @cn:class service
 # @cn:responsibility context-processing
 # @cn:pattern singleton
@@ -106,20 +239,30 @@ class ContextEngine:
     # @cn:function core
     # @cn:process initialization
     # @cn:step 1
-    def __init__(self, base_path: str = "."):
+    def __init__(self, base_path: str = ".", use_cache: bool = True,
+                 workspace: Optional[Workspace] = None):
         """
         Inicializa a engine
         
         Args:
             base_path: Caminho base do projeto
+            use_cache: Reaproveita análises em .cn_model/cache/engine/
+            workspace: Workspace explícito (dispensa a detecção e o acesso ao registry)
         """
         self.base_path = Path(base_path)
         self.config = {}
         self.documents = {}
         self.context_maps = {}
         
-        # NOVO: Usar WorkspaceManager para detectar workspace
-        self._init_with_workspace_manager()
+        if workspace is not None:
+            # Processos do lote: workspace resolvido pelo processo principal
+            self._init_workspace(workspace)
+        else:
+            # NOVO: Usar WorkspaceManager para detectar workspace
+            self._init_with_workspace_manager()
+        
+        # Análises anteriores indexadas por hash de conteúdo/metadados/regras
+        self.result_cache = ResultCache(self.output_dir / 'cache' / 'engine') if use_cache else None
         
         # Carregar dados de contexto
         self._load_context_maps()
@@ -147,15 +290,18 @@ class ContextEngine:
             logger.error("💡 Execute 'cn init' para configurar este diretório")
             sys.exit(1)
         
-        # Configurar paths baseado no workspace
-        self.workspace = current_workspace
-        self.base_path = current_workspace.root_path
-        self.output_dir = current_workspace.root_path / ".cn_model"
+        self._init_workspace(current_workspace)
+        
+    def _init_workspace(self, workspace: Workspace) -> None:
+        """Configura paths e configuração a partir de um workspace"""
+        self.workspace = workspace
+        self.base_path = workspace.root_path
+        self.output_dir = workspace.root_path / ".cn_model"
         
         # Configuração vem do workspace
-        self.config = current_workspace.configuration
+        self.config = workspace.configuration
         
-        logger.info(f"🌐 Workspace: {current_workspace.name} ({current_workspace.root_path})")
+        logger.info(f"🌐 Workspace: {workspace.name} ({workspace.root_path})")
         
     # @cn:function integration
     # @cn:process configuration-loading
@@ -170,27 +316,27 @@ class ContextEngine:
     # @cn:directory-dependency .context-map/
     # @cn:depends-on configuration
     def _load_context_maps(self) -> None:
-        """Carrega mapas de contexto existentes"""
+        """Prepara os mapas de contexto (cada mapa é lido no primeiro acesso)"""
         # Usar arquitetura workspace: mapas ficam em .cn_model/
         context_maps_path = self.output_dir
-        map_files = ['index.yml', 'component-map.yml', 'context-map/index.yml']
         
         if not context_maps_path.exists():
             logger.warning("Mapas de contexto não encontrados")
             return
             
-        # Carregar mapas principais
-        for map_file in map_files:
-            file_path = context_maps_path / map_file
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        map_name = map_file.replace('.yml', '')
-                        self.context_maps[map_name] = yaml.safe_load(f)
-                    logger.debug(f"Mapa carregado: {map_file}")
-                except Exception as e:
-                    logger.warning(f"Erro ao carregar {map_file}: {e}")
-                    
+        self.context_maps = ContextMaps(context_maps_path, CONTEXT_MAP_FILES, log=logger)
+        
+    def _maps_fingerprint(self) -> List[List[Any]]:
+        """Tamanho e mtime atuais dos mapas (sugestões de conexão dependem deles)"""
+        fingerprint = []
+        for map_file in CONTEXT_MAP_FILES:
+            try:
+                stat = (self.output_dir / map_file).stat()
+                fingerprint.append([map_file, stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                pass
+        return fingerprint
+        
     def _init_content_patterns(self) -> None:
         """Inicializa padrões para análise de conteúdo"""
         # Padrões para detecção de tipo de documento
@@ -237,6 +383,26 @@ class ContextEngine:
             'ui': ['component', 'view', 'page', 'interface', 'frontend', 'react']
         }
         
+        # Todos os padrões acima num único autômato (entidades comparadas em minúsculas)
+        automaton_patterns = []
+        for patterns in self.template_patterns.values():
+            automaton_patterns.extend(patterns['keywords'])
+            automaton_patterns.extend(entity.lower() for entity in patterns['entities'])
+            automaton_patterns.extend(patterns['structures'])
+        for keywords in self.context_patterns.values():
+            automaton_patterns.extend(keywords)
+        self.keyword_automaton = _KeywordAutomaton(automaton_patterns)
+        self._last_pattern_counts = (None, {})
+        self.rules_hash = hash_key(ENGINE_RULES_VERSION, self.template_patterns, self.context_patterns)
+        
+    def _pattern_counts(self, content_lower: str) -> Dict[str, int]:
+        """Contagens de todos os padrões (memoizadas para o último conteúdo analisado)"""
+        last_content, counts = self._last_pattern_counts
+        if last_content != content_lower:
+            counts = self.keyword_automaton.count(content_lower)
+            self._last_pattern_counts = (content_lower, counts)
+        return counts
+        
     def analyze_content(self, content: str) -> ContentAnalysis:
         """
         Analisa conteúdo de texto para extrair características
@@ -248,19 +414,20 @@ class ContextEngine:
             Análise do conteúdo
         """
         content_lower = content.lower()
+        counts = self._pattern_counts(content_lower)
         
         # Extrair palavras-chave
         keywords = []
         for template_type, patterns in self.template_patterns.items():
             for keyword in patterns['keywords']:
-                if keyword in content_lower:
+                if counts[keyword]:
                     keywords.append(keyword)
                     
         # Extrair entidades técnicas
         entities = []
         for template_type, patterns in self.template_patterns.items():
             for entity in patterns['entities']:
-                if entity.lower() in content_lower:
+                if counts[entity.lower()]:
                     entities.append(entity)
                     
         # Calcular score de complexidade baseado em indicadores
@@ -280,9 +447,9 @@ class ContextEngine:
         for template_type, patterns in self.template_patterns.items():
             score = 0
             for keyword in patterns['keywords']:
-                score += content_lower.count(keyword)
+                score += counts[keyword]
             for entity in patterns['entities']:
-                score += content_lower.count(entity.lower())
+                score += counts[entity.lower()]
             purpose_scores[template_type] = score
             
         purpose = max(purpose_scores.keys(), key=lambda x: purpose_scores[x]) if purpose_scores else 'unknown'
@@ -292,7 +459,7 @@ class ContextEngine:
         # Determinar domínio
         domain_scores = {}
         for context_type, keywords in self.context_patterns.items():
-            score = sum(content_lower.count(keyword) for keyword in keywords)
+            score = sum(counts[keyword] for keyword in keywords)
             domain_scores[context_type] = score
             
         domain = max(domain_scores.keys(), key=lambda x: domain_scores[x]) if domain_scores else 'core'
@@ -332,6 +499,7 @@ class ContextEngine:
                 
         # Calcular scores para cada template
         template_scores = {}
+        counts = self._pattern_counts(content.lower())
         
         for template_type, patterns in self.template_patterns.items():
             score = 0
@@ -339,19 +507,19 @@ class ContextEngine:
             # Score baseado em keywords
             keyword_score = 0
             for keyword in patterns['keywords']:
-                keyword_score += content.lower().count(keyword)
+                keyword_score += counts[keyword]
             score += keyword_score * 2
             
             # Score baseado em entidades
             entity_score = 0
             for entity in patterns['entities']:
-                entity_score += content.lower().count(entity.lower())
+                entity_score += counts[entity.lower()]
             score += entity_score * 3
             
             # Score baseado em estruturas (headers)
             structure_score = 0
             for structure in patterns['structures']:
-                if structure in content.lower():
+                if counts[structure]:
                     structure_score += 1
             score += structure_score * 5
             
@@ -448,26 +616,32 @@ class ContextEngine:
         Returns:
             Lista de sugestões de conexão
         """
-        suggestions = []
-        
         if not self.context_maps.get('index'):
-            return suggestions
+            return []
             
         current_module = metadata.get('module', '')
         current_context_type = metadata.get('context_type', '')
         current_doc_type = metadata.get('doc_type', '')
         
-        # Buscar documentos relacionados nos context maps
-        document_summary = self.context_maps['index'].get('document_summary', {})
+        index = self._connection_index()
+        type_rule = CONNECTION_TYPE_RULES.get(current_doc_type) if isinstance(current_doc_type, str) else None
         
-        for doc_path, doc_info in document_summary.items():
-            if doc_path == metadata.get('path', ''):
-                continue  # Skip self
-                
-            # Verificar se doc_info é válido
-            if not doc_info or not isinstance(doc_info, dict):
-                continue
-                
+        # Palavras de títulos presentes no conteúdo (uma busca por palavra distinta)
+        content_lower = content.lower()
+        mentioned = {word for word in index['by_title_word'] if word in content_lower}
+        
+        # Só documentos que compartilham alguma chave podem somar pontos
+        candidates = set(self._index_lookup(index['by_module'], current_module))
+        candidates.update(self._index_lookup(index['by_context_type'], current_context_type))
+        if type_rule:
+            candidates.update(index['by_type'].get(type_rule[0], ()))
+        for word in mentioned:
+            candidates.update(index['by_title_word'][word])
+        candidates.discard(metadata.get('path', ''))  # Skip self
+        
+        scored = []
+        for doc_path in candidates:
+            doc_info = index['documents'][doc_path]
             connection_score = 0
             connection_type = 'relates_to'
             reasoning_parts = []
@@ -483,48 +657,86 @@ class ContextEngine:
                 reasoning_parts.append('mesmo contexto')
                 
             # Padrões específicos de dependência
-            if current_doc_type == 'decision' and doc_info.get('type') == 'architecture':
-                connection_score += 3
-                connection_type = 'impacts'
-                reasoning_parts.append('decisão impacta arquitetura')
+            if type_rule and doc_info.get('type') == type_rule[0]:
+                connection_score += type_rule[1]
+                connection_type = type_rule[2]
+                reasoning_parts.append(type_rule[3])
                 
-            if current_doc_type == 'process' and doc_info.get('type') == 'reference':
-                connection_score += 2
-                connection_type = 'references'
-                reasoning_parts.append('processo referencia documentação')
-                
-            if current_doc_type == 'analysis' and doc_info.get('type') == 'decision':
-                connection_score += 3
-                connection_type = 'impacts'
-                reasoning_parts.append('análise pode gerar decisões')
-                
-            # Análise de conteúdo para referências implícitas
-            doc_title = doc_info.get('title') or ''
-            if doc_title:
-                title_words = doc_title.lower().split()
-                content_lower = content.lower()
-                
-                for word in title_words:
-                    if len(word) > 3 and word in content_lower:
-                        connection_score += 1
-                        reasoning_parts.append(f"menciona '{word}'")
-                        
+            # Referências implícitas: palavras do título mencionadas no conteúdo
+            for word in index['title_words'][doc_path]:
+                if word in mentioned:
+                    connection_score += 1
+                    reasoning_parts.append(f"menciona '{word}'")
+                    
             # Só sugerir se score >= 2
             if connection_score >= 2:
-                confidence = min(connection_score / 5.0, 1.0)
-                reasoning = "Sugestão baseada em: " + ", ".join(reasoning_parts)
+                scored.append((connection_score, index['positions'][doc_path], doc_path,
+                               connection_type, reasoning_parts))
                 
-                suggestions.append(ConnectionSuggestion(
-                    target_document=doc_path,
-                    connection_type=connection_type,
-                    confidence=confidence,
-                    reasoning=reasoning
-                ))
+        # Top 5 por confiança (empate: ordem do índice)
+        top = heapq.nsmallest(5, scored, key=lambda item: (-min(item[0] / 5.0, 1.0), item[1]))
+        return [
+            ConnectionSuggestion(
+                target_document=doc_path,
+                connection_type=connection_type,
+                confidence=min(connection_score / 5.0, 1.0),
+                reasoning="Sugestão baseada em: " + ", ".join(reasoning_parts)
+            )
+            for connection_score, _, doc_path, connection_type, reasoning_parts in top
+        ]
+        
+    def _connection_index(self) -> Dict[str, Any]:
+        """
+        Índice invertido do document_summary para suggest_connections
+        
+        Reconstruído apenas quando o mapa 'index' carregado muda.
+        
+        Returns:
+            Documentos por módulo, context_type, tipo e palavra do título
+        """
+        document_summary = self.context_maps['index'].get('document_summary', {})
+        cached = getattr(self, '_connection_index_cache', None)
+        if cached is not None and cached[0] is document_summary:
+            return cached[1]
+            
+        index = {
+            'documents': {},
+            'positions': {},
+            'title_words': {},
+            'by_module': defaultdict(list),
+            'by_context_type': defaultdict(list),
+            'by_type': defaultdict(list),
+            'by_title_word': defaultdict(set)
+        }
+        for position, (doc_path, doc_info) in enumerate(document_summary.items()):
+            # Verificar se doc_info é válido
+            if not doc_info or not isinstance(doc_info, dict):
+                continue
                 
-        # Ordenar por confiança
-        suggestions.sort(key=lambda x: x.confidence, reverse=True)
+            index['documents'][doc_path] = doc_info
+            index['positions'][doc_path] = position
+            for field, key in (('by_module', 'module'), ('by_context_type', 'context_type'), ('by_type', 'type')):
+                try:
+                    index[field][doc_info.get(key)].append(doc_path)
+                except TypeError:
+                    pass  # Valor não hashable nunca é igual ao dos metadados atuais
+                    
+            doc_title = doc_info.get('title') or ''
+            title_words = [word for word in doc_title.lower().split() if len(word) > 3] if doc_title else []
+            index['title_words'][doc_path] = title_words
+            for word in title_words:
+                index['by_title_word'][word].add(doc_path)
+                
+        self._connection_index_cache = (document_summary, index)
+        return index
         
-        return suggestions[:5]  # Top 5 sugestões
+    @staticmethod
+    def _index_lookup(index: Dict[Any, List[str]], key: Any) -> List[str]:
+        """Documentos do índice para a chave (vazio se não hashable)"""
+        try:
+            return index.get(key, [])
+        except TypeError:
+            return []
         
     def suggest_improvements(self, metadata: Dict[str, Any], content: str) -> List[ImprovementSuggestion]:
         """
@@ -688,6 +900,106 @@ class ContextEngine:
         Returns:
             Análise completa com recomendações
         """
+        if self.result_cache is None:
+            return self._analyze_document(file_path, content, metadata)
+            
+        cache_key = self._analysis_cache_key(file_path, content, metadata)
+        analysis = self.result_cache.get(cache_key)
+        if analysis is None:
+            analysis = self._analyze_document(file_path, content, metadata)
+            self.result_cache.put(cache_key, analysis)
+        return analysis
+        
+    def analyze_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Lê o arquivo, extrai metadados e executa analyze_document
+        
+        Args:
+            file_path: Caminho do documento
+            
+        Returns:
+            Análise completa ou {'file_path', 'error'} se a leitura/análise falhar
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            return self.analyze_document(str(file_path), content, extract_metadata(content))
+        except Exception as e:
+            return {'file_path': str(file_path), 'error': str(e)}
+            
+    def collect_documents(self, paths: Iterable[str]) -> List[str]:
+        """
+        Expande diretórios em documentos .md (respeitando .cnignore)
+        
+        Args:
+            paths: Arquivos e/ou diretórios
+            
+        Returns:
+            Arquivos na ordem dada, diretórios expandidos em ordem alfabética
+        """
+        rules = IgnoreRules.load(self.base_path)
+        files = []
+        for path in paths:
+            if Path(path).is_dir():
+                files.extend(sorted(entry.path for entry in walk_files(path, rules, suffixes=('.md',))))
+            else:
+                files.append(str(path))
+        return files
+        
+    def analyze_corpus(self, files: Iterable[str], jobs: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Analisa vários documentos com mapas e padrões carregados uma vez
+        
+        Args:
+            files: Arquivos a analisar
+            jobs: Processos (0 = número de CPUs; cada processo carrega sua engine)
+            
+        Yields:
+            Análise de cada arquivo, na ordem de entrada
+        """
+        files = list(files)
+        jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        jobs = min(jobs, len(files))
+        if jobs <= 1:
+            for file_path in files:
+                yield self.analyze_file(file_path)
+            return
+            
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                                     initargs=(self.workspace, self.result_cache is not None)) as executor:
+                chunksize = max(1, len(files) // (jobs * 4))
+                for analysis in executor.map(_analyze_batch_file, files, chunksize=chunksize):
+                    yield analysis
+                    done += 1
+        except BrokenProcessPool as e:
+            # Processo do pool morreu: os arquivos restantes viram erros, o lote continua válido
+            logger.error(f"Pool do lote interrompido: {e}")
+            for file_path in files[done:]:
+                yield {'file_path': str(file_path), 'error': f"Processo do lote encerrado: {e}"}
+            
+    def _analysis_cache_key(self, file_path: str, content: str, metadata: Dict[str, Any]) -> str:
+        """
+        Chave da análise: tudo de que analyze_document depende
+        
+        Além de conteúdo, metadados e regras entram o caminho (recommend_context),
+        os campos obrigatórios da config, o estado dos mapas (suggest_connections)
+        e a data atual (idade de last_updated).
+        """
+        content_hash = hashlib.sha1(content.encode('utf-8', 'surrogatepass')).hexdigest()
+        return hash_key(
+            self.rules_hash,
+            content_hash,
+            hash_key(metadata),
+            file_path,
+            self.config.get('metadata', {}).get('required_fields', {}),
+            self._maps_fingerprint(),
+            datetime.now().date().isoformat()
+        )
+        
+    def _analyze_document(self, file_path: str, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Análise completa sem cache (ver analyze_document)"""
         content_analysis = self.analyze_content(content)
         template_rec = self.recommend_template(content, metadata)
         context_rec = self.recommend_context(content, file_path, metadata)
@@ -772,6 +1084,12 @@ class ContextEngine:
 
 def main():
     """Função principal para teste da engine"""
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     import argparse
     
     parser = argparse.ArgumentParser(description='Context Navigator Engine')
@@ -781,10 +1099,35 @@ def main():
                        help='Analisar arquivo específico')
     parser.add_argument('--patterns', action='store_true',
                        help='Detectar padrões gerais')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorar o cache de análises (.cn_model/cache/engine)')
+    parser.add_argument('--batch', '-b', nargs='*', metavar='PATH',
+                       help='Modo lote: analisa arquivos/diretórios e emite um JSON por linha')
+    parser.add_argument('--files-from', metavar='FILE',
+                       help='Modo lote: lista de arquivos, um por linha (- = stdin)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                       help='Processos no modo lote (0 = número de CPUs)')
     
     args = parser.parse_args()
+    batch_mode = args.batch is not None or bool(args.files_from)
     
-    engine = ContextEngine(args.path)
+    # No modo lote stdout é reservado ao fluxo JSON
+    with contextlib.redirect_stdout(sys.stderr if batch_mode else sys.stdout):
+        engine = ContextEngine(args.path, use_cache=not args.no_cache)
+    
+    if batch_mode:
+        paths = list(args.batch or [])
+        if args.files_from:
+            stream = sys.stdin if args.files_from == '-' else open(args.files_from, 'r', encoding='utf-8')
+            with stream:
+                paths.extend(line.strip() for line in stream if line.strip())
+                
+        failed = 0
+        for analysis in engine.analyze_corpus(engine.collect_documents(paths), jobs=args.jobs):
+            if 'error' in analysis:
+                failed += 1
+            print(json.dumps(analysis, ensure_ascii=False), flush=True)
+        return 1 if failed else 0
     
     if args.patterns:
         patterns = engine.detect_patterns()
@@ -797,21 +1140,14 @@ def main():
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 
-            # Extrair metadados (simplificado)
-            metadata = {}
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    try:
-                        metadata = yaml.safe_load(parts[1]) or {}
-                    except:
-                        pass
-                        
+            metadata = extract_metadata(content)
             analysis = engine.analyze_document(str(file_path), content, metadata)
             print(f"\n=== ANÁLISE DE {file_path} ===")
             print(json.dumps(analysis, indent=2, ensure_ascii=False))
         else:
             print(f"Arquivo não encontrado: {file_path}")
+            
+    return 0
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
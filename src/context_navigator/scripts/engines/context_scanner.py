@@ -23,21 +23,627 @@ Lê documentos da pasta metodológica, valida metadados e gera context maps
 
 import os
 import sys
-import yaml
 import json
 import re
+import time
+import hashlib
+import heapq
+import contextlib
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
 import logging
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    from ...core.context_snapshot import SNAPSHOT_FILENAME, encode_snapshot
+    from ...core.content_store import ContentStoreWriter
+    from ...core.serialization import (YAMLError, yaml_load, yaml_dump, atomic_write,
+                                       MetadataJSONEncoder, metadata_object_hook)
+    from ...core.file_walker import IgnoreRules, walk_files
+    from ...core.template_cache import TemplateCache
+    from ...core.workspace_manager import Workspace
+except ImportError:
+    # Execução como script/módulo a partir da instalação (PYTHONPATH = raiz)
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.context_snapshot import SNAPSHOT_FILENAME, encode_snapshot
+    from core.content_store import ContentStoreWriter
+    from core.serialization import (YAMLError, yaml_load, yaml_dump, atomic_write,
+                                    MetadataJSONEncoder, metadata_object_hook)
+    from core.file_walker import IgnoreRules, walk_files
+    from core.template_cache import TemplateCache
+    from core.workspace_manager import Workspace
+
+# Logging do módulo (a configuração global fica em main())
 logger = logging.getLogger('context_scanner')
 
+# Manifest do escaneamento incremental (fica em .cn_model/)
+MANIFEST_FILENAME = 'scan-manifest.json'
+MANIFEST_VERSION = 1
+
+# Campos voláteis do escaneamento ficam fora dos mapas
+SCAN_INFO_FILENAME = 'scan-info.json'
+
+# Versão do parse gravado no cache global de templates (alterar invalida o cache)
+TEMPLATE_PARSER_ID = 'context-scanner/1'
+
+
+def _read_document(file_path: str, known_hash: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Lê e parseia um documento (também executada nos processos do pool)
+    
+    Args:
+        file_path: Caminho absoluto do arquivo
+        known_hash: Hash registrado no manifest para o arquivo
+        
+    Returns:
+        Dicionário com metadados, conteúdo, texto completo, hash e tempos de
+        leitura/parse, 'unchanged' quando o hash coincide com known_hash, ou
+        'error' se a leitura falhar
+    """
+    start = time.perf_counter()
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception as e:
+        return {'error': str(e)}
+        
+    content_hash = hashlib.sha1(content.encode('utf-8')).hexdigest()
+    read_time = time.perf_counter() - start
+    if known_hash == content_hash:
+        return {'unchanged': True, 'content_hash': content_hash}
+        
+    start = time.perf_counter()
+    parsed = _parse_document_text(content, content_hash)
+    parsed['text'] = content
+    parsed['read_time'] = read_time
+    parsed['parse_time'] = time.perf_counter() - start
+    return parsed
+
+
+def _parse_document_text(content: str, content_hash: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extrai metadados e corpo do texto de um documento
+    
+    Args:
+        content: Texto completo do documento
+        content_hash: sha1 do texto (calculado se ausente)
+        
+    Returns:
+        Dicionário com metadados, conteúdo sem front matter e hash
+    """
+    if content_hash is None:
+        content_hash = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        
+    front_matter, content_without_fm = ContextScanner._extract_front_matter(content)
+    inline_metadata = ContextScanner._extract_inline_metadata(content)
+    
+    return {
+        # Combinar metadados (front matter tem prioridade)
+        'metadata': {**inline_metadata, **front_matter},
+        'content': content_without_fm,
+        'content_hash': content_hash
+    }
+
+class _ScanAggregator:
+    """Acumula, documento a documento, os dados de todos os mapas e do grafo de conflitos"""
+
+    def __init__(self):
+        self.total_documents = 0
+        self.documents_with_errors = 0
+        
+        # index.yml
+        self.type_distribution = {}
+        self.context_distribution = {}
+        self.document_summary = {}
+        
+        # architecture.yml
+        self.hierarchical = {}
+        self.specialized = {}
+        self.modules = {}
+        
+        # connections.yml
+        self.graph = {}
+        self.connection_types = {}
+        self.strong_coupling = []
+        self.weak_coupling = []
+        self.isolated_components = []
+        
+        # validation.json
+        self.errors_by_document = {}
+        self.validation_details = []
+        
+        # Entradas da detecção de conflitos
+        self.component_refs = {}
+        self.referenced_docs = set()
+        self.has_outbound = {}
+        self.dependencies = {}
+
+    def add(self, doc_path: str, doc_data: Dict[str, Any]) -> None:
+        """Incorpora um documento (metadados e erros; o corpo não é usado)"""
+        metadata = doc_data['metadata']
+        errors = doc_data['validation_errors']
+        self.total_documents += 1
+        
+        doc_type = metadata.get('doc_type')
+        title = metadata.get('title')
+        context_level = metadata.get('context_level')
+        context_type = metadata.get('context_type')
+        module = metadata.get('module')
+        
+        # index.yml
+        type_key = metadata.get('doc_type', 'unknown')
+        self.type_distribution[type_key] = self.type_distribution.get(type_key, 0) + 1
+        context_key = metadata.get('context_level', 'unknown')
+        self.context_distribution[context_key] = self.context_distribution.get(context_key, 0) + 1
+        
+        self.document_summary[doc_path] = {
+            'type': doc_type,
+            'title': title,
+            'context_level': context_level,
+            'context_type': context_type,
+            'module': module,
+            'status': metadata.get('status'),
+            'last_updated': metadata.get('last_updated'),
+            'has_errors': len(errors) > 0
+        }
+        
+        # architecture.yml
+        if context_level:
+            self.hierarchical.setdefault(context_level, []).append({
+                'path': doc_data['path'],
+                'title': title,
+                'type': doc_type,
+                'module': module
+            })
+        if context_type:
+            self.specialized.setdefault(context_type, []).append({
+                'path': doc_data['path'],
+                'title': title,
+                'type': doc_type,
+                'module': module
+            })
+        if module:
+            self.modules.setdefault(module, []).append({
+                'path': doc_data['path'],
+                'title': title,
+                'type': doc_type,
+                'context_level': context_level,
+                'context_type': context_type
+            })
+            
+        # connections.yml
+        connections = metadata.get('connections', {})
+        self.graph[doc_path] = connections
+        
+        total_connections = 0
+        for conn_type, targets in connections.items():
+            self.connection_types[conn_type] = self.connection_types.get(conn_type, 0) + len(targets)
+            total_connections += len(targets)
+            
+        if total_connections >= 3:
+            self.strong_coupling.append({
+                'document': doc_path,
+                'connection_count': total_connections
+            })
+        elif total_connections >= 1:
+            self.weak_coupling.append({
+                'document': doc_path,
+                'connection_count': total_connections
+            })
+        else:
+            self.isolated_components.append(doc_path)
+            
+        # validation.json
+        if errors:
+            self.documents_with_errors += 1
+            self.errors_by_document[doc_path] = errors
+        self.validation_details.append({
+            'document': doc_path,
+            'valid': len(errors) == 0,
+            'error_count': len(errors),
+            'errors': errors
+        })
+        
+        # Referências, arestas depends_on e saídas para _detect_conflicts
+        self.has_outbound[doc_path] = False
+        dependencies = {}
+        for conn_type, targets in (connections if isinstance(connections, dict) else {}).items():
+            if not isinstance(targets, list):
+                continue
+            if targets:
+                self.has_outbound[doc_path] = True
+            for target in targets:
+                if not isinstance(target, str):
+                    continue
+                self.component_refs.setdefault(target, []).append([doc_path, conn_type])
+                self.referenced_docs.add(target)
+                if conn_type == 'depends_on':
+                    dependencies[target] = None
+        self.dependencies[doc_path] = list(dependencies)
+
+    def dependency_graph(self) -> Dict[str, List[str]]:
+        """Arestas depends_on restritas a documentos escaneados"""
+        return {
+            doc_path: [dep for dep in deps if dep in self.has_outbound]
+            for doc_path, deps in self.dependencies.items()
+        }
+
+    def build(self) -> Dict[str, Any]:
+        """Estruturas por mapa (index, architecture, connections, validation)"""
+        return {
+            'index': {
+                'document_summary': self.document_summary,
+                'context_distribution': self.context_distribution,
+                'type_distribution': self.type_distribution
+            },
+            'architecture': {
+                'hierarchical': self.hierarchical,
+                'specialized': self.specialized,
+                'modules': self.modules
+            },
+            'connections': {
+                'graph': self.graph,
+                'connection_types': self.connection_types,
+                'strong_coupling': self.strong_coupling,
+                'weak_coupling': self.weak_coupling,
+                'isolated_components': self.isolated_components
+            },
+            'validation': {
+                'documents_with_errors': self.documents_with_errors,
+                'errors_by_document': self.errors_by_document,
+                'validation_details': self.validation_details
+            }
+        }
+
+
+class ScanError(Exception):
+    """Erro de escaneamento exposto à API de biblioteca"""
+
+
+class WorkspaceNotFoundError(ScanError):
+    """Nenhum workspace Context Navigator encontrado"""
+
+
+@dataclass
+class ScanResult:
+    """Resultado em memória de um escaneamento (API de biblioteca)"""
+    workspace: Workspace
+    total_documents: int
+    documents: Dict[str, Dict[str, Any]]          # vazio no modo streaming
+    maps: Dict[str, Any]                          # index, architecture, connections, conflicts, validation
+    conflicts: List[Dict[str, Any]]
+    validation_errors: List[str]
+    reused_documents: int = 0
+    duration_s: float = 0.0
+    written_maps: List[str] = field(default_factory=list)
+    stale_documents: List[str] = field(default_factory=list)      # --budget-ms: dados do checkpoint
+    pending_documents: List[str] = field(default_factory=list)    # --budget-ms: ainda não processados
+
+    @property
+    def complete(self) -> bool:
+        """True se todos os documentos foram processados nesta execução ou estavam inalterados"""
+        return not self.stale_documents and not self.pending_documents
+
+    @property
+    def critical_errors(self) -> List[str]:
+        """Erros de campos obrigatórios"""
+        return [e for e in self.validation_errors if 'obrigatório' in e]
+
+    @property
+    def critical_conflicts(self) -> List[Dict[str, Any]]:
+        """Conflitos com severidade 'error'"""
+        return [c for c in self.conflicts if c.get('severity') == 'error']
+
+    @property
+    def ok(self) -> bool:
+        """True se não há problemas críticos (código de saída 0 da CLI)"""
+        return not self.critical_errors and not self.critical_conflicts
+
+
+def _allowed_set(container: Any) -> Any:
+    """Conjunto imutável das chaves/valores permitidos (o próprio container se não for hasheável)"""
+    try:
+        return frozenset(container)
+    except TypeError:
+        return container
+
+
+# Verificações de tipo dos campos obrigatórios (tipos desconhecidos não são verificados)
+_TYPE_CHECKS = {
+    'string': (lambda value: isinstance(value, str), 'string'),
+    'array': (lambda value: isinstance(value, list), 'array'),
+    'object': (lambda value: isinstance(value, dict), 'object'),
+}
+
+
+class _ValidationPlan:
+    """Configuração de validação compilada: conjuntos permitidos e verificações por campo"""
+
+    # Planos por hash da configuração (compartilhados entre instâncias do processo)
+    _cache: Dict[str, '_ValidationPlan'] = {}
+
+    def __init__(self, config: Dict[str, Any]):
+        metadata_config = config.get('metadata', {}) or {}
+        contexts = config.get('contexts', {}) or {}
+        
+        # (campo, verificação de tipo, nome do tipo, valores permitidos, valores originais)
+        self.required_fields = []
+        for field, field_config in (metadata_config.get('required_fields', {}) or {}).items():
+            field_config = field_config if isinstance(field_config, dict) else {}
+            type_check, type_name = _TYPE_CHECKS.get(field_config.get('type', 'string'), (None, None))
+            allowed_values = field_config.get('values', [])
+            self.required_fields.append((
+                field, type_check, type_name,
+                _allowed_set(allowed_values) if allowed_values else None,
+                allowed_values
+            ))
+            
+        self.connection_types = _allowed_set(config.get('connection_types', {}))
+        self.document_types = _allowed_set(config.get('document_types', {}))
+        self.hierarchical_contexts = _allowed_set(contexts.get('hierarchical', {}))
+        self.specialized_contexts = _allowed_set(contexts.get('specialized', {}))
+
+    @classmethod
+    def for_config(cls, config: Dict[str, Any], config_hash: str) -> '_ValidationPlan':
+        """Plano da configuração, compilado uma vez por hash"""
+        plan = cls._cache.get(config_hash)
+        if plan is None:
+            plan = cls._cache[config_hash] = cls(config)
+        return plan
+
+    @staticmethod
+    def _is_allowed(value: Any, allowed: Any, original: Any) -> bool:
+        """Pertinência com fallback para a lista original (valores não hasheáveis)"""
+        try:
+            return value in allowed
+        except TypeError:
+            return value in original
+
+    def validate_required_fields(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
+        errors = []
+        for field, type_check, type_name, allowed, allowed_values in self.required_fields:
+            if field not in metadata:
+                errors.append(f"{file_path}: Campo obrigatório '{field}' não encontrado")
+                continue
+                
+            value = metadata[field]
+            if type_check is not None and not type_check(value):
+                errors.append(f"{file_path}: Campo '{field}' deve ser {type_name}")
+            if allowed is not None and not self._is_allowed(value, allowed, allowed_values):
+                errors.append(f"{file_path}: Campo '{field}' deve ser um de {allowed_values}")
+        return errors
+
+    def validate_connections(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
+        connections = metadata.get('connections', {})
+        if not isinstance(connections, dict):
+            return [f"{file_path}: 'connections' deve ser um objeto"]
+            
+        errors = []
+        connection_types = self.connection_types
+        for conn_type, targets in connections.items():
+            if conn_type not in connection_types:
+                errors.append(f"{file_path}: Tipo de conexão '{conn_type}' não reconhecido")
+            elif not isinstance(targets, list):
+                errors.append(f"{file_path}: Conexão '{conn_type}' deve ser uma lista")
+        return errors
+
+    def validate_document_type(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
+        doc_type = metadata.get('doc_type')
+        if doc_type and doc_type not in self.document_types:
+            return [f"{file_path}: Tipo de documento '{doc_type}' não reconhecido"]
+        return []
+
+    def validate_context(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
+        errors = []
+        context_level = metadata.get('context_level')
+        if context_level and context_level not in self.hierarchical_contexts:
+            errors.append(f"{file_path}: context_level '{context_level}' não reconhecido")
+        context_type = metadata.get('context_type')
+        if context_type and context_type not in self.specialized_contexts:
+            errors.append(f"{file_path}: context_type '{context_type}' não reconhecido")
+        return errors
+
+    def validate(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
+        """Todas as validações, na ordem dos validadores do scanner"""
+        errors = self.validate_required_fields(metadata, file_path)
+        errors.extend(self.validate_connections(metadata, file_path))
+        errors.extend(self.validate_document_type(metadata, file_path))
+        errors.extend(self.validate_context(metadata, file_path))
+        return errors
+
+
+def _sort_keys(data: Any) -> Any:
+    """Cópia com as chaves de todos os dicionários em ordem (saída canônica)"""
+    if isinstance(data, dict):
+        return {key: _sort_keys(data[key]) for key in sorted(data, key=str)}
+    if isinstance(data, list):
+        return [_sort_keys(item) for item in data]
+    return data
+
+
+def _conflict_sort_key(conflict: Dict[str, Any]) -> Tuple[str, str]:
+    """Ordem estável de conflitos: tipo e componente/documento/membros"""
+    subject = conflict.get('component') or conflict.get('document') or conflict.get('members') or ''
+    return (str(conflict.get('type', '')), str(subject))
+
+
+def _canonical_aggregates(aggregates: Dict[str, Any]) -> Dict[str, Any]:
+    """Listas de documentos dos agregados ordenadas por caminho"""
+    by_path = lambda entry: entry['path']
+    by_document = lambda entry: entry['document']
+    architecture = aggregates['architecture']
+    connections = aggregates['connections']
+    validation = aggregates['validation']
+    return {
+        'index': aggregates['index'],
+        'architecture': {
+            group: {name: sorted(entries, key=by_path) for name, entries in architecture[group].items()}
+            for group in ('hierarchical', 'specialized', 'modules')
+        },
+        'connections': {
+            **connections,
+            'strong_coupling': sorted(connections['strong_coupling'], key=by_document),
+            'weak_coupling': sorted(connections['weak_coupling'], key=by_document),
+            'isolated_components': sorted(connections['isolated_components'])
+        },
+        'validation': {
+            **validation,
+            'validation_details': sorted(validation['validation_details'], key=by_document)
+        }
+    }
+
+
+def _canonical_conflicts(conflicts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Conflitos (e referências de cada um) em ordem estável"""
+    result = []
+    for conflict in conflicts:
+        if 'references' in conflict:
+            conflict = {**conflict, 'references': sorted(conflict['references'])}
+        result.append(conflict)
+    return sorted(result, key=_conflict_sort_key)
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Agrupa um iterável em listas de até size itens"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class ScanProfiler:
+    """Tempos por fase (wall/CPU), por documento e, opcionalmente, cProfile de um scan"""
+
+    PHASES = ['discovery', 'read_parse', 'validation', 'aggregation', 'conflicts', 'map_writing', 'summary']
+    PERCENTILES = [50, 90, 95, 99]
+
+    def __init__(self, top: int = 10, cprofile: bool = False):
+        """
+        Args:
+            top: Quantidade de documentos mais lentos no relatório
+            cprofile: Também grava um arquivo .pstats do scan completo
+        """
+        self.top = top
+        self.cprofile = cprofile
+        self.phases = {name: {'wall_s': 0.0, 'cpu_s': 0.0, 'calls': 0} for name in self.PHASES}
+        self.document_times = []
+        self.started_at = None
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._total = {'wall_s': 0.0, 'cpu_s': 0.0}
+        self._profile = None
+
+    def start(self) -> None:
+        """Marca o início do scan"""
+        self.started_at = datetime.now()
+        if self.cprofile:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def stop(self) -> None:
+        """Marca o fim do scan"""
+        self._total = {
+            'wall_s': time.perf_counter() - self._wall_start,
+            'cpu_s': time.process_time() - self._cpu_start
+        }
+        if self._profile is not None:
+            self._profile.disable()
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Acumula wall/CPU time de um trecho na fase indicada (pode repetir)"""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            stats = self.phases[name]
+            stats['wall_s'] += time.perf_counter() - wall_start
+            stats['cpu_s'] += time.process_time() - cpu_start
+            stats['calls'] += 1
+
+    def record_document(self, path: str, read_time: float, parse_time: float, validate_time: float) -> None:
+        """Registra os tempos de um documento lido e validado"""
+        self.document_times.append((path, read_time, parse_time, validate_time))
+
+    @classmethod
+    def _percentiles(cls, values: List[float]) -> Dict[str, float]:
+        """Percentis (nearest-rank), média e máximo de uma série de tempos"""
+        if not values:
+            return {}
+        ordered = sorted(values)
+        result = {}
+        for pct in cls.PERCENTILES:
+            rank = max(1, -(-pct * len(ordered) // 100))
+            result[f"p{pct}"] = ordered[rank - 1]
+        result['mean'] = sum(ordered) / len(ordered)
+        result['max'] = ordered[-1]
+        return result
+
+    def report(self, scanner: 'ContextScanner') -> Dict[str, Any]:
+        """Monta o relatório do scan"""
+        slowest = heapq.nlargest(self.top, self.document_times, key=lambda t: t[1] + t[2] + t[3])
+        return {
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'workspace': str(scanner.base_path),
+            'options': {
+                'jobs': scanner.jobs,
+                'incremental': scanner.incremental,
+                'streaming': scanner.streaming
+            },
+            'total_documents': scanner.document_count,
+            'documents_parsed': len(self.document_times),
+            'documents_reused': scanner.manifest_hits,
+            'total': self._total,
+            'phases': self.phases,
+            'documents': {
+                'read_s': self._percentiles([t[1] for t in self.document_times]),
+                'parse_s': self._percentiles([t[2] for t in self.document_times]),
+                'validate_s': self._percentiles([t[3] for t in self.document_times])
+            },
+            'slowest_documents': [
+                {
+                    'path': path,
+                    'total_s': read_time + parse_time + validate_time,
+                    'read_s': read_time,
+                    'parse_s': parse_time,
+                    'validate_s': validate_time
+                }
+                for path, read_time, parse_time, validate_time in slowest
+            ]
+        }
+
+    def save(self, scanner: 'ContextScanner') -> Path:
+        """
+        Grava .cn_model/profile/scan-<timestamp>.json (e .pstats com cProfile)
+
+        Returns:
+            Caminho do relatório JSON
+        """
+        profile_dir = scanner.context_maps_path / 'profile'
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        stamp = (self.started_at or datetime.now()).strftime('%Y%m%d-%H%M%S')
+        
+        report = self.report(scanner)
+        if self._profile is not None:
+            pstats_path = profile_dir / f"scan-{stamp}.pstats"
+            self._profile.dump_stats(str(pstats_path))
+            report['cprofile'] = str(pstats_path)
+            
+        report_path = profile_dir / f"scan-{stamp}.json"
+        atomic_write(report_path, json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8'))
+        return report_path
+
+
 # @cn:class service
 # @cn:responsibility document-processing
 # @cn:pattern singleton
@@ -49,12 +655,26 @@ class ContextScanner:
     # @cn:function core
     # @cn:process initialization
     # @cn:step 1
-    def __init__(self, base_path: str = "."):
+    def __init__(self, base_path: str = ".", incremental: bool = False, jobs: int = 1,
+                 streaming: bool = False, profiler: Optional[ScanProfiler] = None,
+                 workspace: Optional[Workspace] = None, write_maps: bool = True,
+                 canonical: bool = False, budget_ms: Optional[int] = None):
         """
         Inicializa o scanner
         
         Args:
             base_path: Caminho base do projeto
+            incremental: Reaproveita documentos inalterados do manifest
+            jobs: Processos para leitura/parse (0 = número de CPUs)
+            streaming: Agrega documento a documento sem manter corpos em memória
+            profiler: Coleta tempos por fase/documento (--profile)
+            workspace: Workspace explícito (dispensa a detecção e não cria pastas)
+            write_maps: Grava mapas, snapshot, pacote de conteúdo e manifest em .cn_model/
+            canonical: Saída canônica (chaves e listas de documentos ordenadas)
+            budget_ms: Orçamento de tempo do processamento de documentos (implica incremental)
+            
+        Raises:
+            WorkspaceNotFoundError: Sem workspace explícito e nenhum detectado
         """
         self.base_path = Path(base_path)
         self.config = {}
@@ -62,9 +682,55 @@ class ContextScanner:
         self.context_maps = {}
         self.validation_errors = []
         self.conflicts = []
-        
-        # NOVO: Usar WorkspaceManager para detectar workspace
-        self._init_with_workspace_manager()
+        self.aggregates = {}
+        self.aggregator = None
+        self.maps = {}
+        self.map_hashes = {}
+        self.written_maps = []
+        self.write_maps = write_maps
+        self.validation_plan = None
+        
+        # Saída canônica (diffs estáveis); campos voláteis ficam em SCAN_INFO_FILENAME
+        self.canonical = canonical
+        
+        # Escaneamento incremental
+        self.incremental = incremental
+        self.manifest = {}
+        self.manifest_entries = {}
+        self.manifest_config_hash = None  # configuração sob a qual manifest_entries foi validado
+        self.manifest_hits = 0
+        
+        # Pipeline em streaming (memória limitada)
+        self.streaming = streaming
+        
+        # Escaneamento com orçamento de tempo (o manifest serve de checkpoint)
+        self.budget_ms = budget_ms
+        self.scan_budget_ms = budget_ms  # orçamento efetivo do último scan()
+        self.stale_documents = []
+        self.pending_documents = []
+        self._deadline = None
+        self._budget_reads = 0
+        self._document_order = []
+        
+        # Perfil de execução (--profile)
+        self.profiler = profiler
+        
+        # stat() obtido no percurso (DirEntry), reaproveitado na leitura
+        self.ignore_rules = None
+        self.file_stats = {}
+        
+        # Pacote de conteúdo lido pelos analisadores (gravado durante o scan)
+        self.content_writer = None
+        
+        # Processamento paralelo
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        
+        if workspace is not None:
+            # API de biblioteca: workspace fornecido pelo chamador
+            self._init_workspace(workspace)
+        else:
+            # NOVO: Usar WorkspaceManager para detectar workspace
+            self._init_with_workspace_manager()
             
         logger.info(f"📁 Escaneando código: {self.base_path}")
         logger.info(f"📄 Docs gerados: {self.docs_path}")
@@ -91,27 +757,29 @@ class ContextScanner:
         current_workspace = workspace_manager.detect_current_workspace()
         
         if not current_workspace:
-            logger.error("❌ Context Navigator workspace não encontrado")
-            logger.error("💡 Execute 'cn init' para configurar este diretório")
-            sys.exit(1)
-        
-        # Configurar paths baseado no workspace
-        self.workspace = current_workspace
-        self.base_path = current_workspace.root_path
-        self.docs_path = current_workspace.root_path / ".cn_model" / "docs"
-        self.context_maps_path = current_workspace.root_path / ".cn_model"
+            raise WorkspaceNotFoundError("Context Navigator workspace não encontrado")
         
-        # Templates ficam na instalação global
-        self.templates_path = self._get_global_templates_path()
-        
-        # Carregar configuração do workspace
-        self.config = current_workspace.configuration
+        self._init_workspace(current_workspace)
         
         # Criar diretórios necessários
         self.docs_path.mkdir(parents=True, exist_ok=True)
         (self.context_maps_path / "context-map").mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"🌐 Workspace: {current_workspace.name} ({current_workspace.root_path})")
+    def _init_workspace(self, workspace: Workspace) -> None:
+        """Configura paths e configuração a partir de um workspace"""
+        self.workspace = workspace
+        self.base_path = Path(workspace.root_path)
+        self.docs_path = self.base_path / ".cn_model" / "docs"
+        self.context_maps_path = self.base_path / ".cn_model"
+        
+        # Templates ficam na instalação global (parse compartilhado entre workspaces)
+        self.templates_path = self._get_global_templates_path()
+        self.template_cache = TemplateCache(self.templates_path)
+        
+        # Carregar configuração do workspace
+        self.config = workspace.configuration or {}
+        
+        logger.info(f"🌐 Workspace: {workspace.name} ({workspace.root_path})")
         
     def _get_global_templates_path(self) -> Path:
         """Detecta onde estão os templates na instalação global"""
@@ -129,7 +797,8 @@ class ContextScanner:
         
 
             
-    def _extract_front_matter(self, content: str) -> Tuple[Dict[str, Any], str]:
+    @staticmethod
+    def _extract_front_matter(content: str) -> Tuple[Dict[str, Any], str]:
         """
         Extrai front matter YAML do conteúdo
         
@@ -147,14 +816,15 @@ class ContextScanner:
             return {}, content
             
         try:
-            metadata = yaml.safe_load(parts[1])
+            metadata = yaml_load(parts[1])
             content_without_fm = parts[2].strip()
             return metadata or {}, content_without_fm
-        except yaml.YAMLError as e:
+        except YAMLError as e:
             logger.warning(f"Erro ao parsear front matter: {e}")
             return {}, content
             
-    def _extract_inline_metadata(self, content: str) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_inline_metadata(content: str) -> Dict[str, Any]:
         """
         Extrai metadados inline do formato <!-- CONTEXT_META ... -->
         
@@ -171,10 +841,10 @@ class ContextScanner:
         for match in matches:
             try:
                 # Parse como YAML
-                metadata = yaml.safe_load(match)
+                metadata = yaml_load(match)
                 if metadata:
                     inline_metadata.update(metadata)
-            except yaml.YAMLError:
+            except YAMLError:
                 # Se não for YAML válido, tenta parsear linha por linha
                 lines = match.strip().split('\n')
                 for line in lines:
@@ -184,6 +854,12 @@ class ContextScanner:
                         
         return inline_metadata
         
+    def _get_validation_plan(self) -> _ValidationPlan:
+        """Plano de validação compilado da configuração atual"""
+        if self.validation_plan is None:
+            self.validation_plan = _ValidationPlan.for_config(self.config, self._config_hash())
+        return self.validation_plan
+        
     def _validate_required_fields(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
         """
         Valida campos obrigatórios nos metadados
@@ -195,31 +871,7 @@ class ContextScanner:
         Returns:
             Lista de erros de validação
         """
-        errors = []
-        required_fields = self.config.get('metadata', {}).get('required_fields', {})
-        
-        for field, field_config in required_fields.items():
-            if field not in metadata:
-                errors.append(f"{file_path}: Campo obrigatório '{field}' não encontrado")
-                continue
-                
-            value = metadata[field]
-            field_type = field_config.get('type', 'string')
-            
-            # Validar tipo
-            if field_type == 'string' and not isinstance(value, str):
-                errors.append(f"{file_path}: Campo '{field}' deve ser string")
-            elif field_type == 'array' and not isinstance(value, list):
-                errors.append(f"{file_path}: Campo '{field}' deve ser array")
-            elif field_type == 'object' and not isinstance(value, dict):
-                errors.append(f"{file_path}: Campo '{field}' deve ser object")
-                
-            # Validar valores permitidos
-            allowed_values = field_config.get('values', [])
-            if allowed_values and value not in allowed_values:
-                errors.append(f"{file_path}: Campo '{field}' deve ser um de {allowed_values}")
-                
-        return errors
+        return self._get_validation_plan().validate_required_fields(metadata, file_path)
         
     def _validate_connections(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
         """
@@ -232,24 +884,7 @@ class ContextScanner:
         Returns:
             Lista de erros de validação
         """
-        errors = []
-        connections = metadata.get('connections', {})
-        
-        if not isinstance(connections, dict):
-            errors.append(f"{file_path}: 'connections' deve ser um objeto")
-            return errors
-            
-        # Validar tipos de conexão conhecidos
-        connection_types = self.config.get('connection_types', {})
-        for conn_type, targets in connections.items():
-            if conn_type not in connection_types:
-                errors.append(f"{file_path}: Tipo de conexão '{conn_type}' não reconhecido")
-                continue
-                
-            if not isinstance(targets, list):
-                errors.append(f"{file_path}: Conexão '{conn_type}' deve ser uma lista")
-                
-        return errors
+        return self._get_validation_plan().validate_connections(metadata, file_path)
         
     def _validate_document_type(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
         """
@@ -262,17 +897,7 @@ class ContextScanner:
         Returns:
             Lista de erros de validação
         """
-        errors = []
-        doc_type = metadata.get('doc_type')
-        
-        if not doc_type:
-            return errors  # Já validado em required_fields
-            
-        document_types = self.config.get('document_types', {})
-        if doc_type not in document_types:
-            errors.append(f"{file_path}: Tipo de documento '{doc_type}' não reconhecido")
-            
-        return errors
+        return self._get_validation_plan().validate_document_type(metadata, file_path)
         
     def _validate_context(self, metadata: Dict[str, Any], file_path: str) -> List[str]:
         """
@@ -285,45 +910,22 @@ class ContextScanner:
         Returns:
             Lista de erros de validação
         """
-        errors = []
+        return self._get_validation_plan().validate_context(metadata, file_path)
         
-        context_level = metadata.get('context_level')
-        context_type = metadata.get('context_type')
-        
-        # Validar context_level
-        if context_level:
-            hierarchical_contexts = self.config.get('contexts', {}).get('hierarchical', {})
-            if context_level not in hierarchical_contexts:
-                errors.append(f"{file_path}: context_level '{context_level}' não reconhecido")
-                
-        # Validar context_type
-        if context_type:
-            specialized_contexts = self.config.get('contexts', {}).get('specialized', {})
-            if context_type not in specialized_contexts:
-                errors.append(f"{file_path}: context_type '{context_type}' não reconhecido")
-                
-        return errors
-        
-    def _detect_conflicts(self) -> List[Dict[str, Any]]:
+    def _detect_conflicts(self, aggregator: _ScanAggregator) -> List[Dict[str, Any]]:
         """
         Detecta conflitos entre documentos
         
+        Args:
+            aggregator: Agregador com referências, arestas e saídas já construídas
+        
         Returns:
             Lista de conflitos detectados
         """
         conflicts = []
-        
+            
         # Detectar referências duplicadas
-        component_refs = {}
-        for file_path, doc_data in self.documents.items():
-            connections = doc_data['metadata'].get('connections', {})
-            for conn_type, targets in connections.items():
-                for target in targets:
-                    if target not in component_refs:
-                        component_refs[target] = []
-                    component_refs[target].append((file_path, conn_type))
-                    
-        for component, refs in component_refs.items():
+        for component, refs in aggregator.component_refs.items():
             if len(refs) > 1:
                 ref_types = set(ref[1] for ref in refs)
                 if len(ref_types) > 1:
@@ -334,48 +936,17 @@ class ContextScanner:
                         'severity': 'warning'
                     })
                     
-        # Detectar dependências circulares
-        def has_circular_dependency(doc_path: str, target: str, visited: set) -> bool:
-            if target in visited:
-                return True
-            if target not in self.documents:
-                return False
-                
-            visited.add(target)
-            target_doc = self.documents[target]
-            depends_on = target_doc['metadata'].get('connections', {}).get('depends_on', [])
-            
-            for dep in depends_on:
-                if has_circular_dependency(doc_path, dep, visited.copy()):
-                    return True
-            return False
-            
-        for file_path, doc_data in self.documents.items():
-            depends_on = doc_data['metadata'].get('connections', {}).get('depends_on', [])
-            for dep in depends_on:
-                if has_circular_dependency(file_path, dep, set()):
-                    conflicts.append({
-                        'type': 'circular_dependency',
-                        'source': file_path,
-                        'target': dep,
-                        'severity': 'error'
-                    })
+        # Detectar dependências circulares (um conflito por ciclo)
+        for members in self._find_dependency_cycles(aggregator.dependency_graph()):
+            conflicts.append({
+                'type': 'circular_dependency',
+                'members': members,
+                'severity': 'error'
+            })
                     
         # Detectar documentos órfãos
-        referenced_docs = set()
-        for doc_data in self.documents.values():
-            connections = doc_data['metadata'].get('connections', {})
-            for targets in connections.values():
-                referenced_docs.update(targets)
-                
-        for file_path in self.documents:
-            has_outbound = any(
-                targets for targets in 
-                self.documents[file_path]['metadata'].get('connections', {}).values()
-            )
-            has_inbound = file_path in referenced_docs
-            
-            if not has_outbound and not has_inbound:
+        for file_path, has_outbound in aggregator.has_outbound.items():
+            if not has_outbound and file_path not in aggregator.referenced_docs:
                 conflicts.append({
                     'type': 'orphaned_document',
                     'document': file_path,
@@ -384,251 +955,723 @@ class ContextScanner:
                 
         return conflicts
         
+    @staticmethod
+    def _find_dependency_cycles(graph: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Encontra ciclos de dependência via componentes fortemente conexos (Tarjan)
+        
+        Implementação iterativa em O(V+E), sem limite de recursão.
+        
+        Args:
+            graph: Arestas depends_on por documento
+            
+        Returns:
+            Membros (ordenados) de cada ciclo encontrado
+        """
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set()
+        cycles = []
+        counter = 0
+        
+        for root in graph:
+            if root in index:
+                continue
+                
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph[root]))]
+            
+            while work:
+                node, neighbors = work[-1]
+                descended = False
+                
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(graph[neighbor])))
+                        descended = True
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                        
+                if descended:
+                    continue
+                    
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    # Componente unitário só é ciclo com auto-dependência
+                    if len(component) > 1 or node in graph[node]:
+                        cycles.append(sorted(component))
+                        
+        return cycles
+        
+    def _phase(self, name: str):
+        """Contexto que mede a fase no profiler (no-op sem --profile)"""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.phase(name)
+        
+    @property
+    def document_count(self) -> int:
+        """Total de documentos escaneados (também no modo streaming)"""
+        if self.aggregator is not None:
+            return self.aggregator.total_documents
+        return len(self.documents)
+        
     def scan_documents(self) -> None:
         """Escaneia todos os documentos nas pastas configuradas"""
         logger.info("Iniciando escaneamento de documentos...")
         
-        # Pastas para escanear
-        scan_paths = [
-            self.docs_path,
-            self.templates_path
+        # Estado do escaneamento anterior (instância reutilizada)
+        self.documents = {}
+        self.validation_errors = []
+        self.aggregator = None
+        self.manifest_hits = 0
+        self.file_stats = {}
+        self.validation_plan = None  # a configuração pode ter mudado entre execuções
+        self.stale_documents = []
+        self.pending_documents = []
+        self._budget_reads = 0
+        self._deadline = None
+        if self.budget_ms is not None:
+            # Orçamento: documentos não processados continuam do checkpoint na próxima execução
+            self.incremental = True
+            self._deadline = time.perf_counter() + self.budget_ms / 1000.0
+        previous_entries = self.manifest_entries
+        previous_config_hash = self.manifest_config_hash
+        self.manifest_entries = {}
+        self.manifest_config_hash = self._config_hash()
+        self.ignore_rules = IgnoreRules.load(self.base_path)
+        if self.incremental:
+            # Instância quente: manifest da execução anterior já está em memória,
+            # válido apenas se a configuração não mudou (como em _load_manifest)
+            if previous_entries and previous_config_hash == self.manifest_config_hash:
+                self.manifest = previous_entries
+            else:
+                self.manifest = self._load_manifest()
+        
+        executor = None
+        if self.jobs > 1:
+            logger.info(f"⚙️  Processamento paralelo: {self.jobs} processos")
+            executor = ProcessPoolExecutor(max_workers=self.jobs)
+            
+        self._open_content_store()
+        try:
+            if self.streaming:
+                # Agregar: único estágio que retém dados (sem corpos)
+                aggregator = _ScanAggregator()
+                for doc_data in self._stream_documents(executor):
+                    with self._phase('aggregation'):
+                        aggregator.add(doc_data['path'], doc_data)
+                self.aggregator = aggregator
+            elif self.budget_ms is not None:
+                # Prioridade por mtime; mapas mantêm a ordem das pastas
+                self._scan_files(self._discover_documents(), executor)
+                order = {
+                    str(self._relative_path(file_path)): position
+                    for position, file_path in enumerate(self._document_order)
+                }
+                self.documents = dict(sorted(self.documents.items(), key=lambda item: order.get(item[0], 0)))
+            else:
+                # Pastas para escanear
+                for scan_path in [self.docs_path, self.templates_path]:
+                    self._scan_directory(scan_path, executor)
+        except BaseException:
+            self._close_content_store(commit=False)
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self._close_content_store()
+            
+        logger.info(f"Escaneamento concluído. {self.document_count} documentos processados")
+        
+        if self.stale_documents or self.pending_documents:
+            logger.warning(f"⏳ Orçamento de {self.budget_ms} ms esgotado: "
+                           f"{len(self.stale_documents)} desatualizados, {len(self.pending_documents)} pendentes "
+                           f"(continuam na próxima execução)")
+        
+        # Templates parseados nesta execução ficam disponíveis para os demais workspaces
+        self.template_cache.save()
+        
+        if self.incremental:
+            logger.info(f"♻️  Reaproveitados do manifest: {self.manifest_hits}")
+            if self.write_maps:
+                self._save_manifest()
+            
+    def _open_content_store(self) -> None:
+        """Inicia o pacote de conteúdo de .cn_model/ (apenas quando os mapas são gravados)"""
+        self.content_writer = None
+        if not self.write_maps:
+            return
+        try:
+            self.content_writer = ContentStoreWriter(self.context_maps_path)
+        except OSError as e:
+            logger.error(f"Erro ao criar pacote de conteúdo: {e}")
+            
+    def _close_content_store(self, commit: bool = True) -> None:
+        """Publica (ou descarta) o pacote de conteúdo do escaneamento"""
+        writer, self.content_writer = self.content_writer, None
+        if writer is None:
+            return
+        if not commit:
+            writer.abort()
+            return
+        try:
+            writer.commit()
+        except OSError as e:
+            logger.error(f"Erro ao salvar pacote de conteúdo {writer.path}: {e}")
+            
+    def _store_content(self, doc_data: Dict[str, Any], text: Optional[str] = None,
+                       stat: Optional[os.stat_result] = None) -> None:
+        """
+        Grava o texto do documento no pacote de conteúdo
+        
+        Args:
+            doc_data: Registro do documento
+            text: Texto lido neste scan (None: documento não relido, vem do pacote anterior)
+            stat: stat() atual de um documento adiado (o pacote guarda o texto do checkpoint)
+        """
+        writer = self.content_writer
+        if writer is None:
+            return
+        path, size, mtime_ns = doc_data['path'], doc_data['size'], doc_data['mtime_ns']
+        if stat is not None:
+            # Adiado pelo orçamento: o texto anterior acompanha os metadados do checkpoint
+            writer.reuse(path, doc_data['content_hash'], stat.st_size, stat.st_mtime_ns)
+            return
+        if text is None:
+            if writer.reuse(path, doc_data['content_hash'], size, mtime_ns):
+                return
+            # Pacote anterior ausente ou sem o blob: única leitura do arquivo
+            try:
+                with open(doc_data['absolute_path'], 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug(f"Conteúdo fora do pacote: {path} ({e})")
+                return
+            writer.add(path, text, size, mtime_ns)
+            return
+        writer.add(path, text, size, mtime_ns, doc_data['content_hash'], doc_data['content'])
+            
+    def _stream_documents(self, executor: Optional[ProcessPoolExecutor] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Pipeline descobrir → ler/parsear → validar, um documento por vez
+        
+        Args:
+            executor: Pool de processos para leitura/parse em paralelo
+            
+        Yields:
+            Registros validados, sem o corpo do documento
+        """
+        files = self._discover_documents()
+        parsed = self._read_documents(files, executor)
+        return self._validate_documents(parsed)
+        
+    def _discover_documents(self) -> Iterator[Path]:
+        """Estágio 1: caminhos dos documentos das pastas escaneadas"""
+        if self.budget_ms is not None:
+            yield from self._prioritized_documents()
+            return
+        for scan_path in [self.docs_path, self.templates_path]:
+            yield from self._list_documents(scan_path)
+            
+    def _prioritized_documents(self) -> List[Path]:
+        """Documentos do mais recentemente modificado ao mais antigo (modo --budget-ms)"""
+        self._document_order = [
+            file_path
+            for scan_path in [self.docs_path, self.templates_path]
+            for file_path in self._list_documents(scan_path)
         ]
+        # sorted é estável: empates mantêm a ordem das pastas
+        return sorted(self._document_order, key=lambda file_path: -self.file_stats[file_path].st_mtime_ns)
         
-        for scan_path in scan_paths:
-            self._scan_directory(scan_path)
+    def _budget_exhausted(self) -> bool:
+        """Orçamento esgotado (ao menos um lote é sempre lido, garantindo progresso)"""
+        return (self._deadline is not None and self._budget_reads > 0
+                and time.perf_counter() >= self._deadline)
             
-        logger.info(f"Escaneamento concluído. {len(self.documents)} documentos processados")
+    def _read_documents(self, files: Iterable[Path],
+                        executor: Optional[ProcessPoolExecutor] = None) -> Iterator[Tuple[Path, Optional[Dict[str, Any]]]]:
+        """
+        Estágio 2: lê e parseia documentos (em lotes limitados no pool)
         
-    def _scan_directory(self, directory: Path) -> None:
+        Args:
+            files: Caminhos a processar, em ordem
+            executor: Pool de processos para leitura/parse em paralelo
+            
+        Yields:
+            (caminho, resultado de _read_document ou None se inalterado no manifest)
+        """
+        batch_size = self.jobs * 64 if executor is not None else 1
+        if self.budget_ms is not None and executor is not None:
+            # Lotes menores para não estourar o orçamento
+            batch_size = self.jobs * 4
+        for batch in _batched(files, batch_size):
+            with self._phase('read_parse'):
+                stale = [file_path for file_path in batch if not self._is_fresh_in_manifest(file_path)]
+                
+                parsed_by_path = {}
+                if stale and self._budget_exhausted():
+                    # Adiados para a próxima execução
+                    parsed_by_path = {file_path: {'deferred': True} for file_path in stale}
+                    stale = []
+                self._budget_reads += len(stale)
+                
+                # Templates da instalação vêm do cache global
+                for file_path in stale:
+                    if self.templates_path in file_path.parents:
+                        parsed_by_path[file_path] = self._read_template(file_path)
+                if parsed_by_path:
+                    stale = [file_path for file_path in stale if file_path not in parsed_by_path]
+                    
+                known_hashes = [
+                    self.manifest.get(str(self._relative_path(file_path)), {}).get('hash')
+                    for file_path in stale
+                ]
+                if executor is not None:
+                    chunksize = max(1, len(stale) // (self.jobs * 4))
+                    results = executor.map(_read_document, [str(p) for p in stale], known_hashes,
+                                           chunksize=chunksize)
+                else:
+                    results = map(_read_document, [str(p) for p in stale], known_hashes)
+                parsed_by_path.update(zip(stale, results))
+            
+            # Mesclar na ordem dos arquivos
+            for file_path in batch:
+                yield file_path, parsed_by_path.get(file_path)
+                
+    def _read_template(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Resultado no formato de _read_document servido pelo cache de templates
+        
+        Args:
+            file_path: Template da instalação global
+        """
+        cached = self.manifest.get(str(self._relative_path(file_path)))
+        start = time.perf_counter()
+        parsed = self.template_cache.parsed(file_path, _parse_document_text, TEMPLATE_PARSER_ID)
+        if parsed is None:
+            # Ilegível pelo cache: deixar _read_document reportar o erro
+            return _read_document(str(file_path))
+        if cached and cached['hash'] == parsed['content_hash']:
+            return {'unchanged': True, 'content_hash': parsed['content_hash']}
+            
+        # Cópia rasa: o registro do documento não compartilha o dicionário do cache
+        return {
+            'metadata': dict(parsed['metadata']),
+            'content': parsed['content'],
+            'content_hash': parsed['content_hash'],
+            'text': self.template_cache.read_text(file_path),
+            'read_time': time.perf_counter() - start,
+            'parse_time': 0.0
+        }
+        
+    def _validate_documents(self, parsed: Iterable[Tuple[Path, Optional[Dict[str, Any]]]]) -> Iterator[Dict[str, Any]]:
+        """Estágio 3: valida e descarta o corpo de cada documento"""
+        for file_path, parsed_doc in parsed:
+            try:
+                doc_data = self._load_document(file_path, parsed_doc)
+            except Exception as e:
+                logger.error(f"Erro ao processar {file_path}: {e}")
+                continue
+            if doc_data is not None:
+                doc_data['content'] = None
+                yield doc_data
+        
+    def _list_documents(self, directory: Path) -> List[Path]:
+        """Documentos .md de uma pasta (respeitando .cnignore), em ordem estável"""
+        with self._phase('discovery'):
+            if self.ignore_rules is None:
+                self.ignore_rules = IgnoreRules.load(self.base_path)
+                
+            files = []
+            for entry in walk_files(directory, self.ignore_rules, suffixes=('.md',)):
+                if entry.name.startswith('.'):  # Pular arquivos ocultos
+                    continue
+                file_path = Path(entry.path)
+                try:
+                    self.file_stats[file_path] = entry.stat()
+                except OSError:
+                    continue
+                files.append(file_path)
+                
+            # Ordem estável independente do sistema de arquivos e do número de processos
+            return sorted(files)
+        
+    def _scan_directory(self, directory: Path, executor: Optional[ProcessPoolExecutor] = None) -> None:
         """
         Escaneia uma pasta específica
         
         Args:
             directory: Pasta para escanear
+            executor: Pool de processos para leitura/parse em paralelo
         """
-        for file_path in directory.rglob("*.md"):
-            if file_path.name.startswith('.'):
-                continue  # Pular arquivos ocultos
-                
+        self._scan_files(self._list_documents(directory), executor)
+        
+    def _scan_files(self, files: Iterable[Path], executor: Optional[ProcessPoolExecutor] = None) -> None:
+        """
+        Processa uma sequência de documentos
+        
+        Args:
+            files: Caminhos a processar, em ordem
+            executor: Pool de processos para leitura/parse em paralelo
+        """
+        for file_path, parsed in self._read_documents(files, executor):
             try:
-                self._process_document(file_path)
+                self._process_document(file_path, parsed)
             except Exception as e:
                 logger.error(f"Erro ao processar {file_path}: {e}")
                 
-    def _process_document(self, file_path: Path) -> None:
+    def _relative_path(self, file_path: Path) -> Path:
+        """Caminho relativo ao workspace (ou absoluto se estiver fora dele)"""
+        try:
+            return file_path.relative_to(self.base_path)
+        except ValueError:
+            # Se não conseguir calcular caminho relativo, usar caminho absoluto
+            return file_path.resolve()
+            
+    def _is_fresh_in_manifest(self, file_path: Path) -> bool:
+        """Verifica se tamanho e mtime coincidem com a entrada do manifest"""
+        cached = self.manifest.get(str(self._relative_path(file_path)))
+        if not cached:
+            return False
+        try:
+            stat = self.file_stats.get(file_path) or file_path.stat()
+        except OSError:
+            return False
+        return cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns
+                
+    def _process_document(self, file_path: Path, parsed: Optional[Dict[str, Any]] = None) -> None:
         """
         Processa um documento individual
         
         Args:
             file_path: Caminho do arquivo
+            parsed: Resultado de _read_document já calculado
         """
-        try:
-            relative_path = file_path.relative_to(self.base_path)
-        except ValueError:
-            # Se não conseguir calcular caminho relativo, usar caminho absoluto
-            relative_path = file_path.resolve()
+        doc_data = self._load_document(file_path, parsed)
+        if doc_data is not None:
+            self.documents[doc_data['path']] = doc_data
             
-        logger.debug(f"Processando: {relative_path}")
+    def _load_document(self, file_path: Path, parsed: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Lê (se necessário), valida e monta o registro de um documento
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            logger.error(f"Erro ao ler {relative_path}: {e}")
-            return
+        Args:
+            file_path: Caminho do arquivo
+            parsed: Resultado de _read_document já calculado
             
-        # Extrair metadados
-        front_matter, content_without_fm = self._extract_front_matter(content)
-        inline_metadata = self._extract_inline_metadata(content)
+        Returns:
+            Registro do documento ou None se não puder ser lido
+        """
+        relative_path = self._relative_path(file_path)
+        logger.debug(f"Processando: {relative_path}")
         
-        # Combinar metadados (front matter tem prioridade)
-        metadata = {**inline_metadata, **front_matter}
+        stat = self.file_stats.pop(file_path, None) or file_path.stat()
+        
+        # Modo incremental: mesmo tamanho e mtime dispensam a leitura
+        cached = self.manifest.get(str(relative_path))
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return self._restore_document(cached, file_path, stat)
+        
+        if parsed is not None and parsed.get('deferred'):
+            return self._defer_document(cached, file_path, stat)
+            
+        if parsed is None:
+            with self._phase('read_parse'):
+                parsed = _read_document(str(file_path), cached['hash'] if cached else None)
+            
+        if 'error' in parsed:
+            logger.error(f"Erro ao ler {relative_path}: {parsed['error']}")
+            return None
+            
+        # Arquivo tocado mas com o mesmo conteúdo
+        if parsed.get('unchanged'):
+            return self._restore_document(cached, file_path, stat)
+            
+        metadata = parsed['metadata']
         
         # Validar documento
-        errors = []
-        errors.extend(self._validate_required_fields(metadata, str(relative_path)))
-        errors.extend(self._validate_connections(metadata, str(relative_path)))
-        errors.extend(self._validate_document_type(metadata, str(relative_path)))
-        errors.extend(self._validate_context(metadata, str(relative_path)))
+        validate_start = time.perf_counter()
+        with self._phase('validation'):
+            errors = self._get_validation_plan().validate(metadata, str(relative_path))
         
         self.validation_errors.extend(errors)
         
-        # Armazenar documento processado
-        self.documents[str(relative_path)] = {
+        if self.profiler is not None:
+            self.profiler.record_document(str(relative_path), parsed.get('read_time', 0.0),
+                                          parsed.get('parse_time', 0.0),
+                                          time.perf_counter() - validate_start)
+        
+        doc_data = {
             'path': str(relative_path),
             'absolute_path': str(file_path),
             'metadata': metadata,
-            'content': content_without_fm,
-            'size': file_path.stat().st_size,
-            'modified': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
+            'content': parsed['content'],
+            'content_hash': parsed['content_hash'],
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
             'validation_errors': errors
         }
+        self._record_manifest_entry(doc_data)
+        self._store_content(doc_data, parsed.get('text'))
+        return doc_data
+        
+    def _restore_document(self, entry: Dict[str, Any], file_path: Path, stat: os.stat_result) -> Dict[str, Any]:
+        """
+        Recarrega um documento inalterado a partir do manifest
+        
+        Args:
+            entry: Entrada do manifest
+            file_path: Caminho do arquivo
+            stat: Resultado de stat() do arquivo
+            
+        Returns:
+            Registro do documento
+        """
+        self.manifest_hits += 1
+        self.validation_errors.extend(entry['validation_errors'])
+        
+        # O corpo não é persistido no manifest
+        doc_data = {
+            'path': entry['path'],
+            'absolute_path': str(file_path),
+            'metadata': entry['metadata'],
+            'content': None,
+            'content_hash': entry['hash'],
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            'validation_errors': entry['validation_errors']
+        }
+        self._record_manifest_entry(doc_data)
+        self._store_content(doc_data)
+        return doc_data
+        
+    def _defer_document(self, entry: Optional[Dict[str, Any]], file_path: Path,
+                        stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Documento adiado pelo orçamento: usa os dados do checkpoint, se houver
         
+        Args:
+            entry: Entrada do manifest (versão anterior do documento)
+            file_path: Caminho do arquivo
+            stat: Resultado de stat() do arquivo
+            
+        Returns:
+            Registro desatualizado ou None se o documento ainda não foi processado
+        """
+        if not entry:
+            self.pending_documents.append(str(self._relative_path(file_path)))
+            return None
+            
+        self.stale_documents.append(entry['path'])
+        self.validation_errors.extend(entry['validation_errors'])
+        
+        # Tamanho/mtime antigos: continua desatualizado no próximo manifest
+        doc_data = {
+            'path': entry['path'],
+            'absolute_path': str(file_path),
+            'metadata': entry['metadata'],
+            'content': None,
+            'content_hash': entry['hash'],
+            'size': entry['size'],
+            'mtime_ns': entry['mtime_ns'],
+            'modified': datetime.fromtimestamp(entry['mtime_ns'] / 1e9).isoformat(),
+            'validation_errors': entry['validation_errors']
+        }
+        self._record_manifest_entry(doc_data)
+        self._store_content(doc_data, stat=stat)
+        return doc_data
+        
+    def _record_manifest_entry(self, doc_data: Dict[str, Any]) -> None:
+        """Guarda a entrada do manifest (sem corpo) para _save_manifest"""
+        if not self.incremental:
+            return
+        self.manifest_entries[doc_data['path']] = {
+            'path': doc_data['path'],
+            'size': doc_data['size'],
+            'mtime_ns': doc_data['mtime_ns'],
+            'hash': doc_data['content_hash'],
+            'metadata': doc_data['metadata'],
+            'validation_errors': doc_data['validation_errors']
+        }
+        
+    def _config_hash(self) -> str:
+        """Hash da configuração usada na validação (invalida o manifest)"""
+        serialized = json.dumps(self.config, sort_keys=True, default=str)
+        return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+        
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Carrega o manifest do último escaneamento
+        
+        Returns:
+            Entradas do manifest por caminho (vazio se ausente ou obsoleto)
+        """
+        manifest_path = self.context_maps_path / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            return {}
+            
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f, object_hook=metadata_object_hook)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Manifest ignorado ({e}), executando escaneamento completo")
+            return {}
+            
+        if manifest.get('version') != MANIFEST_VERSION or manifest.get('config_hash') != self._config_hash():
+            logger.info("Manifest obsoleto, executando escaneamento completo")
+            return {}
+            
+        return manifest.get('documents', {})
+        
+    def _save_manifest(self) -> None:
+        """Persiste o manifest com os documentos do escaneamento atual"""
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'config_hash': self.manifest_config_hash,
+            'documents': self.manifest_entries,
+            # Checkpoint do --budget-ms (informativo; a retomada usa tamanho/mtime)
+            'pending': self.pending_documents
+        }
+        
+        manifest_path = self.context_maps_path / MANIFEST_FILENAME
+        try:
+            payload = json.dumps(manifest, ensure_ascii=False, cls=MetadataJSONEncoder).encode('utf-8')
+            atomic_write(manifest_path, payload)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Erro ao salvar manifest {manifest_path}: {e}")
+            
     def generate_context_maps(self) -> None:
         """Gera os mapas de contexto"""
         logger.info("Gerando mapas de contexto...")
         
-        # Detectar conflitos
-        self.conflicts = self._detect_conflicts()
-        
-        # Gerar index.yml
-        self._generate_index_map()
+        self.map_hashes = {}
+        self.written_maps = []
+        if self.write_maps:
+            (self.context_maps_path / "context-map").mkdir(parents=True, exist_ok=True)
         
-        # Gerar architecture.yml
-        self._generate_architecture_map()
+        # Agregados de todos os mapas em uma única passada pelos documentos
+        # (no modo streaming o agregador já foi alimentado durante o scan)
+        with self._phase('aggregation'):
+            if self.aggregator is None:
+                self.aggregator = self._aggregate_documents()
+            self.aggregates = self.aggregator.build()
         
-        # Gerar connections.yml
-        self._generate_connections_map()
+        # Detectar conflitos
+        with self._phase('conflicts'):
+            self.conflicts = self._detect_conflicts(self.aggregator)
+            
+        # Ordem independente de percurso, pastas e processos
+        if self.canonical:
+            self.aggregates = _canonical_aggregates(self.aggregates)
+            self.conflicts = _canonical_conflicts(self.conflicts)
+        
+        with self._phase('map_writing'):
+            # Gerar index.yml, architecture.yml, connections.yml, conflicts.yml e validation.json
+            self.maps = maps = {
+                'index': self._generate_index_map(self.aggregates),
+                'architecture': self._generate_architecture_map(self.aggregates),
+                'connections': self._generate_connections_map(self.aggregates),
+                'conflicts': self._generate_conflicts_map(),
+                'validation': self._generate_validation_report(self.aggregates)
+            }
+            
+            # Snapshot binário dos mesmos dados para os analisadores
+            self._save_context_map(SNAPSHOT_FILENAME, maps, format='snapshot')
+            
+            # Timestamp e hashes dos mapas (arquivo separado, sempre regravado)
+            if self.write_maps:
+                self._save_scan_info()
         
-        # Gerar conflicts.yml
-        self._generate_conflicts_map()
+        logger.info("Mapas de contexto gerados com sucesso")
         
-        # Gerar relatório de validação
-        self._generate_validation_report()
+    def _aggregate_documents(self) -> _ScanAggregator:
+        """
+        Percorre os documentos uma única vez construindo os dados de todos os mapas
         
-        logger.info("Mapas de contexto gerados com sucesso")
+        Returns:
+            Agregador com as estruturas por mapa e o grafo de conflitos
+        """
+        aggregator = _ScanAggregator()
+        for doc_path, doc_data in self.documents.items():
+            aggregator.add(doc_path, doc_data)
+        return aggregator
         
-    def _generate_index_map(self) -> None:
+    def _generate_index_map(self, aggregates: Dict[str, Any]) -> Dict[str, Any]:
         """Gera o mapa índice geral"""
         index_data = {
             'project': self.config.get('project', {}),
             'methodology': self.config.get('methodology', {}),
-            'scan_info': {
-                'timestamp': datetime.now().isoformat(),
-                'total_documents': len(self.documents),
-                'validation_errors': len(self.validation_errors),
-                'conflicts': len(self.conflicts)
-            },
-            'document_summary': {},
-            'context_distribution': {},
-            'type_distribution': {}
+            'scan_info': self._scan_info_summary(),
+            'document_summary': aggregates['index']['document_summary'],
+            'context_distribution': aggregates['index']['context_distribution'],
+            'type_distribution': aggregates['index']['type_distribution']
         }
-        
-        # Resumo por tipo de documento
-        for doc_data in self.documents.values():
-            doc_type = doc_data['metadata'].get('doc_type', 'unknown')
-            if doc_type not in index_data['type_distribution']:
-                index_data['type_distribution'][doc_type] = 0
-            index_data['type_distribution'][doc_type] += 1
-            
-        # Distribuição por contexto
-        for doc_data in self.documents.values():
-            context_level = doc_data['metadata'].get('context_level', 'unknown')
-            if context_level not in index_data['context_distribution']:
-                index_data['context_distribution'][context_level] = 0
-            index_data['context_distribution'][context_level] += 1
-            
-        # Resumo de documentos
-        for path, doc_data in self.documents.items():
-            index_data['document_summary'][path] = {
-                'type': doc_data['metadata'].get('doc_type'),
-                'title': doc_data['metadata'].get('title'),
-                'context_level': doc_data['metadata'].get('context_level'),
-                'context_type': doc_data['metadata'].get('context_type'),
-                'module': doc_data['metadata'].get('module'),
-                'status': doc_data['metadata'].get('status'),
-                'last_updated': doc_data['metadata'].get('last_updated'),
-                'has_errors': len(doc_data['validation_errors']) > 0
-            }
             
         self._save_context_map('index.yml', index_data)
+        return index_data
+        
+    def _scan_info_summary(self) -> Dict[str, Any]:
+        """Bloco scan_info do index.yml (com a parte atualizada no modo --budget-ms)"""
+        scan_info = {
+            'total_documents': self.document_count,
+            'validation_errors': len(self.validation_errors),
+            'conflicts': len(self.conflicts)
+        }
+        if self.budget_ms is not None:
+            scan_info['freshness'] = {
+                'complete': not self.stale_documents and not self.pending_documents,
+                'fresh_documents': self.document_count - len(self.stale_documents),
+                'stale_documents': sorted(self.stale_documents),
+                'pending_documents': sorted(self.pending_documents)
+            }
+        return scan_info
         
-    def _generate_architecture_map(self) -> None:
+    def _generate_architecture_map(self, aggregates: Dict[str, Any]) -> Dict[str, Any]:
         """Gera o mapa arquitetural"""
         architecture_data = {
             'contexts': {
-                'hierarchical': {},
-                'specialized': {}
+                'hierarchical': aggregates['architecture']['hierarchical'],
+                'specialized': aggregates['architecture']['specialized']
             },
-            'modules': {},
+            'modules': aggregates['architecture']['modules'],
             'components': {},
             'patterns': {}
         }
-        
-        # Agrupar por contexto hierárquico
-        for doc_data in self.documents.values():
-            context_level = doc_data['metadata'].get('context_level')
-            if context_level:
-                if context_level not in architecture_data['contexts']['hierarchical']:
-                    architecture_data['contexts']['hierarchical'][context_level] = []
-                architecture_data['contexts']['hierarchical'][context_level].append({
-                    'path': doc_data['path'],
-                    'title': doc_data['metadata'].get('title'),
-                    'type': doc_data['metadata'].get('doc_type'),
-                    'module': doc_data['metadata'].get('module')
-                })
-                
-        # Agrupar por contexto especializado
-        for doc_data in self.documents.values():
-            context_type = doc_data['metadata'].get('context_type')
-            if context_type:
-                if context_type not in architecture_data['contexts']['specialized']:
-                    architecture_data['contexts']['specialized'][context_type] = []
-                architecture_data['contexts']['specialized'][context_type].append({
-                    'path': doc_data['path'],
-                    'title': doc_data['metadata'].get('title'),
-                    'type': doc_data['metadata'].get('doc_type'),
-                    'module': doc_data['metadata'].get('module')
-                })
-                
-        # Agrupar por módulos
-        for doc_data in self.documents.values():
-            module = doc_data['metadata'].get('module')
-            if module:
-                if module not in architecture_data['modules']:
-                    architecture_data['modules'][module] = []
-                architecture_data['modules'][module].append({
-                    'path': doc_data['path'],
-                    'title': doc_data['metadata'].get('title'),
-                    'type': doc_data['metadata'].get('doc_type'),
-                    'context_level': doc_data['metadata'].get('context_level'),
-                    'context_type': doc_data['metadata'].get('context_type')
-                })
                 
         self._save_context_map('architecture.yml', architecture_data)
+        return architecture_data
         
-    def _generate_connections_map(self) -> None:
+    def _generate_connections_map(self, aggregates: Dict[str, Any]) -> Dict[str, Any]:
         """Gera o mapa de conexões"""
-        connections_data = {
-            'graph': {},
-            'connection_types': {},
-            'strong_coupling': [],
-            'weak_coupling': [],
-            'isolated_components': []
-        }
-        
-        # Construir grafo de conexões
-        for doc_path, doc_data in self.documents.items():
-            connections = doc_data['metadata'].get('connections', {})
-            connections_data['graph'][doc_path] = connections
-            
-            # Contar por tipo de conexão
-            for conn_type, targets in connections.items():
-                if conn_type not in connections_data['connection_types']:
-                    connections_data['connection_types'][conn_type] = 0
-                connections_data['connection_types'][conn_type] += len(targets)
-                
-        # Analisar acoplamento
-        for doc_path, doc_data in self.documents.items():
-            connections = doc_data['metadata'].get('connections', {})
-            total_connections = sum(len(targets) for targets in connections.values())
-            
-            if total_connections >= 3:
-                connections_data['strong_coupling'].append({
-                    'document': doc_path,
-                    'connection_count': total_connections
-                })
-            elif total_connections >= 1:
-                connections_data['weak_coupling'].append({
-                    'document': doc_path,
-                    'connection_count': total_connections
-                })
-            else:
-                connections_data['isolated_components'].append(doc_path)
+        connections_data = dict(aggregates['connections'])
                 
         self._save_context_map('connections.yml', connections_data)
+        return connections_data
         
-    def _generate_conflicts_map(self) -> None:
+    def _generate_conflicts_map(self) -> Dict[str, Any]:
         """Gera o mapa de conflitos"""
         conflicts_data = {
             'summary': {
@@ -639,33 +1682,29 @@ class ContextScanner:
             'conflicts': self.conflicts
         }
         
-        # Estatísticas por severidade
+        # Estatísticas por severidade e por tipo
+        by_severity = conflicts_data['summary']['by_severity']
+        by_type = conflicts_data['summary']['by_type']
         for conflict in self.conflicts:
             severity = conflict.get('severity', 'unknown')
-            if severity not in conflicts_data['summary']['by_severity']:
-                conflicts_data['summary']['by_severity'][severity] = 0
-            conflicts_data['summary']['by_severity'][severity] += 1
-            
-        # Estatísticas por tipo
-        for conflict in self.conflicts:
+            by_severity[severity] = by_severity.get(severity, 0) + 1
             conflict_type = conflict.get('type', 'unknown')
-            if conflict_type not in conflicts_data['summary']['by_type']:
-                conflicts_data['summary']['by_type'][conflict_type] = 0
-            conflicts_data['summary']['by_type'][conflict_type] += 1
+            by_type[conflict_type] = by_type.get(conflict_type, 0) + 1
             
         self._save_context_map('conflicts.yml', conflicts_data)
+        return conflicts_data
         
-    def _generate_validation_report(self) -> None:
+    def _generate_validation_report(self, aggregates: Dict[str, Any]) -> Dict[str, Any]:
         """Gera relatório de validação"""
         validation_data = {
             'summary': {
-                'total_documents': len(self.documents),
-                'documents_with_errors': len([d for d in self.documents.values() if d['validation_errors']]),
+                'total_documents': self.document_count,
+                'documents_with_errors': aggregates['validation']['documents_with_errors'],
                 'total_errors': len(self.validation_errors)
             },
             'errors_by_type': {},
-            'errors_by_document': {},
-            'validation_details': []
+            'errors_by_document': aggregates['validation']['errors_by_document'],
+            'validation_details': aggregates['validation']['validation_details']
         }
         
         # Agrupar erros por tipo
@@ -675,40 +1714,63 @@ class ContextScanner:
                 validation_data['errors_by_type'][error_type] = 0
             validation_data['errors_by_type'][error_type] += 1
             
-        # Agrupar erros por documento
-        for doc_path, doc_data in self.documents.items():
-            if doc_data['validation_errors']:
-                validation_data['errors_by_document'][doc_path] = doc_data['validation_errors']
-                
-        # Detalhes de validação
-        for doc_path, doc_data in self.documents.items():
-            validation_data['validation_details'].append({
-                'document': doc_path,
-                'valid': len(doc_data['validation_errors']) == 0,
-                'error_count': len(doc_data['validation_errors']),
-                'errors': doc_data['validation_errors']
-            })
-            
         self._save_context_map('validation.json', validation_data, format='json')
+        return validation_data
         
-    def _save_context_map(self, filename: str, data: Dict[str, Any], format: str = 'yaml') -> None:
+    def _save_context_map(self, filename: str, data: Dict[str, Any], format: str = 'yaml') -> bool:
         """
-        Salva um mapa de contexto
+        Salva um mapa de contexto se o conteúdo serializado mudou
         
         Args:
             filename: Nome do arquivo
             data: Dados para salvar
-            format: Formato do arquivo (yaml ou json)
+            format: Formato do arquivo (yaml, json ou snapshot)
+            
+        Returns:
+            True se o arquivo foi regravado
         """
+        if not self.write_maps:
+            return False
+            
         file_path = self.context_maps_path / filename
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if format == 'json':
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            if self.canonical:
+                data = _sort_keys(data)
+                
+            if format == 'snapshot':
+                payload = encode_snapshot(data)
+            elif format == 'json':
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            else:
+                payload = yaml_dump(data).encode('utf-8')
+            content_hash = hashlib.sha256(payload).hexdigest()
+            self.map_hashes[filename] = content_hash
+            
+            # Mapa idêntico: preservar arquivo (e mtime) existente
+            if file_path.exists() and hashlib.sha256(file_path.read_bytes()).hexdigest() == content_hash:
+                logger.debug(f"Inalterado: {file_path}")
+                return False
+                
+            atomic_write(file_path, payload)
+            self.written_maps.append(filename)
             logger.debug(f"Salvo: {file_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Erro ao salvar {file_path}: {e}")
+            return False
+            
+    def _save_scan_info(self) -> None:
+        """Salva informações voláteis do escaneamento em SCAN_INFO_FILENAME"""
+        scan_info = {
+            'timestamp': datetime.now().isoformat(),
+            'total_documents': self.document_count,
+            'maps': self.map_hashes
+        }
+        
+        file_path = self.context_maps_path / SCAN_INFO_FILENAME
+        try:
+            atomic_write(file_path, json.dumps(scan_info, indent=2, ensure_ascii=False).encode('utf-8'))
         except Exception as e:
             logger.error(f"Erro ao salvar {file_path}: {e}")
             
@@ -718,13 +1780,17 @@ class ContextScanner:
         print("CONTEXT NAVIGATOR - RESUMO DO ESCANEAMENTO")
         print("="*60)
         
-        print(f"\n📄 DOCUMENTOS PROCESSADOS: {len(self.documents)}")
+        print(f"\n📄 DOCUMENTOS PROCESSADOS: {self.document_count}")
+        
+        if self.stale_documents or self.pending_documents:
+            print(f"\n⏳ ORÇAMENTO DE TEMPO ESGOTADO ({self.scan_budget_ms} ms):")
+            print(f"   Atualizados: {self.document_count - len(self.stale_documents)}")
+            print(f"   Desatualizados (do checkpoint): {len(self.stale_documents)}")
+            print(f"   Pendentes: {len(self.pending_documents)}")
         
-        # Distribuição por tipo
-        type_dist = {}
-        for doc_data in self.documents.values():
-            doc_type = doc_data['metadata'].get('doc_type', 'unknown')
-            type_dist[doc_type] = type_dist.get(doc_type, 0) + 1
+        # Distribuição por tipo (já agregada na geração dos mapas)
+        aggregates = self.aggregates or self._aggregate_documents().build()
+        type_dist = aggregates['index']['type_distribution']
             
         print("\n📊 DISTRIBUIÇÃO POR TIPO:")
         for doc_type, count in sorted(type_dist.items()):
@@ -732,8 +1798,8 @@ class ContextScanner:
             
         # Validação
         print(f"\n✅ VALIDAÇÃO:")
-        docs_with_errors = len([d for d in self.documents.values() if d['validation_errors']])
-        print(f"   Documentos válidos: {len(self.documents) - docs_with_errors}")
+        docs_with_errors = aggregates['validation']['documents_with_errors']
+        print(f"   Documentos válidos: {self.document_count - docs_with_errors}")
         print(f"   Documentos com erros: {docs_with_errors}")
         print(f"   Total de erros: {len(self.validation_errors)}")
         
@@ -764,23 +1830,69 @@ class ContextScanner:
             if len(self.validation_errors) > 10:
                 print(f"   ... e mais {len(self.validation_errors) - 10} erros")
                 
-    def run(self) -> int:
+    def scan(self, budget_ms: Optional[int] = None) -> ScanResult:
         """
-        Executa o scanner completo
+        Escaneia e gera os mapas, retornando o resultado em memória
+        
+        Pode ser chamado repetidamente na mesma instância; com incremental=True
+        os documentos inalterados vêm do manifest mantido em memória.
+        
+        Args:
+            budget_ms: Orçamento de tempo desta chamada (substitui o do construtor)
         
         Returns:
-            Código de saída (0 para sucesso, 1 para erro)
+            Resultado do escaneamento
         """
+        # O orçamento vale só para esta chamada: a instância volta às configurações do construtor
+        settings = (self.budget_ms, self.incremental)
+        if budget_ms is not None:
+            self.budget_ms = budget_ms
+        self.scan_budget_ms = self.budget_ms
+            
+        start = time.perf_counter()
         try:
             self.scan_documents()
             self.generate_context_maps()
-            self.print_summary()
+        finally:
+            self.budget_ms, self.incremental = settings
+        
+        return ScanResult(
+            workspace=self.workspace,
+            total_documents=self.document_count,
+            documents=self.documents,
+            maps=self.maps,
+            conflicts=self.conflicts,
+            validation_errors=self.validation_errors,
+            reused_documents=self.manifest_hits,
+            duration_s=time.perf_counter() - start,
+            written_maps=list(self.written_maps),
+            stale_documents=list(self.stale_documents),
+            pending_documents=list(self.pending_documents)
+        )
+        
+    def run(self, budget_ms: Optional[int] = None) -> int:
+        """
+        Executa o scanner completo
+        
+        Args:
+            budget_ms: Orçamento de tempo; documentos restantes ficam para a próxima execução
+        
+        Returns:
+            Código de saída (0 para sucesso, 1 para erro)
+        """
+        if self.profiler is not None:
+            self.profiler.start()
             
-            # Retornar código de erro se houver problemas críticos
-            critical_errors = [e for e in self.validation_errors if 'obrigatório' in e]
-            critical_conflicts = [c for c in self.conflicts if c.get('severity') == 'error']
+        try:
+            result = self.scan(budget_ms)
+            with self._phase('summary'):
+                self.print_summary()
+            
+            if self.profiler is not None:
+                self._save_profile()
             
-            if critical_errors or critical_conflicts:
+            # Retornar código de erro se houver problemas críticos
+            if not result.ok:
                 logger.warning("Scanner concluído com problemas críticos")
                 return 1
             else:
@@ -790,24 +1902,94 @@ class ContextScanner:
         except Exception as e:
             logger.error(f"Erro durante escaneamento: {e}")
             return 1
+            
+    def _save_profile(self) -> None:
+        """Finaliza o profiler e grava o relatório em .cn_model/profile/"""
+        self.profiler.stop()
+        report_path = self.profiler.save(self)
+        
+        phases = sorted(self.profiler.phases.items(), key=lambda item: item[1]['wall_s'], reverse=True)
+        print(f"\n⏱️  PERFIL DO SCAN: {report_path}")
+        for name, stats in phases:
+            if stats['calls']:
+                print(f"   {name:12} wall {stats['wall_s'] * 1000:9.1f} ms   cpu {stats['cpu_s'] * 1000:9.1f} ms")
+
+def scan_workspace(workspace: Workspace, incremental: bool = False, jobs: int = 1,
+                   streaming: bool = False, write_maps: bool = True,
+                   canonical: bool = False) -> ScanResult:
+    """
+    API de biblioteca: escaneia um workspace explícito sem encerrar o processo
+    
+    Não detecta workspace, não configura logging global e não cria pastas
+    além de .cn_model/ quando write_maps=True. Para reescanear barato,
+    mantenha uma instância ContextScanner(workspace=...) e chame scan().
+    
+    Args:
+        workspace: Workspace a escanear
+        incremental: Reaproveita documentos inalterados do manifest
+        jobs: Processos para leitura/parse (0 = número de CPUs)
+        streaming: Agrega documento a documento sem manter corpos em memória
+        write_maps: Grava mapas, snapshot, pacote de conteúdo e manifest em .cn_model/
+        canonical: Saída canônica (chaves e listas de documentos ordenadas)
+        
+    Returns:
+        Resultado do escaneamento
+    """
+    scanner = ContextScanner(workspace=workspace, incremental=incremental, jobs=jobs,
+                             streaming=streaming, write_maps=write_maps, canonical=canonical)
+    return scanner.scan()
 
 def main():
     """Função principal"""
     import argparse
     
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     parser = argparse.ArgumentParser(description='Context Navigator Scanner')
     parser.add_argument('--path', '-p', default='.', 
                        help='Caminho base do projeto (padrão: diretório atual)')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Modo verboso')
+    parser.add_argument('--incremental', '-i', action='store_true',
+                       help='Reprocessa apenas documentos alterados (usa .cn_model/scan-manifest.json)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                       help='Processos para leitura/parse dos documentos (0 = número de CPUs)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Pipeline em streaming: não mantém o conteúdo dos documentos em memória')
+    parser.add_argument('--budget-ms', type=int, default=None, metavar='MS',
+                       help='Orçamento de tempo: processa os documentos mais recentes primeiro e '
+                            'continua os restantes na próxima execução')
+    parser.add_argument('--canonical', action='store_true',
+                       help='Mapas canônicos: chaves e listas ordenadas (diffs e hashes estáveis)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Grava tempos por fase e por documento em .cn_model/profile/scan-<timestamp>.json')
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                       help='Documentos mais lentos listados no perfil (padrão: 10)')
+    parser.add_argument('--profile-cprofile', action='store_true',
+                       help='Com --profile, grava também um .pstats (cProfile) do scan')
     
     args = parser.parse_args()
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         
-    scanner = ContextScanner(args.path)
-    return scanner.run()
+    profiler = None
+    if args.profile:
+        profiler = ScanProfiler(top=args.profile_top, cprofile=args.profile_cprofile)
+        
+    try:
+        scanner = ContextScanner(args.path, incremental=args.incremental, jobs=args.jobs,
+                                 streaming=args.stream, profiler=profiler,
+                                 canonical=args.canonical)
+    except WorkspaceNotFoundError:
+        logger.error("❌ Context Navigator workspace não encontrado")
+        logger.error("💡 Execute 'cn init' para configurar este diretório")
+        return 1
+    return scanner.run(budget_ms=args.budget_ms)
 
 if __name__ == '__main__':
     sys.exit(main()) 
\ No newline at end of file
@@ -21,14 +21,19 @@ CN Component Explorer - Explorador de Componentes
 Exibe hierarquia visual de componentes do Context Navigator
 """
 
-import yaml
 import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from ...core.serialization import yaml_load
+except ImportError:
+    # Fallback para execução a partir da instalação (PYTHONPATH = raiz)
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.serialization import yaml_load
+
 logger = logging.getLogger('cn_explorer')
 
 class CNComponentExplorer:
@@ -93,7 +98,7 @@ class CNComponentExplorer:
             if path.exists():
                 try:
                     with open(path, 'r', encoding='utf-8') as f:
-                        self.component_map = yaml.safe_load(f)
+                        self.component_map = yaml_load(f)
                     logger.info(f"Component map carregado: {path}")
                     return
                 except Exception as e:
@@ -256,6 +261,9 @@ class CNComponentExplorer:
 # @cn:process cli-interface
 def main():
     """Função principal para uso via linha de comando"""
+    # Configurar logging
+    logging.basicConfig(level=logging.INFO)
+    
     import argparse
     
     parser = argparse.ArgumentParser(description='Explorador de componentes Context Navigator')
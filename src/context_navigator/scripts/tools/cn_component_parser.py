@@ -23,14 +23,21 @@ Analisa arquivos de código e extrai todas as marcações @cn: para mapeamento d
 
 import re
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import logging
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from ...core.serialization import yaml_dump
+    from ...core.file_walker import IgnoreRules, walk_files
+except ImportError:
+    # Fallback para execução a partir da instalação (PYTHONPATH = raiz)
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.serialization import yaml_dump
+    from core.file_walker import IgnoreRules, walk_files
+
 logger = logging.getLogger('cn_parser')
 
 @dataclass
@@ -245,12 +252,12 @@ class CNComponentParser:
             return components
         
         # @cn:process recursive-search
-        for file_path in directory_path.rglob('*'):
-            if file_path.suffix in extensions and file_path.is_file():
-                header = self.parse_file(str(file_path))
-                if header:
-                    components[str(file_path)] = header
-                    logger.info(f"Componente encontrado: {header.component_name} em {file_path}")
+        for entry in walk_files(directory_path, IgnoreRules.load(directory_path), suffixes=extensions):
+            file_path = entry.path
+            header = self.parse_file(file_path)
+            if header:
+                components[file_path] = header
+                logger.info(f"Componente encontrado: {header.component_name} em {file_path}")
         
         return components
     
@@ -380,6 +387,9 @@ class CNComponentParser:
 # @cn:process cli-interface
 def main():
     """Função principal para uso via linha de comando"""
+    # Configurar logging
+    logging.basicConfig(level=logging.INFO)
+    
     import argparse
     
     parser = argparse.ArgumentParser(description='Parser de marcações @cn:')
@@ -432,19 +442,14 @@ def main():
         else:
             components = {}
     else:
-        # Filtrar .cn_model das buscas
+        # Filtrar .cn_model (e o que o .cnignore excluir) das buscas
         components = {}
-        for root, dirs, files in os.walk(search_path):
-            # Ignorar .cn_model
-            if '.cn_model' in dirs:
-                dirs.remove('.cn_model')
-            
-            for file in files:
-                if file.endswith(('.py', '.js', '.ts', '.md')):
-                    file_path = os.path.join(root, file)
-                    header = cn_parser.parse_file(file_path)
-                    if header:
-                        components[file_path] = header
+        ignore_rules = IgnoreRules.load(current_workspace.root_path, extra=['.cn_model/'])
+        for entry in walk_files(search_path, ignore_rules, suffixes=('.py', '.js', '.ts', '.md')):
+            file_path = entry.path
+            header = cn_parser.parse_file(file_path)
+            if header:
+                components[file_path] = header
     
     if not components:
         print(f"❌ Nenhum componente Context Navigator encontrado em {search_path}")
@@ -468,7 +473,7 @@ def main():
         component_map = cn_parser.generate_component_map(components)
         import datetime
         component_map['generated_at'] = datetime.datetime.now().isoformat()
-        output = yaml.dump(component_map, default_flow_style=False, sort_keys=False)
+        output = yaml_dump(component_map, sort_keys=False, allow_unicode=False)
     elif args.format == 'json':
         component_map = cn_parser.generate_component_map(components)
         import json
@@ -13,11 +13,6 @@ import subprocess
 import sys
 import argparse
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger('context_demo')
 
 class ContextDemo:
@@ -400,6 +395,12 @@ class ContextDemo:
 
 def main():
     """Função principal"""
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     parser = argparse.ArgumentParser(description='Context Navigator - Demonstração Completa')
     parser.add_argument('--path', '-p', default='.', help='Caminho base do projeto')
     parser.add_argument('--phase', choices=['1', '2', '3'], help='Executar fase específica')
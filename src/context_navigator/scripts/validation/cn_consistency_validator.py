@@ -39,8 +39,6 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent / "tools"))
 from cn_component_parser import CNComponentParser, ComponentHeader
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('cn_validator')
 
 class ValidationLevel(Enum):
@@ -456,6 +454,9 @@ class CNConsistencyValidator:
 # @cn:process cli-interface
 def main():
     """Função principal para uso via linha de comando"""
+    # Configurar logging
+    logging.basicConfig(level=logging.INFO)
+    
     import argparse
     
     parser = argparse.ArgumentParser(description='Validador de consistência Context Navigator')
@@ -6,7 +6,6 @@ Avalia o sistema atual contra as métricas de sucesso definidas no PRD.
 """
 
 import json
-import yaml
 import os
 import re
 from datetime import datetime
@@ -15,6 +14,14 @@ from typing import Dict, List, Any, Optional
 import sys
 import argparse
 
+try:
+    from ...core.serialization import YAMLError, yaml_load
+except ImportError:
+    # Fallback para execução a partir da instalação (PYTHONPATH = raiz)
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.serialization import YAMLError, yaml_load
+
 class MetricsValidator:
     def __init__(self, config_path: str = ".contextrc"):
         # NOVO: Usar WorkspaceManager para detectar workspace
@@ -92,8 +99,8 @@ class MetricsValidator:
         
         try:
             with open(map_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        except yaml.YAMLError:
+                return yaml_load(file)
+        except YAMLError:
             # Se houver erro YAML, tenta uma abordagem mais simples
             if filename == "conflicts.yml":
                 return self.parse_conflicts_manually(map_path)
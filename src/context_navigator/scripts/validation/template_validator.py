@@ -17,11 +17,6 @@ from dataclasses import dataclass
 from enum import Enum
 import logging
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger('template_validator')
 
 class ValidationSeverity(Enum):
@@ -937,6 +932,12 @@ class TemplateValidator:
 
 def main():
     """Função principal"""
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     import argparse
     
     parser = argparse.ArgumentParser(description='Context Navigator Template Validator')